@@ -9,33 +9,50 @@ Self-Learning: Adjusts parameters based on win/loss performance
 """
 
 import os
+import sys
 import json
 import time
+import signal
 import sqlite3
-import requests
+import threading
 import numpy as np
-import pandas as pd
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 import ccxt
 import logging
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client, ta
+from shared.metadata_cache import load_markets_cached
+from shared.rate_limiter import get_rate_limiter
+
+from ohlcv_fetcher import OHLCVFetcher, ScanDataContext
+from ticker_snapshot import TickerSnapshot
+from candles import Candles
+from resample import resample, session_offset_ms
+from cascade import StagedScore, cascade_stats
+from indicator_memo import IndicatorMemo
+from db import date_key, get_db
+from state_store import StateStore
+from status_publisher import StatusPublisher
+
 # ====================== CONFIGURATION ======================
 DISCORD_WEBHOOK = ""
 SIGNAL_SERVER_URL = "http://localhost:3001/webhook"
 
-def send_webhook(data: Dict):
-    """Send data to local signal server"""
+def send_webhook(data: Dict) -> bool:
+    """Send data to local signal server (True if it was accepted)"""
     try:
         payload = {
             "source": "bounty_seeker",
             "data": data
         }
-        requests.post(SIGNAL_SERVER_URL, json=payload, timeout=1)
+        response = http_client.post(SIGNAL_SERVER_URL, json=payload, timeout=1)
+        return response.ok
     except Exception:
         # Fail silently if signal server is down
-        pass
+        return False
 
 
 # Exchange: OKX (Best Liquidity & Access)
@@ -46,7 +63,7 @@ EXCHANGE_CONFIG = {
     'secret': os.getenv('OKX_SECRET', ''),
     'password': os.getenv('OKX_PASSPHRASE', ''),
     'options': {'defaultType': 'swap'},  # Use swap (perpetual futures)
-    'enableRateLimit': True,
+    'enableRateLimit': False,  # Paced by shared.rate_limiter
     'sandbox': False
 }
 
@@ -60,6 +77,17 @@ LEARNING_DB = os.path.join(DATA_DIR, "bounty_seeker_learning.db")
 STATE_FILE = os.path.join(DATA_DIR, "bounty_seeker_state.json")
 STATUS_FILE = "/Users/bishop/Desktop/output/workspace-99190f76-187d-40a3-8ab6-30b756622125/public/data/bounty_seeker_status.json"
 
+# Status payload sections the website shows; a change in any other section alone
+# (scan timestamps) doesn't rewrite the status file or notify the signal server
+STATUS_SECTIONS = (
+    'status', 'watchlist_size', 'signal_count', 'open_trades', 'signals', 'last_signals',
+    'watchlist_candidates', 'trending_coins', 'spotlight', 'top_gainers', 'top_losers',
+    'market_analysis',
+)
+
+# Series fetched for every watchlist symbol each scan (timeframe -> candle limit)
+SCAN_TIMEFRAMES = {'15m': 200}
+
 # Trading Parameters
 MIN_CONFIDENCE_SCORE = 40  # Minimum score to trigger signal (0-100) - Lowered to find more scalping opportunities
 TARGET_PROFIT_PCT = 2.5  # Target 2-3% gains
@@ -95,6 +123,10 @@ WATCHLIST_SYMBOLS = []  # Populated dynamically
 WATCHLIST_UPDATE_INTERVAL = 3600  # Update watchlist every hour
 WATCHLIST_SIZE = 3
 
+# Market analysis (BTC/ETH/SOL narratives on the website)
+MARKET_ANALYSIS_TIMEFRAME_SEC = 3600  # Recompute once per closed 1h candle
+MARKET_ANALYSIS_CHECK_SEC = 30  # How often the producer looks for a new 1h close
+
 # Signal routing
 DISCORD_SIGNAL_BIAS = "LONG"  # LONG only for Discord alerts
 SITE_SIGNAL_BIAS = "BOTH"     # BOTH for website status feed
@@ -143,130 +175,115 @@ class TradeResult:
     reasons: List[str]
 
 # ====================== DATABASE SETUP ======================
+# Schema migrations, applied in order past PRAGMA user_version (append only)
+TRADES_MIGRATIONS = [
+    # 1: indexes for open-trade / history lookups and integer exit dates
+    [
+        "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_exit_time ON trades(exit_time)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)",
+        "ALTER TABLE trades ADD COLUMN exit_date INTEGER",
+        "UPDATE trades SET exit_date = CAST(strftime('%Y%m%d', exit_time) AS INTEGER) WHERE exit_time IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS idx_trades_exit_date ON trades(exit_date)",
+    ],
+]
+LEARNING_MIGRATIONS = [
+    # 1: analyze_performance reads the newest outcomes by exit time
+    [
+        "CREATE INDEX IF NOT EXISTS idx_trade_outcomes_exit_time ON trade_outcomes(exit_time)",
+    ],
+]
+
 def init_databases():
     """Initialize SQLite databases"""
     # Trades database
-    conn = sqlite3.connect(TRADES_DB)
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS trades (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            trade_number INTEGER,
-            symbol TEXT NOT NULL,
-            entry_price REAL NOT NULL,
-            stop_loss REAL NOT NULL,
-            take_profit REAL NOT NULL,
-            confidence_score INTEGER NOT NULL,
-            reasons TEXT,
-            entry_time TEXT NOT NULL,
-            exit_time TEXT,
-            exit_price REAL,
-            pnl_pct REAL,
-            exit_reason TEXT,
-            status TEXT DEFAULT 'open'
-        )
-    ''')
-    # Ensure columns exist for upgrades
-    c.execute("PRAGMA table_info(trades)")
-    cols = {row[1] for row in c.fetchall()}
-    if "trade_number" not in cols:
-        c.execute("ALTER TABLE trades ADD COLUMN trade_number INTEGER")
-    if "exit_reason" not in cols:
-        c.execute("ALTER TABLE trades ADD COLUMN exit_reason TEXT")
-    if "direction" not in cols:
-        c.execute("ALTER TABLE trades ADD COLUMN direction TEXT DEFAULT 'LONG'")
-    conn.commit()
-    conn.close()
+    with get_db(TRADES_DB).transaction() as conn:
+        c = conn.cursor()
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trade_number INTEGER,
+                symbol TEXT NOT NULL,
+                entry_price REAL NOT NULL,
+                stop_loss REAL NOT NULL,
+                take_profit REAL NOT NULL,
+                confidence_score INTEGER NOT NULL,
+                reasons TEXT,
+                entry_time TEXT NOT NULL,
+                exit_time TEXT,
+                exit_price REAL,
+                pnl_pct REAL,
+                exit_reason TEXT,
+                status TEXT DEFAULT 'open'
+            )
+        ''')
+        # Ensure columns exist for upgrades
+        c.execute("PRAGMA table_info(trades)")
+        cols = {row[1] for row in c.fetchall()}
+        if "trade_number" not in cols:
+            c.execute("ALTER TABLE trades ADD COLUMN trade_number INTEGER")
+        if "exit_reason" not in cols:
+            c.execute("ALTER TABLE trades ADD COLUMN exit_reason TEXT")
+        if "direction" not in cols:
+            c.execute("ALTER TABLE trades ADD COLUMN direction TEXT DEFAULT 'LONG'")
+    get_db(TRADES_DB).migrate(TRADES_MIGRATIONS)
 
     # Learning database (for self-learning)
-    conn = sqlite3.connect(LEARNING_DB)
-    c = conn.cursor()
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS performance_stats (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            total_trades INTEGER DEFAULT 0,
-            winners INTEGER DEFAULT 0,
-            losers INTEGER DEFAULT 0,
-            avg_confidence_winner REAL,
-            avg_confidence_loser REAL,
-            avg_pnl_winner REAL,
-            avg_pnl_loser REAL
-        )
-    ''')
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS parameter_adjustments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            parameter_name TEXT NOT NULL,
-            old_value REAL,
-            new_value REAL,
-            reason TEXT
-        )
-    ''')
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS strategy_performance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            strategy_component TEXT NOT NULL,
-            win_rate REAL,
-            avg_pnl REAL,
-            total_trades INTEGER,
-            last_updated TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    with get_db(LEARNING_DB).transaction() as conn:
+        c = conn.cursor()
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS performance_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                total_trades INTEGER DEFAULT 0,
+                winners INTEGER DEFAULT 0,
+                losers INTEGER DEFAULT 0,
+                avg_confidence_winner REAL,
+                avg_confidence_loser REAL,
+                avg_pnl_winner REAL,
+                avg_pnl_loser REAL
+            )
+        ''')
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS parameter_adjustments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT NOT NULL,
+                parameter_name TEXT NOT NULL,
+                old_value REAL,
+                new_value REAL,
+                reason TEXT
+            )
+        ''')
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS strategy_performance (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                strategy_component TEXT NOT NULL,
+                win_rate REAL,
+                avg_pnl REAL,
+                total_trades INTEGER,
+                last_updated TEXT
+            )
+        ''')
 
 # ====================== TECHNICAL INDICATORS ======================
-def calculate_rsi(prices: List[float], period: int = 14) -> float:
-    """Calculate RSI indicator"""
-    if len(prices) < period + 1:
-        return 50.0
-    deltas = np.diff(prices[-period-1:])
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-    avg_gain = np.mean(gains)
-    avg_loss = np.mean(losses)
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-def calculate_vwap_and_deviation(ohlcv: List) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+# Indicator math lives in shared.ta; these wrappers keep the bot's signatures.
+def calculate_vwap_and_deviation(candles: Candles) -> Tuple[Optional[float], Optional[float], Optional[float]]:
     """
     Calculate VWAP and standard deviation
     Returns: (vwap, std_dev, current_deviation_sigma)
     """
-    if len(ohlcv) < 50:
+    if len(candles) < 50:
         return None, None, None
 
-    # Calculate VWAP
-    total_pv = 0.0
-    total_volume = 0.0
-    prices = []
-
-    for candle in ohlcv:
-        price = float(candle[4])  # Close
-        vol = float(candle[5])  # Volume
-        total_pv += price * vol
-        total_volume += vol
-        prices.append(price)
-
-    if total_volume == 0:
+    # Close-weighted VWAP, plain std of closes
+    vwap, std_dev = ta.vwap_bands(candles.close, candles.volume, volume_weighted=False)
+    if vwap is None:
         return None, None, None
-
-    vwap = total_pv / total_volume
-    current_price = prices[-1]
-
-    # Calculate standard deviation
-    price_array = np.array(prices)
-    std_dev = np.std(price_array)
-
     if std_dev == 0:
         return vwap, None, None
 
     # Calculate how many sigmas away from VWAP
-    deviation_sigma = (current_price - vwap) / std_dev
+    deviation_sigma = (float(candles.close[-1]) - vwap) / std_dev
 
     return vwap, std_dev, deviation_sigma
 
@@ -275,139 +292,37 @@ def calculate_gps_zone(high: float, low: float, current_price: float) -> Tuple[b
     Check if price is in Golden Pocket zone (0.618 - 0.65 retracement)
     Returns: (is_in_zone, distance_to_zone_pct)
     """
-    range_size = high - low
-    if range_size == 0:
-        return False, 100.0
-
-    gp_low_level = low + (range_size * GPS_LOW)
-    gp_high_level = low + (range_size * GPS_HIGH)
-
-    if gp_low_level <= current_price <= gp_high_level:
-        return True, 0.0
-
-    # Calculate distance to zone
-    if current_price < gp_low_level:
-        distance = abs(current_price - gp_low_level) / current_price * 100
-    else:
-        distance = abs(current_price - gp_high_level) / current_price * 100
-
-    return False, distance
+    return ta.zone_distance(current_price, ta.golden_pocket(high, low, levels=(GPS_LOW, GPS_HIGH)))
 
 def calculate_upper_gps_zone(high: float, low: float, current_price: float) -> Tuple[bool, float]:
     """
     Upper Golden Pocket (for short bias) - from high down to 0.618-0.65
     """
-    range_size = high - low
-    if range_size == 0:
-        return False, 100.0
+    return ta.zone_distance(current_price, ta.golden_pocket(high, low, from_high=True, levels=(GPS_LOW, GPS_HIGH)))
 
-    gp_high_level = high - (range_size * GPS_LOW)
-    gp_low_level = high - (range_size * GPS_HIGH)
-
-    if gp_low_level <= current_price <= gp_high_level:
-        return True, 0.0
-
-    if current_price > gp_high_level:
-        distance = abs(current_price - gp_high_level) / current_price * 100
-    else:
-        distance = abs(current_price - gp_low_level) / current_price * 100
-
-    return False, distance
-
-def detect_sfp_reversal(ohlcv: List) -> bool:
+def detect_sfp_reversal(candles: Candles) -> bool:
     """
     Detect Swing Failure Pattern (SFP) - price sweeps low then reverses
     """
-    if len(ohlcv) < 5:
-        return False
-
-    # Get last 3 candles
-    recent = ohlcv[-3:]
-    lows = [float(c[3]) for c in recent]  # Low prices
-    closes = [float(c[4]) for c in recent]  # Close prices
-
-    # SFP: Lower low followed by higher close (reversal)
-    if lows[0] > lows[1] and closes[1] < closes[2]:
-        # Check for wick (liquidity grab)
-        last_candle = ohlcv[-1]
-        low = float(last_candle[3])
-        close = float(last_candle[4])
-        open_price = float(last_candle[1])
-        high = float(last_candle[2])
-
-        # Lower wick indicates rejection
-        lower_wick = min(open_price, close) - low
-        body = abs(close - open_price)
-        if lower_wick > body * 0.5:  # Significant lower wick
-            return True
+    return ta.sfp_low(candles.open, candles.low, candles.close)
 
-    return False
-
-def detect_sfp_reversal_high(ohlcv: List) -> bool:
+def detect_sfp_reversal_high(candles: Candles) -> bool:
     """
     Detect Swing Failure Pattern (SFP) - price sweeps high then reverses
     """
-    if len(ohlcv) < 5:
-        return False
-
-    recent = ohlcv[-3:]
-    highs = [float(c[2]) for c in recent]
-    closes = [float(c[4]) for c in recent]
-
-    # SFP: Higher high followed by lower close (reversal)
-    if highs[0] < highs[1] and closes[1] > closes[2]:
-        last_candle = ohlcv[-1]
-        low = float(last_candle[3])
-        close = float(last_candle[4])
-        open_price = float(last_candle[1])
-        high = float(last_candle[2])
-
-        upper_wick = high - max(open_price, close)
-        body = abs(close - open_price)
-        if upper_wick > body * 0.5:
-            return True
+    return ta.sfp_high(candles.open, candles.high, candles.close)
 
-    return False
-
-def calculate_volume_spike_metrics(ohlcv: List) -> Tuple[float, float, float, bool, bool, bool]:
+def calculate_volume_spike_metrics(candles: Candles) -> Tuple[float, float, float, bool, bool, bool]:
     """
     Calculate volume spike metrics using VPSR Pro logic
     Returns: (vol_ma, vol_stddev, volume_ratio, is_abnormal, is_extreme, is_reversal_signal)
     """
-    if len(ohlcv) < VOL_MA_LENGTH + 1:
-        return 0.0, 0.0, 1.0, False, False, False
-
-    # Get volumes
-    volumes = [float(c[5]) for c in ohlcv]
-    current_volume = volumes[-1]
-    prev_volume = volumes[-2] if len(volumes) > 1 else current_volume
-
-    # Calculate Volume EMA (using exponential moving average)
-    vol_ema = np.mean(volumes[-VOL_MA_LENGTH:])  # Start with SMA
-    # Then apply EMA smoothing
-    alpha = 2.0 / (VOL_MA_LENGTH + 1.0)
-    for vol in volumes[-VOL_MA_LENGTH:]:
-        vol_ema = alpha * vol + (1 - alpha) * vol_ema
-
-    # Calculate standard deviation
-    vol_stddev = np.std(volumes[-VOL_MA_LENGTH:])
-
-    # Calculate thresholds
-    dynamic_threshold = vol_ema + (vol_stddev * VOL_MULTIPLIER)
-    extreme_threshold = vol_ema + (vol_stddev * VOL_EXTREME_MULTIPLIER)
-
-    # Classifications
-    volume_ratio = current_volume / vol_ema if vol_ema > 0 else 1.0
-    is_abnormal = current_volume > dynamic_threshold
-    is_extreme = current_volume > extreme_threshold
-
-    # Reversal Signal: Previous bar had extreme volume + current bar is bullish (reversal)
-    prev_was_extreme = prev_volume > extreme_threshold if len(volumes) > 1 else False
-    current_candle = ohlcv[-1]
-    current_is_bullish = float(current_candle[4]) > float(current_candle[1])  # Close > Open
+    vol_ema, vol_stddev, volume_ratio, is_abnormal, is_extreme, prev_was_extreme = ta.volume_spike(
+        candles.volume, VOL_MA_LENGTH, VOL_MULTIPLIER, VOL_EXTREME_MULTIPLIER
+    )
 
     # For bottom reversals, we want extreme volume followed by bullish reversal
-    is_reversal_signal = prev_was_extreme and current_is_bullish
+    is_reversal_signal = prev_was_extreme and candles.close[-1] > candles.open[-1]
 
     return vol_ema, vol_stddev, volume_ratio, is_abnormal, is_extreme, is_reversal_signal
 
@@ -416,13 +331,12 @@ class LearningSystem:
     """Self-learning system that adjusts parameters based on performance"""
 
     def __init__(self):
-        self.conn = sqlite3.connect(LEARNING_DB)
+        self.db = get_db(LEARNING_DB)
         self.init_tables()
 
     def init_tables(self):
         """Initialize learning tables if needed"""
-        c = self.conn.cursor()
-        c.execute('''
+        self.db.execute('''
             CREATE TABLE IF NOT EXISTS trade_outcomes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 symbol TEXT,
@@ -439,12 +353,11 @@ class LearningSystem:
                 had_sfp INTEGER
             )
         ''')
-        self.conn.commit()
+        self.db.migrate(LEARNING_MIGRATIONS)
 
     def record_trade_outcome(self, trade: TradeResult, signal: Signal):
         """Record trade outcome for learning"""
-        c = self.conn.cursor()
-        c.execute('''
+        self.db.execute('''
             INSERT INTO trade_outcomes
             (symbol, entry_time, exit_time, entry_price, exit_price, pnl_pct,
              confidence_score, was_winner, reasons, deviation, in_gps, had_sfp)
@@ -463,20 +376,16 @@ class LearningSystem:
             1 if signal.in_gps_zone else 0,
             1 if 'SFP' in ' '.join(signal.reasons) else 0
         ))
-        self.conn.commit()
 
     def analyze_performance(self) -> Dict:
         """Analyze recent performance and suggest adjustments"""
-        c = self.conn.cursor()
-
         # Get last 50 trades
-        c.execute('''
+        results = self.db.query('''
             SELECT was_winner, confidence_score, pnl_pct, deviation, in_gps, had_sfp
             FROM trade_outcomes
             ORDER BY exit_time DESC
             LIMIT 50
         ''')
-        results = c.fetchall()
 
         if len(results) < 10:
             return {}  # Not enough data
@@ -545,7 +454,110 @@ class LearningSystem:
 
     def close(self):
         """Close database connection"""
-        self.conn.close()
+        self.db.close()
+
+# ====================== MARKET ANALYSIS PRODUCER ======================
+class MarketAnalysisProducer:
+    """Background thread that rebuilds the major-coin analysis once per closed 1h candle"""
+
+    def __init__(self, compute: Callable[[], List[Dict]],
+                 timeframe_sec: int = MARKET_ANALYSIS_TIMEFRAME_SEC,
+                 check_sec: int = MARKET_ANALYSIS_CHECK_SEC):
+        self.compute = compute
+        self.timeframe_sec = timeframe_sec
+        self.check_sec = check_sec
+        self._analysis: List[Dict] = []
+        self._last_bar: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def latest(self) -> List[Dict]:
+        """Cached analysis - no I/O"""
+        with self._lock:
+            return self._analysis
+
+    def refresh_if_due(self) -> bool:
+        """Recompute when a new candle has closed since the last successful run"""
+        bar = int(time.time() // self.timeframe_sec)
+        if bar == self._last_bar:
+            return False
+        analysis = self.compute()
+        if not analysis:
+            return False  # Keep the previous narratives and retry on the next check
+        with self._lock:
+            self._analysis = analysis
+        self._last_bar = bar
+        logger.info(f"🧠 Market analysis refreshed ({len(analysis)} majors)")
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.check_sec):
+            try:
+                self.refresh_if_due()
+            except Exception as e:
+                logger.error(f"Market analysis refresh failed: {e}")
+
+    def start(self):
+        """Compute once on the caller's thread, then keep refreshing in the background"""
+        try:
+            self.refresh_if_due()
+        except Exception as e:
+            logger.error(f"Market analysis refresh failed: {e}")
+        self._thread = threading.Thread(target=self._run, name="market-analysis", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+# ====================== OPEN TRADE INDEX ======================
+class OpenTradeIndex:
+    """Write-through in-memory copy of the open rows in the trades table.
+
+    Loaded once at startup, then updated by whoever writes the table, so open
+    trades are read without touching the database.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[int, Dict] = {}
+        self._by_symbol: Dict[str, Dict[int, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, trades: List[Dict]):
+        """Replace the index with trades read from the database"""
+        with self._lock:
+            self._by_id = {}
+            self._by_symbol = {}
+        for trade in sorted(trades, key=lambda t: t["id"]):
+            self.add(trade)
+
+    def add(self, trade: Dict):
+        with self._lock:
+            self._by_id[trade["id"]] = trade
+            self._by_symbol.setdefault(trade["symbol"], {})[trade["id"]] = trade
+
+    def remove(self, trade_id: int) -> Optional[Dict]:
+        with self._lock:
+            trade = self._by_id.pop(trade_id, None)
+            if trade:
+                by_symbol = self._by_symbol.get(trade["symbol"], {})
+                by_symbol.pop(trade_id, None)
+                if not by_symbol:
+                    self._by_symbol.pop(trade["symbol"], None)
+            return trade
+
+    def all(self) -> List[Dict]:
+        """Open trades, oldest first (copies - safe to mutate)"""
+        with self._lock:
+            return [dict(trade) for trade in self._by_id.values()]
+
+    def for_symbol(self, symbol: str) -> List[Dict]:
+        with self._lock:
+            return [dict(trade) for trade in self._by_symbol.get(symbol, {}).values()]
+
+    def __len__(self) -> int:
+        return len(self._by_id)
 
 # ====================== MAIN BOT CLASS ======================
 class BountySeekerBot:
@@ -553,8 +565,14 @@ class BountySeekerBot:
 
     def __init__(self):
         self.exchange = None
+        self.fetcher = None
+        self.tickers = None
+        self.scan_context: Optional[ScanDataContext] = None
+        self.pruned: Dict[str, int] = {}  # Symbols dropped per cascade stage this scan
+        self.memo = IndicatorMemo()  # Indicator results per (symbol, timeframe, candles, params)
         self.learning = LearningSystem()
         self.active_trades = {}  # symbol -> entry_time
+        self.open_trades = OpenTradeIndex()
         self.state = self.load_state()
         self.adjusted_params = {}
         self.watchlist = []
@@ -567,22 +585,22 @@ class BountySeekerBot:
         self.trade_counter = self.state.get("trade_counter", 0)
         self.signal_counter = self.state.get("signal_counter", 0)
         self.last_status_minute = None
+        self.analysis_producer = MarketAnalysisProducer(self.get_market_analysis)
+        self.status_publisher = StatusPublisher(STATUS_FILE, send_webhook, "bounty_seeker_update", STATUS_SECTIONS)
         self.init_exchange()
         self.load_top_50_watchlist()
         self.reset_trades_if_needed()
+        self.open_trades.load(self.load_open_trades())
 
     def reset_trades_if_needed(self):
         """Reset trades and counters (one-time)"""
         if self.state.get("trades_reset_v2"):
             return
         try:
-            conn = sqlite3.connect(TRADES_DB)
-            c = conn.cursor()
-            c.execute("DELETE FROM trades")
-            conn.commit()
-            conn.close()
+            get_db(TRADES_DB).execute("DELETE FROM trades")
             self.trade_counter = 0
             self.active_trades = {}
+            self.open_trades.load([])
             self.state["trade_counter"] = 0
             self.state["trades_reset_v2"] = True
             self.save_state()
@@ -598,33 +616,34 @@ class BountySeekerBot:
         return self.trade_counter
 
     def get_open_trades(self) -> List[Dict]:
+        """Open trades from the in-memory index (no database access)"""
+        return self.open_trades.all()
+
+    def load_open_trades(self) -> List[Dict]:
         """Fetch open trades from database"""
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-        
+        db = get_db(TRADES_DB)
+
         # Check if direction column exists (handle migration edge case if scanned before migration runs)
         # Note: Ideally _create_tables runs first. Assuming it has run.
         try:
-             c.execute("""
+            rows = db.query("""
                 SELECT id, trade_number, symbol, entry_price, stop_loss, take_profit, entry_time, direction
                 FROM trades WHERE status = 'open'
             """)
         except sqlite3.OperationalError:
             # Fallback for old schema if migration hasn't happened yet (should not happen if restart order is correct)
             logger.warning("Direction column missing in get_open_trades, falling back to legacy select")
-            c.execute("""
+            rows = db.query("""
                 SELECT id, trade_number, symbol, entry_price, stop_loss, take_profit, entry_time
                 FROM trades WHERE status = 'open'
             """)
-            
-        rows = c.fetchall()
-        
+
+
         # Determine if we got direction based on row length
         has_direction = False
         if rows and len(rows[0]) == 8:
             has_direction = True
 
-        conn.close()
         trades = []
         for r in rows:
             trade_data = {
@@ -647,30 +666,33 @@ class BountySeekerBot:
     def close_trade(self, trade_id: int, exit_price: float, exit_reason: str, entry_price: float):
         """Close trade with P&L calculation"""
         pnl_pct = ((exit_price - entry_price) / entry_price) * 100 if entry_price else 0.0
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-        c.execute("""
+        exit_time = datetime.now(timezone.utc)
+        get_db(TRADES_DB).execute("""
             UPDATE trades
-            SET exit_time = ?, exit_price = ?, pnl_pct = ?, exit_reason = ?, status = 'closed'
+            SET exit_time = ?, exit_date = ?, exit_price = ?, pnl_pct = ?, exit_reason = ?, status = 'closed'
             WHERE id = ?
         """, (
-            datetime.now(timezone.utc).isoformat(),
+            exit_time.isoformat(),
+            date_key(exit_time),
             exit_price,
             pnl_pct,
             exit_reason,
             trade_id
         ))
-        conn.commit()
-        conn.close()
+        self.open_trades.remove(trade_id)
         logger.info(f"✅ Trade closed: #{trade_id} {exit_reason} @ {exit_price:.4f} ({pnl_pct:.2f}%)")
 
     def check_open_trades(self):
         """Check open trades for TP/SL hit and close them"""
         open_trades = self.get_open_trades()
+        if not open_trades:
+            return
+
+        # One bulk ticker snapshot covers every open trade
+        prices = self.tickers.last_prices({trade["symbol"] for trade in open_trades})
         for trade in open_trades:
             try:
-                ticker = self.exchange.fetch_ticker(trade["symbol"])
-                current_price = float(ticker.get("last", 0) or ticker.get("close", 0) or 0)
+                current_price = prices.get(trade["symbol"], 0.0)
                 if current_price <= 0:
                     continue
                 if current_price <= trade["stop_loss"]:
@@ -686,13 +708,34 @@ class BountySeekerBot:
 
     def count_open_trades(self) -> int:
         """Count open trades"""
-        return len(self.get_open_trades())
+        return len(self.open_trades)
+
+    def begin_scan_context(self) -> ScanDataContext:
+        """Start a scan-scoped data context shared by every consumer in this scan"""
+        self.scan_context = ScanDataContext(self.fetcher)
+        return self.scan_context
+
+    def end_scan_context(self):
+        """Drop the scan's data once all consumers are done"""
+        if self.scan_context:
+            logger.info(
+                f"📦 Scan data: {self.scan_context.fetched} series fetched, {self.scan_context.reused} reused"
+            )
+        memo = self.memo.stats()
+        logger.info(f"🧮 Indicator memo: {memo['hits']} hits, {memo['misses']} misses ({memo['entries']} cached)")
+        self.scan_context = None
+
+    def get_ohlcv(self, symbol: str, timeframe: str, limit: int) -> Optional[Candles]:
+        """OHLCV through the current scan context (fetched at most once per scan)"""
+        if self.scan_context:
+            return self.scan_context.get(symbol, timeframe, limit)
+        return self.fetcher.fetch(symbol, timeframe, limit)
 
     def init_exchange(self):
         """Initialize OKX exchange (perpetual futures)"""
         try:
             self.exchange = ccxt.okx(EXCHANGE_CONFIG)
-            self.exchange.load_markets()
+            load_markets_cached(self.exchange)
             logger.info("✅ OKX Futures connected")
         except Exception as e:
             logger.error(f"❌ Exchange init failed: {e}")
@@ -701,13 +744,15 @@ class BountySeekerBot:
                 logger.info("🔄 Trying Binance as fallback...")
                 self.exchange = ccxt.binance({
                     'options': {'defaultType': 'future'},
-                    'enableRateLimit': True
+                    'enableRateLimit': False  # Paced by shared.rate_limiter
                 })
-                self.exchange.load_markets()
+                load_markets_cached(self.exchange)
                 logger.info("✅ Binance Futures connected (fallback)")
             except Exception as e2:
                 logger.error(f"❌ Both exchanges failed. Binance error: {e2}")
                 raise
+        self.fetcher = OHLCVFetcher(self.exchange)
+        self.tickers = TickerSnapshot(self.exchange)
 
     def get_tradingview_link(self, symbol: str) -> str:
         """Generate TradingView link for symbol - Format: BTC/USDT (no exchange name)"""
@@ -759,7 +804,7 @@ class BountySeekerBot:
 
             # Fetch tickers to get volumes
             try:
-                tickers = self.exchange.fetch_tickers()
+                tickers = self.tickers.all()
             except Exception as e:
                 logger.error(f"Failed to fetch tickers: {e}")
                 # Fallback to first 10 pairs
@@ -881,23 +926,20 @@ class BountySeekerBot:
         elapsed = (datetime.now(timezone.utc) - self.watchlist_last_update).total_seconds()
         return elapsed >= WATCHLIST_UPDATE_INTERVAL
 
-    def load_state(self) -> Dict:
+    def load_state(self) -> StateStore:
         """Load bot state from file"""
+        data = {}
         if os.path.exists(STATE_FILE):
             try:
                 with open(STATE_FILE, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
             except:
                 pass
-        return {}
+        return StateStore(STATE_FILE, data)
 
     def save_state(self):
-        """Save bot state to file"""
-        try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save state: {e}")
+        """Schedule a state write (the store coalesces changes and writes atomically)"""
+        self.state.touch()
 
     def increment_signal_counter(self, count: int):
         """Increment and persist total signals count"""
@@ -922,26 +964,26 @@ class BountySeekerBot:
         
         for symbol in majors:
             try:
-                # Fetch recent candles for 1h timeframe
-                ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe='1h', limit=50)
+                # Fetch recent candles for 1h timeframe. Runs on the producer thread, so it goes
+                # straight to the fetcher: the scan context is main-thread only and unlocked
+                ohlcv = self.fetcher.fetch(symbol, '1h', 50)
                 if not ohlcv or len(ohlcv) < 20:
                     continue
                 
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                current_price = df['close'].iloc[-1]
-                open_24h = df['open'].iloc[0] # Approx if limit matches, but better to use ticker or logic
+                current_price = float(ohlcv.close[-1])
                 
                 # Fetch ticker for accurate 24h change
-                ticker = self.exchange.fetch_ticker(symbol)
+                ticker = self.tickers.get(symbol)
                 change_pct = ticker.get('percentage', 0)
                 current_price = ticker.get('last', current_price) # Use ticker price as most recent
 
                 # Technicals
-                closes = df['close'].to_numpy()
-                volumes = df['volume'].to_numpy()
-                rsi = calculate_rsi(closes)
-                sma_20 = np.mean(closes[-20:])
-                vol_sma = np.mean(volumes[-20:])
+                closes = ohlcv.close
+                volumes = ohlcv.volume
+                rsi, sma_20, vol_sma = self.memo.get(
+                    "market_technicals", symbol, '1h', ohlcv, None,
+                    lambda: (ta.rsi(closes), np.mean(closes[-20:]), np.mean(volumes[-20:]))
+                )
                 current_vol = volumes[-1]
                 
                 trend = "BULLISH" if current_price > sma_20 else "BEARISH"
@@ -1032,7 +1074,7 @@ class BountySeekerBot:
                 "spotlight": self.standout_coin,
                 "top_gainers": self.top_gainers,
                 "top_losers": self.state.get("top_losers", []),
-                "market_analysis": self.get_market_analysis()
+                "market_analysis": self.analysis_producer.latest()
             }
 
             if signals:
@@ -1041,15 +1083,9 @@ class BountySeekerBot:
                 self.state["last_signals"] = payload["signals"]
                 self.save_state()
 
-            with open(STATUS_FILE, 'w') as f:
-                json.dump(payload, f, indent=2)
-            
-            # Send webhook to signal server
-            send_webhook({
-                "type": "bounty_seeker_update",
-                "payload": payload
-            })
-            
+            # Rewrites the file and sends the signal server only the sections that changed
+            self.status_publisher.publish(payload)
+
         except Exception as e:
             logger.error(f"Failed to write status file: {e}")
 
@@ -1060,228 +1096,249 @@ class BountySeekerBot:
         now = datetime.now(timezone.utc)
         return now.minute == 45 and now.second < 5
 
-    def analyze_symbol(self, symbol: str, bias: str = "both") -> Optional[Signal]:
-        """Analyze a symbol for reversal signals (long + short)"""
-        try:
-            timeframe = '15m'
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=200)
-
-            if len(ohlcv) < 50:
-                return None
-
-            current_candle = ohlcv[-1]
-            current_open = float(current_candle[1])
-            current_price = float(current_candle[4])
+    def daily_levels(self, symbol: str, ohlcv: Candles) -> Tuple[float, float, bool, float, bool, float]:
+        """Today's session high / low from the 15m series and both Golden Pocket zones (memoized).
 
-            daily_ohlcv = self.exchange.fetch_ohlcv(symbol, '1d', limit=1)
+        Returns: (daily_high, daily_low, in_gps_long, gps_dist_long, in_gps_short, gps_dist_short)
+        """
+        def compute():
+            # Today's session bar, resampled from the 15m series (200 bars span > 2 days)
+            daily_ohlcv = resample(ohlcv, '1d', session_offset_ms(self.exchange)).tail(1)
             if daily_ohlcv:
-                daily_high = float(daily_ohlcv[-1][2])
-                daily_low = float(daily_ohlcv[-1][3])
+                daily_high = float(daily_ohlcv.high[-1])
+                daily_low = float(daily_ohlcv.low[-1])
             else:
-                daily_high = max([float(c[2]) for c in ohlcv[-96:]])
-                daily_low = min([float(c[3]) for c in ohlcv[-96:]])
+                daily_high = float(ohlcv.high[-96:].max())
+                daily_low = float(ohlcv.low[-96:].min())
+            current_price = float(ohlcv.close[-1])
+            return (daily_high, daily_low,
+                    *calculate_gps_zone(daily_high, daily_low, current_price),
+                    *calculate_upper_gps_zone(daily_high, daily_low, current_price))
 
-            closes = [float(c[4]) for c in ohlcv]
-            rsi = calculate_rsi(closes, RSI_PERIOD)
-            vwap, std_dev, deviation_sigma = calculate_vwap_and_deviation(ohlcv)
+        return self.memo.get("daily_levels", symbol, '15m', ohlcv, {"gps": (GPS_LOW, GPS_HIGH)}, compute)
 
-            in_gps_long, gps_dist_long = calculate_gps_zone(daily_high, daily_low, current_price)
-            in_gps_short, gps_dist_short = calculate_upper_gps_zone(daily_high, daily_low, current_price)
-            has_sfp_long = detect_sfp_reversal(ohlcv)
-            has_sfp_short = detect_sfp_reversal_high(ohlcv)
+    def analyze_symbol(self, symbol: str, bias: str = "both",
+                       ohlcv: Optional[Candles] = None) -> Optional[Signal]:
+        """Analyze a symbol for reversal signals (long + short)
 
-            if vwap is None or std_dev is None or deviation_sigma is None:
+        ohlcv may be prefetched by scan_markets; it is fetched here otherwise.
+        """
+        try:
+            timeframe = '15m'
+            if ohlcv is None:
+                ohlcv = self.fetcher.fetch(symbol, timeframe, 200)
+
+            if not ohlcv or len(ohlcv) < 50:
                 return None
 
-            vol_ma, vol_stddev, volume_ratio, is_abnormal_vol, is_extreme_vol, is_vol_reversal = calculate_volume_spike_metrics(ohlcv)
+            current_open = float(ohlcv.open[-1])
+            current_price = float(ohlcv.close[-1])
+
             is_bullish = current_price > current_open
             is_bearish = current_price < current_open
-            vol_reversal_short = is_extreme_vol and is_bearish
 
             # Apply adjusted minimum confidence (but don't go below 35 for scalping)
             min_confidence = max(35, self.adjusted_params.get('min_confidence', MIN_CONFIDENCE_SCORE))
+            gps_weight = self.adjusted_params.get('gps_weight', 1.0)
+            sfp_weight = self.adjusted_params.get('sfp_weight', 1.0)
+
+            # Scored as a cascade, cheapest features first: once neither side can reach
+            # min_confidence even with every remaining component maxed, stop early.
+            caps = {
+                "deviation": 40,
+                "gps": max(int(30 * gps_weight), 20),
+                "rsi": 20,
+                "sfp": max(int(15 * sfp_weight), 0),
+                "volume": 25,
+                "range": 15,
+            }
+            long_side = StagedScore(min_confidence, caps)
+            short_side = StagedScore(min_confidence, caps)
+            sides = {"long": [long_side], "short": [short_side]}.get(bias.lower(), [long_side, short_side])
+
+            def pruned(stage: str) -> bool:
+                if any(side.reachable() for side in sides):
+                    return False
+                self.pruned[stage] = self.pruned.get(stage, 0) + 1
+                return True
 
-            def build_signal(direction: str, score: int, reasons: List[str], in_gps_zone: bool) -> Signal:
-                if direction == "LONG":
-                    stop_loss = current_price * (1 - STOP_LOSS_PCT / 100)
-                    take_profit = current_price * (1 + TARGET_PROFIT_PCT / 100)
-                else:
-                    stop_loss = current_price * (1 + STOP_LOSS_PCT / 100)
-                    take_profit = current_price * (1 - TARGET_PROFIT_PCT / 100)
-
-                tv_link = self.get_tradingview_link(symbol)
-                return Signal(
-                    symbol=symbol,
-                    direction=direction,
-                    entry_price=current_price,
-                    stop_loss=stop_loss,
-                    take_profit=take_profit,
-                    confidence_score=score,
-                    reasons=reasons,
-                    rsi=rsi,
-                    deviation=deviation_sigma,
-                    in_gps_zone=in_gps_zone,
-                    timestamp=datetime.now(timezone.utc),
-                    tradingview_link=tv_link
-                )
-
-            # Long scoring
-            long_score = 0
-            long_reasons = []
+            # Stage 1 - deviation + RSI from the 15m closes
+            rsi, (vwap, std_dev, deviation_sigma) = self.memo.get(
+                "rsi_vwap", symbol, timeframe, ohlcv, {"rsi": RSI_PERIOD},
+                lambda: (ta.rsi(ohlcv.close, RSI_PERIOD), calculate_vwap_and_deviation(ohlcv))
+            )
+            if vwap is None or std_dev is None or deviation_sigma is None:
+                return None
 
             if deviation_sigma <= -DEVIATION_3SIGMA:
-                long_score += 40
-                long_reasons.append("Deviation Zone -2.5 Sigma (Mean Reversion)")
+                long_side.add("deviation", 40, "Deviation Zone -2.5 Sigma (Mean Reversion)")
             elif deviation_sigma <= -DEVIATION_2SIGMA:
-                long_score += 30
-                long_reasons.append("Deviation Zone -2.0 Sigma")
+                long_side.add("deviation", 30, "Deviation Zone -2.0 Sigma")
             elif deviation_sigma <= -1.5:
-                long_score += 20
-                long_reasons.append("Deviation Zone -1.5 Sigma (Oversold)")
+                long_side.add("deviation", 20, "Deviation Zone -1.5 Sigma (Oversold)")
             elif deviation_sigma <= -1.0:
-                long_score += 15
-                long_reasons.append("Deviation Zone -1.0 Sigma (Slightly Oversold)")
+                long_side.add("deviation", 15, "Deviation Zone -1.0 Sigma (Slightly Oversold)")
+            else:
+                long_side.add("deviation")
 
-            if in_gps_long:
-                gps_weight = self.adjusted_params.get('gps_weight', 1.0)
-                long_score += int(30 * gps_weight)
-                long_reasons.append("Price in Daily Golden Pocket (0.618-0.65)")
-            elif gps_dist_long < 1.0:
-                long_score += 20
-                long_reasons.append(f"Near GPS Zone ({gps_dist_long:.2f}% away)")
-            elif gps_dist_long < 2.0:
-                long_score += 15
-                long_reasons.append(f"Approaching GPS Zone ({gps_dist_long:.2f}% away)")
-            elif gps_dist_long < 3.0:
-                long_score += 10
-                long_reasons.append(f"Getting Close to GPS Zone ({gps_dist_long:.2f}% away)")
+            if deviation_sigma >= DEVIATION_3SIGMA:
+                short_side.add("deviation", 40, "Deviation Zone +2.5 Sigma (Mean Reversion)")
+            elif deviation_sigma >= DEVIATION_2SIGMA:
+                short_side.add("deviation", 30, "Deviation Zone +2.0 Sigma")
+            elif deviation_sigma >= 1.5:
+                short_side.add("deviation", 20, "Deviation Zone +1.5 Sigma (Overbought)")
+            elif deviation_sigma >= 1.0:
+                short_side.add("deviation", 15, "Deviation Zone +1.0 Sigma (Slightly Overbought)")
+            else:
+                short_side.add("deviation")
 
             if rsi < 40 and rsi > 20:
-                long_score += 20
-                long_reasons.append(f"RSI Oversold ({rsi:.1f})")
+                long_side.add("rsi", 20, f"RSI Oversold ({rsi:.1f})")
             elif rsi < 30:
-                long_score += 15
-                long_reasons.append(f"RSI Extreme Oversold ({rsi:.1f})")
+                long_side.add("rsi", 15, f"RSI Extreme Oversold ({rsi:.1f})")
             elif rsi < 50:
-                long_score += 12
-                long_reasons.append(f"RSI Below Midline ({rsi:.1f})")
+                long_side.add("rsi", 12, f"RSI Below Midline ({rsi:.1f})")
             elif rsi < 55:
-                long_score += 8
-                long_reasons.append(f"RSI Slightly Below Midline ({rsi:.1f})")
+                long_side.add("rsi", 8, f"RSI Slightly Below Midline ({rsi:.1f})")
+            else:
+                long_side.add("rsi")
 
+            if rsi > 60 and rsi < 80:
+                short_side.add("rsi", 20, f"RSI Overbought ({rsi:.1f})")
+            elif rsi > 70:
+                short_side.add("rsi", 15, f"RSI Extreme Overbought ({rsi:.1f})")
+            elif rsi > 50:
+                short_side.add("rsi", 12, f"RSI Above Midline ({rsi:.1f})")
+            elif rsi > 45:
+                short_side.add("rsi", 8, f"RSI Slightly Above Midline ({rsi:.1f})")
+            else:
+                short_side.add("rsi")
+
+            if pruned("deviation/rsi"):
+                return None
+
+            # Stage 2 - SFP + volume spikes from the 15m candles
+            has_sfp_long, has_sfp_short, volume_metrics = self.memo.get(
+                "sfp_volume", symbol, timeframe, ohlcv,
+                {"vol": (VOL_MA_LENGTH, VOL_MULTIPLIER, VOL_EXTREME_MULTIPLIER)},
+                lambda: (detect_sfp_reversal(ohlcv), detect_sfp_reversal_high(ohlcv), calculate_volume_spike_metrics(ohlcv))
+            )
             if has_sfp_long:
-                sfp_weight = self.adjusted_params.get('sfp_weight', 1.0)
-                long_score += int(15 * sfp_weight)
-                long_reasons.append("SFP Reversal Detected (Sweeping Lows)")
+                long_side.add("sfp", int(15 * sfp_weight), "SFP Reversal Detected (Sweeping Lows)")
+            else:
+                long_side.add("sfp")
+            if has_sfp_short:
+                short_side.add("sfp", int(15 * sfp_weight), "SFP Reversal Detected (Sweeping Highs)")
+            else:
+                short_side.add("sfp")
+
+            vol_ma, vol_stddev, volume_ratio, is_abnormal_vol, is_extreme_vol, is_vol_reversal = volume_metrics
+            vol_reversal_short = is_extreme_vol and is_bearish
 
             if is_vol_reversal and is_bullish:
-                long_score += 25
-                long_reasons.append("Volume Reversal (Extreme Vol + Bullish Reversal)")
+                long_side.add("volume", 25, "Volume Reversal (Extreme Vol + Bullish Reversal)")
             elif is_extreme_vol:
-                long_score += 20
-                long_reasons.append(f"Extreme Volume Spike ({volume_ratio:.1f}x)")
+                long_side.add("volume", 20, f"Extreme Volume Spike ({volume_ratio:.1f}x)")
             elif is_abnormal_vol:
-                long_score += 15
-                long_reasons.append(f"Abnormal Volume Spike ({volume_ratio:.1f}x)")
+                long_side.add("volume", 15, f"Abnormal Volume Spike ({volume_ratio:.1f}x)")
             elif volume_ratio > 1.5:
-                long_score += 10
-                long_reasons.append(f"Volume Spike ({volume_ratio:.1f}x avg)")
+                long_side.add("volume", 10, f"Volume Spike ({volume_ratio:.1f}x avg)")
             elif volume_ratio > 1.2:
-                long_score += 8
-                long_reasons.append(f"Volume Above Average ({volume_ratio:.1f}x)")
+                long_side.add("volume", 8, f"Volume Above Average ({volume_ratio:.1f}x)")
             elif volume_ratio > 1.0:
-                long_score += 5
-                long_reasons.append(f"Volume Slightly Above Average ({volume_ratio:.1f}x)")
+                long_side.add("volume", 5, f"Volume Slightly Above Average ({volume_ratio:.1f}x)")
+            else:
+                long_side.add("volume")
 
-            price_from_low = ((current_price - daily_low) / (daily_high - daily_low)) * 100 if (daily_high - daily_low) > 0 else 50
-            if price_from_low < 20:
-                long_score += 15
-                long_reasons.append(f"Price Near Daily Low ({price_from_low:.1f}% from low)")
-            elif price_from_low < 35:
-                long_score += 12
-                long_reasons.append(f"Price in Lower Range ({price_from_low:.1f}% from low)")
-            elif price_from_low < 45:
-                long_score += 8
-                long_reasons.append(f"Price in Lower Half ({price_from_low:.1f}% from low)")
+            if vol_reversal_short:
+                short_side.add("volume", 25, "Volume Reversal (Extreme Vol + Bearish Reversal)")
+            elif is_extreme_vol:
+                short_side.add("volume", 20, f"Extreme Volume Spike ({volume_ratio:.1f}x)")
+            elif is_abnormal_vol:
+                short_side.add("volume", 15, f"Abnormal Volume Spike ({volume_ratio:.1f}x)")
+            elif volume_ratio > 1.5:
+                short_side.add("volume", 10, f"Volume Spike ({volume_ratio:.1f}x avg)")
+            elif volume_ratio > 1.2:
+                short_side.add("volume", 8, f"Volume Above Average ({volume_ratio:.1f}x)")
+            elif volume_ratio > 1.0:
+                short_side.add("volume", 5, f"Volume Slightly Above Average ({volume_ratio:.1f}x)")
+            else:
+                short_side.add("volume")
 
-            # Short scoring
-            short_score = 0
-            short_reasons = []
+            if pruned("sfp/volume"):
+                return None
 
-            if deviation_sigma >= DEVIATION_3SIGMA:
-                short_score += 40
-                short_reasons.append("Deviation Zone +2.5 Sigma (Mean Reversion)")
-            elif deviation_sigma >= DEVIATION_2SIGMA:
-                short_score += 30
-                short_reasons.append("Deviation Zone +2.0 Sigma")
-            elif deviation_sigma >= 1.5:
-                short_score += 20
-                short_reasons.append("Deviation Zone +1.5 Sigma (Overbought)")
-            elif deviation_sigma >= 1.0:
-                short_score += 15
-                short_reasons.append("Deviation Zone +1.0 Sigma (Slightly Overbought)")
+            # Stage 3 - daily range: GPS zones + position in the day's range
+            daily_high, daily_low, in_gps_long, gps_dist_long, in_gps_short, gps_dist_short = self.daily_levels(symbol, ohlcv)
+
+            if in_gps_long:
+                long_side.add("gps", int(30 * gps_weight), "Price in Daily Golden Pocket (0.618-0.65)")
+            elif gps_dist_long < 1.0:
+                long_side.add("gps", 20, f"Near GPS Zone ({gps_dist_long:.2f}% away)")
+            elif gps_dist_long < 2.0:
+                long_side.add("gps", 15, f"Approaching GPS Zone ({gps_dist_long:.2f}% away)")
+            elif gps_dist_long < 3.0:
+                long_side.add("gps", 10, f"Getting Close to GPS Zone ({gps_dist_long:.2f}% away)")
+            else:
+                long_side.add("gps")
 
             if in_gps_short:
-                gps_weight = self.adjusted_params.get('gps_weight', 1.0)
-                short_score += int(30 * gps_weight)
-                short_reasons.append("Price in Upper Golden Pocket (0.618-0.65)")
+                short_side.add("gps", int(30 * gps_weight), "Price in Upper Golden Pocket (0.618-0.65)")
             elif gps_dist_short < 1.0:
-                short_score += 20
-                short_reasons.append(f"Near Upper GPS Zone ({gps_dist_short:.2f}% away)")
+                short_side.add("gps", 20, f"Near Upper GPS Zone ({gps_dist_short:.2f}% away)")
             elif gps_dist_short < 2.0:
-                short_score += 15
-                short_reasons.append(f"Approaching Upper GPS Zone ({gps_dist_short:.2f}% away)")
+                short_side.add("gps", 15, f"Approaching Upper GPS Zone ({gps_dist_short:.2f}% away)")
             elif gps_dist_short < 3.0:
-                short_score += 10
-                short_reasons.append(f"Getting Close to Upper GPS Zone ({gps_dist_short:.2f}% away)")
-
-            if rsi > 60 and rsi < 80:
-                short_score += 20
-                short_reasons.append(f"RSI Overbought ({rsi:.1f})")
-            elif rsi > 70:
-                short_score += 15
-                short_reasons.append(f"RSI Extreme Overbought ({rsi:.1f})")
-            elif rsi > 50:
-                short_score += 12
-                short_reasons.append(f"RSI Above Midline ({rsi:.1f})")
-            elif rsi > 45:
-                short_score += 8
-                short_reasons.append(f"RSI Slightly Above Midline ({rsi:.1f})")
-
-            if has_sfp_short:
-                sfp_weight = self.adjusted_params.get('sfp_weight', 1.0)
-                short_score += int(15 * sfp_weight)
-                short_reasons.append("SFP Reversal Detected (Sweeping Highs)")
+                short_side.add("gps", 10, f"Getting Close to Upper GPS Zone ({gps_dist_short:.2f}% away)")
+            else:
+                short_side.add("gps")
 
-            if vol_reversal_short:
-                short_score += 25
-                short_reasons.append("Volume Reversal (Extreme Vol + Bearish Reversal)")
-            elif is_extreme_vol:
-                short_score += 20
-                short_reasons.append(f"Extreme Volume Spike ({volume_ratio:.1f}x)")
-            elif is_abnormal_vol:
-                short_score += 15
-                short_reasons.append(f"Abnormal Volume Spike ({volume_ratio:.1f}x)")
-            elif volume_ratio > 1.5:
-                short_score += 10
-                short_reasons.append(f"Volume Spike ({volume_ratio:.1f}x avg)")
-            elif volume_ratio > 1.2:
-                short_score += 8
-                short_reasons.append(f"Volume Above Average ({volume_ratio:.1f}x)")
-            elif volume_ratio > 1.0:
-                short_score += 5
-                short_reasons.append(f"Volume Slightly Above Average ({volume_ratio:.1f}x)")
+            price_from_low = ((current_price - daily_low) / (daily_high - daily_low)) * 100 if (daily_high - daily_low) > 0 else 50
+            if price_from_low < 20:
+                long_side.add("range", 15, f"Price Near Daily Low ({price_from_low:.1f}% from low)")
+            elif price_from_low < 35:
+                long_side.add("range", 12, f"Price in Lower Range ({price_from_low:.1f}% from low)")
+            elif price_from_low < 45:
+                long_side.add("range", 8, f"Price in Lower Half ({price_from_low:.1f}% from low)")
+            else:
+                long_side.add("range")
 
             price_from_high = ((daily_high - current_price) / (daily_high - daily_low)) * 100 if (daily_high - daily_low) > 0 else 50
             if price_from_high < 20:
-                short_score += 15
-                short_reasons.append(f"Price Near Daily High ({price_from_high:.1f}% from high)")
+                short_side.add("range", 15, f"Price Near Daily High ({price_from_high:.1f}% from high)")
             elif price_from_high < 35:
-                short_score += 12
-                short_reasons.append(f"Price in Upper Range ({price_from_high:.1f}% from high)")
+                short_side.add("range", 12, f"Price in Upper Range ({price_from_high:.1f}% from high)")
             elif price_from_high < 45:
-                short_score += 8
-                short_reasons.append(f"Price in Upper Half ({price_from_high:.1f}% from high)")
+                short_side.add("range", 8, f"Price in Upper Half ({price_from_high:.1f}% from high)")
+            else:
+                short_side.add("range")
+
+            def build_signal(direction: str, score: int, reasons: List[str], in_gps_zone: bool) -> Signal:
+                if direction == "LONG":
+                    stop_loss = current_price * (1 - STOP_LOSS_PCT / 100)
+                    take_profit = current_price * (1 + TARGET_PROFIT_PCT / 100)
+                else:
+                    stop_loss = current_price * (1 + STOP_LOSS_PCT / 100)
+                    take_profit = current_price * (1 - TARGET_PROFIT_PCT / 100)
+
+                tv_link = self.get_tradingview_link(symbol)
+                return Signal(
+                    symbol=symbol,
+                    direction=direction,
+                    entry_price=current_price,
+                    stop_loss=stop_loss,
+                    take_profit=take_profit,
+                    confidence_score=score,
+                    reasons=reasons,
+                    rsi=rsi,
+                    deviation=deviation_sigma,
+                    in_gps_zone=in_gps_zone,
+                    timestamp=datetime.now(timezone.utc),
+                    tradingview_link=tv_link
+                )
+
+            long_score, long_reasons = long_side.score, long_side.reasons
+            short_score, short_reasons = short_side.score, short_side.reasons
 
             long_ok = long_score >= min_confidence
             short_ok = short_score >= min_confidence
@@ -1313,29 +1370,21 @@ class BountySeekerBot:
     def compute_watchlist_candidates(self) -> List[dict]:
         """Build watchlist candidates near GPS/support/resistance zones"""
         candidates = []
+        # Reuse the series scan_markets already pulled; only missing ones are fetched
+        context = self.scan_context or self.begin_scan_context()
+        context.prefetch(self.watchlist, SCAN_TIMEFRAMES)
         for symbol in self.watchlist:
             try:
-                ohlcv = self.exchange.fetch_ohlcv(symbol, '15m', limit=96)
-                if len(ohlcv) < 20:
+                # Same series analyze_symbol scored, so its daily levels come from the memo
+                ohlcv = context.get(symbol, '15m', SCAN_TIMEFRAMES['15m'])
+                if not ohlcv or len(ohlcv) < 20:
                     continue
-                current = ohlcv[-1]
-                current_price = float(current[4])
-
-                daily_ohlcv = self.exchange.fetch_ohlcv(symbol, '1d', limit=1)
-                if daily_ohlcv:
-                    daily_high = float(daily_ohlcv[-1][2])
-                    daily_low = float(daily_ohlcv[-1][3])
-                else:
-                    daily_high = max([float(c[2]) for c in ohlcv])
-                    daily_low = min([float(c[3]) for c in ohlcv])
+                current_price = float(ohlcv.close[-1])
 
-                in_gps_long, gps_dist_long = calculate_gps_zone(daily_high, daily_low, current_price)
-                in_gps_short, gps_dist_short = calculate_upper_gps_zone(daily_high, daily_low, current_price)
+                daily_high, daily_low, in_gps_long, gps_dist_long, in_gps_short, gps_dist_short = self.daily_levels(symbol, ohlcv)
 
-                lows = [float(c[3]) for c in ohlcv[-50:]]
-                highs = [float(c[2]) for c in ohlcv[-50:]]
-                support = min(lows)
-                resistance = max(highs)
+                support = float(ohlcv.low[-50:].min())
+                resistance = float(ohlcv.high[-50:].max())
                 support_dist = abs(current_price - support) / current_price * 100
                 resistance_dist = abs(resistance - current_price) / current_price * 100
 
@@ -1439,7 +1488,7 @@ class BountySeekerBot:
             }
 
             payload = {"embeds": [embed, watchlist_embed]}
-            response = requests.post(DISCORD_WEBHOOK, json=payload, timeout=15)
+            response = http_client.post(DISCORD_WEBHOOK, json=payload, timeout=15)
 
             if response.status_code in (200, 201, 204):
                 symbols_str = ", ".join([s.symbol for s in picks])
@@ -1516,7 +1565,7 @@ class BountySeekerBot:
 
             # Send immediately
             payload = {"embeds": [embed]}
-            response = requests.post(DISCORD_WEBHOOK, json=payload, timeout=10)
+            response = http_client.post(DISCORD_WEBHOOK, json=payload, timeout=10)
 
             if response.status_code in (200, 201, 204):
                 logger.info(f"✅ Discord alert sent for {signal.symbol} (Score: {signal.confidence_score})")
@@ -1541,7 +1590,7 @@ class BountySeekerBot:
             
             # 1. Set leverage
             try:
-                self.exchange.set_leverage(LEVERAGE, signal.symbol)
+                get_rate_limiter().ccxt_call(self.exchange, "trade", self.exchange.set_leverage, LEVERAGE, signal.symbol)
             except Exception as e:
                 logger.warning(f"Could not set leverage: {e}")
 
@@ -1556,7 +1605,8 @@ class BountySeekerBot:
             
             # 3. Create Market Order
             side = signal.direction.lower()
-            order = self.exchange.create_order(
+            order = get_rate_limiter().ccxt_call(
+                self.exchange, "trade", self.exchange.create_order,
                 symbol=signal.symbol,
                 type='market',
                 side=side,
@@ -1581,9 +1631,7 @@ class BountySeekerBot:
             real_order = self.place_real_order(signal)
             real_order_id = real_order['id'] if real_order else None
 
-            conn = sqlite3.connect(TRADES_DB)
-            c = conn.cursor()
-            c.execute('''
+            trade_id = get_db(TRADES_DB).execute('''
                 INSERT INTO trades
                 (trade_number, symbol, entry_price, stop_loss, take_profit, confidence_score, reasons, entry_time, status, direction)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -1598,10 +1646,18 @@ class BountySeekerBot:
                 signal.timestamp.isoformat(),
                 'open',
                 signal.direction
-            ))
-            conn.commit()
-            conn.close()
-            
+            )).lastrowid
+            self.open_trades.add({
+                "id": trade_id,
+                "trade_number": signal.trade_number,
+                "symbol": signal.symbol,
+                "entry_price": signal.entry_price,
+                "stop_loss": signal.stop_loss,
+                "take_profit": signal.take_profit,
+                "entry_time": signal.timestamp.isoformat(),
+                "direction": signal.direction
+            })
+
             msg = f"✅ Trade executed: #{signal.trade_number} {signal.symbol} @ {signal.entry_price:.4f}"
             if real_order_id:
                 msg += f" (Exchange ID: {real_order_id})"
@@ -1632,22 +1688,33 @@ class BountySeekerBot:
             logger.info(f"⛔ Max open trades reached ({open_trades}/3). Waiting for TP/SL.")
             return []
 
-        signals_found = []
+        # Skip symbols still in cooldown
+        symbols = []
         for symbol in self.watchlist:
-            # Check cooldown
             if symbol in self.active_trades:
                 elapsed = (datetime.now(timezone.utc) - self.active_trades[symbol]).total_seconds()
                 if elapsed < ACTIVE_TRADES_COOLDOWN:
                     continue
+            symbols.append(symbol)
+
+        # Fetch 15m candles for the whole watchlist concurrently (rate paced by the fetcher); 1d is resampled from them
+        context = self.scan_context or self.begin_scan_context()
+        context.prefetch(symbols, SCAN_TIMEFRAMES)
+
+        signals_found = []
+        self.pruned = {}
+        for symbol in symbols:
+            ohlcv = context.get(symbol, '15m', SCAN_TIMEFRAMES['15m'])
+            if not ohlcv:
+                continue
 
             # Analyze symbol
-            signal = self.analyze_symbol(symbol, bias=SITE_SIGNAL_BIAS)
+            # The daily bar is resampled inside analyze_symbol, only for symbols that reach that stage
+            signal = self.analyze_symbol(symbol, bias=SITE_SIGNAL_BIAS, ohlcv=ohlcv)
             if signal:
                 signals_found.append(signal)
                 logger.info(f"✅ Signal found: {signal.symbol} (Score: {signal.confidence_score}) - Reasons: {', '.join(signal.reasons[:2])}")
-
-            # Rate limiting
-            time.sleep(0.3)  # Slightly faster since we're scanning more
+        logger.info(f"🪜 Cascade pruned: {cascade_stats(self.pruned)}")
 
         if not signals_found:
             logger.info("⏳ No signals found this scan")
@@ -1745,7 +1812,7 @@ class BountySeekerBot:
             }
 
             payload = {"embeds": [embed]}
-            response = requests.post(DISCORD_WEBHOOK, json=payload, timeout=10)
+            response = http_client.post(DISCORD_WEBHOOK, json=payload, timeout=10)
 
             if response.status_code != 204:
                 logger.warning(f"Discord status ping returned {response.status_code}")
@@ -1770,6 +1837,7 @@ class BountySeekerBot:
 
         # Startup notification to Discord
         self.send_startup_notification()
+        self.analysis_producer.start()
         self.write_status("ACTIVE")
 
         last_scan_minute = -1
@@ -1792,6 +1860,7 @@ class BountySeekerBot:
                             "open_trades": self.count_open_trades()
                         })
 
+                        self.begin_scan_context()
                         self.write_status("SCANNING")
                         self.update_learning()  # Update parameters based on performance
                         signals = self.scan_markets()
@@ -1822,6 +1891,7 @@ class BountySeekerBot:
                             })
 
                         self.write_status("ACTIVE", signals=signals)
+                        self.end_scan_context()
 
                 # Update learning every hour
                 if now.minute == 0 and now.second < 5:
@@ -1853,6 +1923,8 @@ class BountySeekerBot:
                 self.send_status_discord("ERROR", {"error": str(e)})
                 time.sleep(5)
 
+        self.analysis_producer.stop()
+        self.state.close()
         self.learning.close()
         logger.info("👋 Bounty Seeker Bot Stopped")
 
@@ -1860,4 +1932,11 @@ class BountySeekerBot:
 if __name__ == "__main__":
     init_databases()
     bot = BountySeekerBot()
+
+    def shutdown(signum, frame):
+        logger.info("🛑 Received SIGTERM, saving state")
+        bot.state.close()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
     bot.run()
@@ -7,10 +7,10 @@ Paper Trading: $1,000 starting capital, max 3 open trades
 """
 
 import os
+import sys
 import json
 import time
 import traceback
-import requests
 import sqlite3
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -18,6 +18,14 @@ import ccxt
 import pandas as pd
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client
+from shared.metadata_cache import load_markets_cached
+from shared.rate_limiter import get_rate_limiter
+
+from ohlcv_fetcher import OHLCVFetcher
+from resample import ResamplingCache
+
 # Import Trinity indicators
 from indicators import TrinityAnalyzer, TradeSignal, SignalType
 
@@ -37,6 +45,13 @@ MAX_OPEN_TRADES = 3
 RISK_PERCENT = 2.0  # Risk 2% per trade
 MIN_RR_RATIO = 2.0  # Minimum 2:1 reward:risk
 
+# Candles analyzed per symbol (timeframe -> limit); 1d is resampled locally from the cached 1h series.
+# 50 daily bars need 1224 hourly ones: the first scan seeds each symbol with ~13 history pages of 100,
+# later scans only top the series up. There is no weekly frame: fetch_ohlcv's 50-candle minimum
+# always rejected the 20 weekly bars, so the analyzer has only ever run without one.
+CANDLE_TIMEFRAMES = {"1h": 200, "1d": 50}
+RESAMPLED_TIMEFRAMES = {"1d": "1h"}
+
 # Trinity analyzer parameters
 MIN_CONFLUENCE = 3  # Minimum confluence score required
 ADX_THRESHOLD = 20.0  # Minimum ADX for trend
@@ -116,23 +131,25 @@ class BountySeekerTrinity:
         exchange_name = PREFERRED_EXCHANGE.lower()
         if exchange_name == "okx":
             self.exchange = ccxt.okx({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}
             })
             self.exchange_name = "OKX"
         elif exchange_name == "kraken":
             self.exchange = ccxt.kraken({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}
             })
             self.exchange_name = "KRAKEN"
         else:
             self.exchange = ccxt.okx({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}
             })
             self.exchange_name = "OKX"
 
+        self.candles = ResamplingCache(OHLCVFetcher(self.exchange), RESAMPLED_TIMEFRAMES)
+
         # Initialize Trinity Analyzer
         self.analyzer = TrinityAnalyzer(
             min_confluence=MIN_CONFLUENCE,
@@ -226,14 +243,17 @@ class BountySeekerTrinity:
 
     # ------------- Market Data -------------
     def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 200) -> Optional[pd.DataFrame]:
-        """Fetch OHLCV data and convert to DataFrame"""
+        """Fetch OHLCV data (1d resampled from the cached 1h series) and convert to DataFrame"""
         try:
-            ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            ohlcv = self.candles.get(symbol, timeframe, limit)
             if not ohlcv or len(ohlcv) < 50:
                 return None
 
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+            df = pd.DataFrame({
+                'timestamp': pd.to_datetime(ohlcv.ts, unit='ms'),
+                'open': ohlcv.open, 'high': ohlcv.high, 'low': ohlcv.low,
+                'close': ohlcv.close, 'volume': ohlcv.volume,
+            })
             df.set_index('timestamp', inplace=True)
             return df
         except Exception as e:
@@ -243,8 +263,8 @@ class BountySeekerTrinity:
     def get_top_volume_symbols(self, limit: int = 10) -> List[str]:
         """Get top volume symbols from exchange"""
         try:
-            markets = self.exchange.load_markets()
-            tickers = self.exchange.fetch_tickers()
+            load_markets_cached(self.exchange)
+            tickers = get_rate_limiter().ccxt_call(self.exchange, "tickers", self.exchange.fetch_tickers)
 
             # Filter for USDT perpetual swaps
             candidates = []
@@ -278,16 +298,15 @@ class BountySeekerTrinity:
             if df_1h is None or len(df_1h) < 100:
                 return None
 
-            # Fetch higher timeframes for GPS
+            # Fetch higher timeframes for GPS (no weekly frame, see CANDLE_TIMEFRAMES)
             df_daily = self.fetch_ohlcv(symbol, "1d", 50)
-            df_weekly = self.fetch_ohlcv(symbol, "1w", 20)
 
             # Run Trinity analysis
             signal = self.analyzer.analyze(
                 symbol=symbol.replace('/USDT:USDT', '').replace('/USDT', ''),
                 df=df_1h,
                 daily_df=df_daily,
-                weekly_df=df_weekly
+                weekly_df=None
             )
 
             return signal
@@ -365,7 +384,9 @@ class BountySeekerTrinity:
         updated_trades = []
         for trade in self.open_trades:
             try:
-                ticker = self.exchange.fetch_ticker(trade["symbol"])
+                ticker = get_rate_limiter().ccxt_call(
+                    self.exchange, "ticker", self.exchange.fetch_ticker, trade["symbol"]
+                )
                 current_price = float(ticker["last"])
 
                 exit_reason = None
@@ -456,7 +477,7 @@ class BountySeekerTrinity:
         payload = {"embeds": embeds}
 
         try:
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
+            response = http_client.post(self.webhook_url, json=payload, timeout=10)
             if response.status_code == 204:
                 self.log("✅ Posted to Discord")
             else:
@@ -581,6 +602,7 @@ class BountySeekerTrinity:
                     continue
 
                 self.log(f"📊 Scanning {len(symbols)} symbols...")
+                self.candles.prefetch(symbols, CANDLE_TIMEFRAMES)
 
                 # Analyze each symbol
                 signals = []
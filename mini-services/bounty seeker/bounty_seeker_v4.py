@@ -5,12 +5,18 @@ Bounty Seeker v4 - Real-time Scanner with Live Paper Trading
 - Trades only 9/10 and 10/10 signals
 - Shares 7–8/10 confidence signals on Watchlist
 """
-import os, json, time, logging, requests, ccxt
+import os, sys, json, time, logging, ccxt
 import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from paper_trader import PaperTrader
+from ohlcv_fetcher import OHLCVFetcher
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client, ta
+from shared.metadata_cache import load_markets_cached
+from shared.rate_limiter import get_rate_limiter
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("BountySeekerV4")
@@ -25,6 +31,7 @@ class RealTimeScanner:
     """Scans a large basket of perp markets and produces technical signals."""
     def __init__(self, exchanges: Dict[str, ccxt.Exchange]):
         self.exchanges = exchanges
+        self.fetchers = {exid: OHLCVFetcher(ex) for exid, ex in exchanges.items()}
         self.watchlist = self._build_watchlist()
 
     def _build_watchlist(self) -> List[Dict]:
@@ -44,7 +51,7 @@ class RealTimeScanner:
             volmap: Dict[str, float] = {}
             try:
                 # many ccxt exchanges support fetch_tickers(); fallback handled by except
-                tickers = ex.fetch_tickers()
+                tickers = get_rate_limiter().ccxt_call(ex, "tickers", ex.fetch_tickers)
                 for sym, t in tickers.items():
                     if sym not in syms:
                         continue
@@ -82,7 +89,7 @@ class RealTimeScanner:
 
     def _get_ohlcv_data(self, ex: ccxt.Exchange, symbol: str, timeframe: str = "1h", limit: int = 120) -> Optional[pd.DataFrame]:
         try:
-            ohlcv = ex.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+            ohlcv = get_rate_limiter().ccxt_call(ex, "candles", ex.fetch_ohlcv, symbol, timeframe=timeframe, limit=limit)
             if not ohlcv: return None
             df = pd.DataFrame(ohlcv, columns=["ts","open","high","low","close","volume"])
             df["ts"] = pd.to_datetime(df["ts"], unit="ms")
@@ -92,12 +99,8 @@ class RealTimeScanner:
             return None
 
     def _calc_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
-        # RSI
-        delta = df["close"].diff()
-        gain  = (delta.where(delta > 0, 0)).rolling(14).mean()
-        loss  = (-delta.where(delta < 0, 0)).rolling(14).mean()
-        rs = gain / loss.replace(0, np.nan)
-        df["rsi"] = 100 - (100/(1+rs))
+        # RSI (a window with no down moves reads 100, so the overbought rule can fire; it used to be NaN)
+        df["rsi"] = ta.rsi_series(df["close"].to_numpy())
 
         # MAs
         df["sma_20"] = df["close"].rolling(20).mean()
@@ -193,8 +196,144 @@ class RealTimeScanner:
             }
         return None
 
-    def scan_markets(self) -> List[Dict]:
+    # ---- batch (panel) mode: every symbol's indicators in one column-wise pass ----
+    def _fetch_panel(self, timeframe: str = "1h", limit: int = 120) -> Tuple[List[Dict], pd.DataFrame, pd.DataFrame]:
+        """Concurrently fetch every watchlist series and stack closes / volumes into wide panels.
+
+        Columns are watchlist items; rows are bars aligned on the newest bar, with
+        shorter histories NaN-padded at the top (rolling / ewm results are unchanged).
+        """
+        candles = {}
+        for exid, fetcher in self.fetchers.items():
+            jobs = [(it["symbol"], timeframe, limit) for it in self.watchlist if it["exchange"] == exid]
+            for (symbol, _), series in fetcher.fetch_many(jobs).items():
+                candles[(exid, symbol)] = series
+
+        items = [it for it in self.watchlist
+                 if candles.get((it["exchange"], it["symbol"])) is not None
+                 and len(candles[(it["exchange"], it["symbol"])]) >= 50]
+        bars = max((len(candles[(it["exchange"], it["symbol"])]) for it in items), default=0)
+        close = np.full((bars, len(items)), np.nan)
+        volume = np.full((bars, len(items)), np.nan)
+        for j, it in enumerate(items):
+            series = candles[(it["exchange"], it["symbol"])]
+            close[bars - len(series):, j] = series.close
+            volume[bars - len(series):, j] = series.volume
+        return items, pd.DataFrame(close), pd.DataFrame(volume)
+
+    def _calc_indicators_panel(self, close: pd.DataFrame, volume: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Same indicators as _calc_indicators, one column per symbol"""
+        ind = {"close": close}
+        ind["rsi"] = pd.DataFrame(ta.rsi_series(close.to_numpy().T).T, index=close.index, columns=close.columns)
+
+        ind["sma_20"] = close.rolling(20).mean()
+        ind["sma_50"] = close.rolling(50).mean()
+        ind["macd"] = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+        ind["macd_signal"] = ind["macd"].ewm(span=9).mean()
+
+        std = close.rolling(20).std()
+        ind["bb_upper"] = ind["sma_20"] + 2 * std
+        ind["bb_lower"] = ind["sma_20"] - 2 * std
+
+        ind["volume_ratio"] = volume / volume.rolling(20).mean()
+        ind["price_change_1h"] = (close - close.shift(1)) / close.shift(1) * 100
+        return ind
+
+    def _signals_panel(self, items: List[Dict], ind: Dict[str, pd.DataFrame]) -> List[Dict]:
+        """Evaluate _signal's rules for every symbol at once as boolean arrays"""
+        if not items:
+            return []
+        L = {k: v.iloc[-1].to_numpy() for k, v in ind.items()}
+        P = {k: v.iloc[-2].to_numpy() for k, v in ind.items()}
+        n = len(items)
+        conf = np.zeros(n)
+        direction = np.zeros(n, dtype=int)  # 1 LONG, -1 SHORT, 0 none
+        style = np.full(n, None, dtype=object)
+        rules: List[Tuple[np.ndarray, str]] = []
+
+        def apply(mask: np.ndarray, points: float, side: int, rule_style: str, reason: str):
+            nonlocal conf
+            conf = conf + np.where(mask, points, 0)
+            # A later rule only sets the side if it doesn't contradict an earlier one
+            take = mask & (direction != -side) if side else mask
+            direction[take] = side
+            style[take] = rule_style
+            rules.append((mask, reason))
+
+        # RSI inflections
+        rsi_long = (L["rsi"] < 30) & (30 <= P["rsi"])
+        rsi_short = ~rsi_long & (L["rsi"] > 70) & (70 >= P["rsi"])
+        direction[rsi_long], style[rsi_long] = 1, "reversal"
+        direction[rsi_short], style[rsi_short] = -1, "reversal"
+        conf += np.where(rsi_long | rsi_short, 2, 0)
+        rules += [(rsi_long, "RSI oversold bounce"), (rsi_short, "RSI overbought reversal")]
+
+        # MACD cross
+        macd_bull = (L["macd"] > L["macd_signal"]) & (P["macd"] <= P["macd_signal"])
+        macd_bear = ~macd_bull & (L["macd"] < L["macd_signal"]) & (P["macd"] >= P["macd_signal"])
+        apply(macd_bull, 2, 1, "momentum", "MACD bullish crossover")
+        apply(macd_bear, 2, -1, "momentum", "MACD bearish crossover")
+
+        # Bollinger taps
+        bb_low = (L["close"] <= L["bb_lower"]) & (P["close"] > P["bb_lower"])
+        bb_up = ~bb_low & (L["close"] >= L["bb_upper"]) & (P["close"] < P["bb_upper"])
+        apply(bb_low, 1, 1, "reversal", "Bollinger lower touch")
+        apply(bb_up, 1, -1, "reversal", "Bollinger upper touch")
+
+        # SMA20 break
+        sma_up = (L["close"] > L["sma_20"]) & (P["close"] <= P["sma_20"])
+        sma_down = ~sma_up & (L["close"] < L["sma_20"]) & (P["close"] >= P["sma_20"])
+        apply(sma_up, 1, 1, "breakout", "SMA20 breakout")
+        apply(sma_down, 1, -1, "breakdown", "SMA20 breakdown")
+
+        # Volume confirm
+        vol_high = L["volume_ratio"] > 1.5
+        vol_elevated = ~vol_high & (L["volume_ratio"] > 1.2)
+        conf += np.where(vol_high, 1, 0) + np.where(vol_elevated, 0.5, 0)
+        rules += [(vol_high, "High volume"), (vol_elevated, "Elevated volume")]
+
+        # Trend alignment
+        up = (direction == 1) & (L["close"] > L["sma_50"]) & (L["sma_20"] > L["sma_50"])
+        down = (direction == -1) & (L["close"] < L["sma_50"]) & (L["sma_20"] < L["sma_50"])
+        conf += np.where(up | down, 1, 0)
+        rules += [(up, "Uptrend alignment"), (down, "Downtrend alignment")]
+
+        reason_count = np.sum([mask for mask, _ in rules], axis=0)
+        hits = np.flatnonzero((conf >= 3) & (direction != 0) & (reason_count >= 2))
+
+        out: List[Dict] = []
+        for j in hits:
+            symbol, exchange = items[j]["symbol"], items[j]["exchange"]
+            out.append({
+                "symbol": symbol,
+                "exchange": exchange,
+                "direction": "LONG" if direction[j] == 1 else "SHORT",
+                "entry": float(L["close"][j]),
+                "confidence": min(int(conf[j]), 10),
+                "style": style[j] or "technical",
+                "base": symbol.split("/")[0],
+                "reason": " + ".join(reason for mask, reason in rules if mask[j]),
+                "rsi": float(L["rsi"][j]),
+                "volume_ratio": float(L["volume_ratio"][j]),
+                "price_change_1h": float(L["price_change_1h"][j]),
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            })
+        return out
+
+    def scan_markets(self, batch: bool = True) -> List[Dict]:
         logger.info(f"Scanning {len(self.watchlist)} markets for real-time signals…")
+        if batch:
+            try:
+                items, close, volume = self._fetch_panel()
+                out = self._signals_panel(items, self._calc_indicators_panel(close, volume))
+            except Exception as e:
+                logger.error(f"Batch scan failed: {e}")
+                out = []
+            for sig in out:
+                logger.info(f"📊 {sig['base']} {sig['direction']} ({sig['confidence']}/10) — {sig['reason']}")
+            logger.info(f"Scan complete: {len(out)} signals")
+            return out
+
         out: List[Dict] = []
         for item in self.watchlist:
             try:
@@ -207,7 +346,6 @@ class RealTimeScanner:
                 if sig:
                     out.append(sig)
                     logger.info(f"📊 {sig['base']} {sig['direction']} ({sig['confidence']}/10) — {sig['reason']}")
-                time.sleep(0.05)  # gentle rate-limit cushion
             except Exception:
                 continue
         logger.info(f"Scan complete: {len(out)} signals")
@@ -316,8 +454,8 @@ class BountySeekerV4:
     def _init_exchanges(self):
         for exid in self.config.get("EXCHANGES", []):
             try:
-                ex = getattr(ccxt, exid)({"enableRateLimit": True})
-                ex.load_markets()
+                ex = getattr(ccxt, exid)({"enableRateLimit": False})  # Paced by shared.rate_limiter
+                load_markets_cached(ex)
                 self.ex_map[exid] = ex
                 logger.info(f"✅ {exid} ready ({len(ex.markets)} markets)")
             except Exception as e:
@@ -332,7 +470,7 @@ class BountySeekerV4:
         candidates.append(symbol.replace("/", ""))  # BTCUSDT
         for s in candidates:
             try:
-                t = ex.fetch_ticker(s)
+                t = get_rate_limiter().ccxt_call(ex, "ticker", ex.fetch_ticker, s)
                 px = float(t.get("last") or t.get("close") or 0)
                 if px > 0: return px
             except Exception:
@@ -354,7 +492,7 @@ class BountySeekerV4:
             return True
 
         for i in range(0, len(embeds), 10):
-            r = requests.post(hook, json={"embeds": embeds[i:i+10]}, timeout=15)
+            r = http_client.post(hook, json={"embeds": embeds[i:i+10]}, timeout=15)
             logger.info(f"Discord status: {r.status_code}")
             time.sleep(0.25)
 
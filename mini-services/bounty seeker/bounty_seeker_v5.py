@@ -12,14 +12,26 @@ import sys
 import json
 import time
 import fcntl  # For lock file
+import signal
 import traceback
-import requests
-import sqlite3
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import ccxt
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client, ta
+from shared.metadata_cache import load_markets_cached
+
+from ticker_snapshot import TickerSnapshot
+from candles import Candles
+from ohlcv_fetcher import OHLCVFetcher
+from resample import ResamplingCache
+from cascade import StagedScore, cascade_stats
+from db import date_key, get_db
+from state_store import StateStore
+
 # ====================== CONFIGURATION ======================
 SCAN_INTERVAL_SEC = 3600  # 60 minutes for active scanning
 CONFIG_PATH = "config.json"
@@ -46,6 +58,16 @@ RSI_PERIOD = 14
 VOLUME_LOOKBACK = 20
 VWAP_LOOKBACK = 200  # For deviation calculations
 LIQUIDATION_LOOKBACK = 100
+# Liquidation levels closer than this (%) are merged into one zone at their importance-weighted price.
+# Proximity is then measured to the zone, not its members, so a price within 1% of an outlying member
+# but not of the zone (or the reverse) flips the near-liquidation bonus; under 1% of near calls do.
+LIQUIDATION_CLUSTER_PCT = 0.25
+
+# Candles analyzed per symbol (timeframe -> limit); 1d is resampled locally from the cached 1h series.
+# 50 daily bars need 1224 hourly ones: the first scan seeds each symbol with ~13 history pages of 100,
+# later scans only top the series up.
+CANDLE_TIMEFRAMES = {"1h": 200, "1d": 50}
+RESAMPLED_TIMEFRAMES = {"1d": "1h"}
 
 # Deviation VWAP thresholds
 DEVIATION_2SIGMA = 2.0  # 2σ deviation
@@ -54,6 +76,13 @@ DEVIATION_3SIGMA = 3.0  # 3σ deviation (preferred)
 # GPS proximity threshold (percentage)
 GPS_PROXIMITY_PCT = 0.5  # Within 0.5% of GPS
 
+# Max confidence each scoring component can add (in the order reasons are reported);
+# used to drop symbols that can't reach MIN_CONFIDENCE before the daily / liquidation stage
+SCORE_CAPS = {
+    "base": 4, "deviation": 4, "gps": 3, "liquidation": 3, "lows": 3, "rsi": 3,
+    "volume": 2, "accumulation": 2, "wick": 3, "rejection": 3, "stabilization": 3.5, "exhaustion": 1.5,
+}
+
 # Watchlist settings
 # Only scan the top 30 perpetual futures pairs by 24h volume
 SCAN_WATCHLIST_SIZE = 30
@@ -113,69 +142,19 @@ PREFERRED_EXCHANGE = "mexc"  # Options: "mexc", "okx", or "kraken"
 DISCORD_WEBHOOK = "https://discord.com/api/webhooks/1432976746692612147/SLf6oNcxTZfnmt1LmGLv-asGHwi-BnR2T8XIneUr7zM1tTbsSMncMZgzytvTFiAHmpcr"
 
 # ====================== HELPER FUNCTIONS ======================
-def calculate_rsi(prices: List[float], period: int = 14) -> float:
-    """Calculate RSI indicator"""
-    if len(prices) < period + 1:
-        return 50.0
-    deltas = np.diff(prices[-period-1:])
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-    avg_gain = np.mean(gains)
-    avg_loss = np.mean(losses)
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-
-def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> float:
-    """Calculate Average True Range"""
-    if len(highs) < period + 1:
-        return 0.0
-    tr_list = []
-    for i in range(-period, 0):
-        hi_lo = highs[i] - lows[i]
-        hi_cl = abs(highs[i] - closes[i-1]) if i > -len(closes) else hi_lo
-        lo_cl = abs(lows[i] - closes[i-1]) if i > -len(closes) else hi_lo
-        tr_list.append(max(hi_lo, hi_cl, lo_cl))
-    return float(np.mean(tr_list)) if tr_list else 0.0
-
-
-def calculate_vwap_and_deviation(ohlcv: List) -> Tuple[float, float, float, float, float]:
+def calculate_vwap_and_deviation(candles: Candles) -> Tuple[float, float, float, float, float]:
     """
     Calculate VWAP and deviation bands
     Returns: (vwap, std_dev, upper_2sigma, lower_2sigma, lower_3sigma)
     """
-    if len(ohlcv) < 50:
+    if len(candles) < 50:
         return None, None, None, None, None
 
-    # Calculate VWAP (Volume Weighted Average Price)
-    total_pv = 0.0  # Price * Volume
-    total_volume = 0.0
-    prices = []
-    volumes = []
-
-    for candle in ohlcv:
-        price = float(candle[4])  # Close price
-        vol = float(candle[5])  # Volume
-        total_pv += price * vol
-        total_volume += vol
-        prices.append(price)
-        volumes.append(vol)
-
-    if total_volume == 0:
+    # Volume-weighted VWAP and standard deviation
+    vwap, std_dev = ta.vwap_bands(candles.close, candles.volume)
+    if vwap is None:
         return None, None, None, None, None
 
-    vwap = total_pv / total_volume
-
-    # Calculate standard deviation
-    variance = 0.0
-    for i, price in enumerate(prices):
-        weight = volumes[i] / total_volume
-        variance += weight * ((price - vwap) ** 2)
-
-    std_dev = np.sqrt(variance) if variance > 0 else 0.0
-
     # Calculate deviation bands
     upper_2sigma = vwap + (std_dev * DEVIATION_2SIGMA)
     lower_2sigma = vwap - (std_dev * DEVIATION_2SIGMA)
@@ -189,121 +168,285 @@ def calculate_gps(high: float, low: float) -> Tuple[float, float]:
     Calculate Golden Pocket (61.8% - 65% Fibonacci retracement)
     Returns: (gp_high, gp_low)
     """
-    if high <= low:
+    zone = ta.golden_pocket(high, low, from_high=True)
+    if zone is None:
         return None, None
-    range_size = high - low
-    gp_high = high - (range_size * 0.618)  # 61.8% retracement
-    gp_low = high - (range_size * 0.65)    # 65% retracement
+    gp_low, gp_high = zone
     return gp_high, gp_low
 
 
 def detect_liquidation_zones(highs: List[float], lows: List[float], closes: List[float],
-                             volumes: List[float], timeframe: str = "1h") -> Dict:
+                             volumes: List[float], timeframe: str = "1h", lookback: int = 50) -> Dict:
     """
     Detect potential liquidation zones based on volume spikes and wick rejections
-    Returns dict with liquidation levels and importance
+    Returns dict with liquidation levels (sorted ascending, clustered) and importance
     """
     if len(highs) < 20:
-        return {"levels": [], "importance": []}
-
-    avg_volume = np.mean(volumes[-20:])
-    liquidation_levels = []
-    importance_scores = []
-
-    # Look for high volume candles with large wicks (liquidation candles)
-    for i in range(-min(50, len(highs)), 0):
-        vol_ratio = volumes[i] / avg_volume if avg_volume > 0 else 0
-        body = abs(closes[i] - (highs[i] + lows[i]) / 2)
-        wick_lower = min(closes[i], (highs[i] + lows[i]) / 2) - lows[i]
-        wick_upper = highs[i] - max(closes[i], (highs[i] + lows[i]) / 2)
-        total_range = highs[i] - lows[i]
-
-        if total_range == 0:
-            continue
+        return {"levels": [], "importance": [], "counts": []}
 
-        wick_ratio = max(wick_lower, wick_upper) / total_range
+    volumes_arr = np.asarray(volumes, dtype=float)
+    avg_volume = volumes_arr[-20:].mean()
+    if avg_volume <= 0:
+        return {"levels": [], "importance": [], "counts": []}
 
-        # Detect liquidation: high volume + large wick
-        if vol_ratio > 2.0 and wick_ratio > 0.4:
-            if wick_lower > wick_upper:
-                # Long liquidation (bearish wick below)
-                level = lows[i]
-                importance = min(100, (vol_ratio - 2.0) * 20 + wick_ratio * 30)
-            else:
-                # Short liquidation (bullish wick above)
-                level = highs[i]
-                importance = min(100, (vol_ratio - 2.0) * 20 + wick_ratio * 30)
-
-            liquidation_levels.append(level)
-            importance_scores.append(importance)
+    n = min(lookback, len(highs))
+    h = np.asarray(highs[-n:], dtype=float)
+    l = np.asarray(lows[-n:], dtype=float)
+    c = np.asarray(closes[-n:], dtype=float)
+    vol_ratio = volumes_arr[-n:] / avg_volume
 
-    return {"levels": liquidation_levels, "importance": importance_scores}
+    # Look for high volume candles with large wicks (liquidation candles)
+    mid = (h + l) / 2
+    wick_lower = np.minimum(c, mid) - l
+    wick_upper = h - np.maximum(c, mid)
+    total_range = h - l
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wick_ratio = np.maximum(wick_lower, wick_upper) / total_range
+
+    # Detect liquidation: high volume + large wick
+    hits = (total_range != 0) & (vol_ratio > 2.0) & (wick_ratio > 0.4)
+    if not hits.any():
+        return {"levels": [], "importance": [], "counts": []}
+
+    # Long liquidation (wick below) -> low, short liquidation (wick above) -> high
+    levels = np.where(wick_lower > wick_upper, l, h)[hits]
+    importance = np.minimum(100.0, (vol_ratio[hits] - 2.0) * 20 + wick_ratio[hits] * 30)
+
+    # Cluster neighbouring levels: importance-weighted price, strongest importance
+    order = np.argsort(levels, kind="stable")
+    levels, importance = levels[order], importance[order]
+    gaps = np.diff(levels) / levels[:-1] * 100 > LIQUIDATION_CLUSTER_PCT
+    starts = np.concatenate(([0], np.flatnonzero(gaps) + 1))
+    weights = np.maximum(importance, 1e-9)
+    cluster_levels = np.add.reduceat(levels * weights, starts) / np.add.reduceat(weights, starts)
+    cluster_importance = np.maximum.reduceat(importance, starts)
+    counts = np.diff(np.append(starts, len(levels)))
+
+    return {
+        "levels": cluster_levels.tolist(),
+        "importance": cluster_importance.tolist(),
+        "counts": counts.tolist(),
+    }
 
 
 def check_proximity_to_liquidation(price: float, liquidation_levels: List[float],
                                    importance_scores: List[float], threshold_pct: float = 1.0) -> Tuple[bool, float]:
     """
     Check if price is near a liquidation zone
+    Levels must be sorted ascending (as detect_liquidation_zones returns them);
+    the most important level in range wins, ties go to the nearest level
+    (the unclustered scan reported the first level found, oldest candle first).
     Returns: (is_near, importance_score)
     """
-    if not liquidation_levels:
+    if not liquidation_levels or price <= 0:
         return False, 0.0
 
-    for level, importance in zip(liquidation_levels, importance_scores):
-        distance_pct = abs(price - level) / price * 100
-        if distance_pct <= threshold_pct:
-            return True, importance
+    # Bisect the band of levels within threshold_pct, padded by one for float edges
+    band = price * threshold_pct / 100
+    lo = max(0, bisect_left(liquidation_levels, price - band) - 1)
+    hi = min(len(liquidation_levels), bisect_right(liquidation_levels, price + band) + 1)
 
-    return False, 0.0
+    best = None
+    for i in range(lo, hi):
+        distance_pct = abs(price - liquidation_levels[i]) / price * 100
+        if distance_pct > threshold_pct:
+            continue
+        key = (importance_scores[i], -distance_pct)
+        if best is None or key > best:
+            best = key
+
+    if best is None:
+        return False, 0.0
+    return True, best[0]
 
 
 # ====================== DATABASE SETUP ======================
+# Schema migrations, applied in order past PRAGMA user_version (append only)
+TRADES_MIGRATIONS = [
+    # 1: indexes, integer exit dates, and daily / all-time rollups kept current by a trigger
+    [
+        "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_exit_time ON trades(exit_time)",
+        "CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol)",
+        "ALTER TABLE trades ADD COLUMN exit_date INTEGER",
+        "UPDATE trades SET exit_date = CAST(strftime('%Y%m%d', exit_time) AS INTEGER) WHERE exit_time IS NOT NULL",
+        "CREATE INDEX IF NOT EXISTS idx_trades_exit_date ON trades(exit_date)",
+        '''
+            CREATE TABLE IF NOT EXISTS trade_rollup_daily (
+                exit_date INTEGER PRIMARY KEY,
+                trades INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                losses INTEGER NOT NULL DEFAULT 0,
+                pnl_usd REAL NOT NULL DEFAULT 0
+            )
+        ''',
+        '''
+            CREATE TABLE IF NOT EXISTS trade_rollup_total (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                trades INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                losses INTEGER NOT NULL DEFAULT 0,
+                pnl_usd REAL NOT NULL DEFAULT 0
+            )
+        ''',
+        '''
+            INSERT INTO trade_rollup_daily (exit_date, trades, wins, losses, pnl_usd)
+            SELECT exit_date, COUNT(*),
+                   SUM(COALESCE(pnl_usd, 0) > 0), SUM(COALESCE(pnl_usd, 0) < 0), COALESCE(SUM(pnl_usd), 0)
+            FROM trades
+            WHERE status = 'closed' AND exit_date IS NOT NULL
+            GROUP BY exit_date
+        ''',
+        '''
+            INSERT INTO trade_rollup_total (id, trades, wins, losses, pnl_usd)
+            SELECT 1, COUNT(*),
+                   COALESCE(SUM(COALESCE(pnl_usd, 0) > 0), 0), COALESCE(SUM(COALESCE(pnl_usd, 0) < 0), 0),
+                   COALESCE(SUM(pnl_usd), 0)
+            FROM trades
+            WHERE status = 'closed'
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS trades_rollup_on_close
+            AFTER UPDATE OF status ON trades
+            WHEN NEW.status = 'closed' AND OLD.status IS NOT 'closed'
+            BEGIN
+                INSERT INTO trade_rollup_daily (exit_date, trades, wins, losses, pnl_usd)
+                VALUES (
+                    COALESCE(NEW.exit_date, CAST(strftime('%Y%m%d', NEW.exit_time) AS INTEGER), 0),
+                    1, COALESCE(NEW.pnl_usd, 0) > 0, COALESCE(NEW.pnl_usd, 0) < 0, COALESCE(NEW.pnl_usd, 0)
+                )
+                ON CONFLICT(exit_date) DO UPDATE SET
+                    trades = trades + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    pnl_usd = pnl_usd + excluded.pnl_usd;
+                UPDATE trade_rollup_total SET
+                    trades = trades + 1,
+                    wins = wins + (COALESCE(NEW.pnl_usd, 0) > 0),
+                    losses = losses + (COALESCE(NEW.pnl_usd, 0) < 0),
+                    pnl_usd = pnl_usd + COALESCE(NEW.pnl_usd, 0)
+                WHERE id = 1;
+            END
+        ''',
+    ],
+    # 2: all-time losses count flat closes (pnl_usd <= 0) like the 4-hourly report always has;
+    #    closes without a PnL are neither wins nor losses
+    [
+        "DROP TRIGGER IF EXISTS trades_rollup_on_close",
+        '''
+            UPDATE trade_rollup_total
+            SET losses = (SELECT COUNT(*) FROM trades WHERE status = 'closed' AND pnl_usd <= 0)
+            WHERE id = 1
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS trades_rollup_on_close
+            AFTER UPDATE OF status ON trades
+            WHEN NEW.status = 'closed' AND OLD.status IS NOT 'closed'
+            BEGIN
+                INSERT INTO trade_rollup_daily (exit_date, trades, wins, losses, pnl_usd)
+                VALUES (
+                    COALESCE(NEW.exit_date, CAST(strftime('%Y%m%d', NEW.exit_time) AS INTEGER), 0),
+                    1, COALESCE(NEW.pnl_usd, 0) > 0, COALESCE(NEW.pnl_usd, 0) < 0, COALESCE(NEW.pnl_usd, 0)
+                )
+                ON CONFLICT(exit_date) DO UPDATE SET
+                    trades = trades + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    pnl_usd = pnl_usd + excluded.pnl_usd;
+                UPDATE trade_rollup_total SET
+                    trades = trades + 1,
+                    wins = wins + (COALESCE(NEW.pnl_usd, 0) > 0),
+                    losses = losses + (NEW.pnl_usd IS NOT NULL AND NEW.pnl_usd <= 0),
+                    pnl_usd = pnl_usd + COALESCE(NEW.pnl_usd, 0)
+                WHERE id = 1;
+            END
+        ''',
+    ],
+    # 3: daily losses use the same predicate as the all-time ones (a flat close is a loss),
+    #    so both reports agree on what a loss is
+    [
+        "DROP TRIGGER IF EXISTS trades_rollup_on_close",
+        '''
+            UPDATE trade_rollup_daily
+            SET losses = (
+                SELECT COUNT(*) FROM trades
+                WHERE status = 'closed' AND pnl_usd <= 0
+                  AND COALESCE(exit_date, CAST(strftime('%Y%m%d', exit_time) AS INTEGER), 0) = trade_rollup_daily.exit_date
+            )
+        ''',
+        '''
+            CREATE TRIGGER IF NOT EXISTS trades_rollup_on_close
+            AFTER UPDATE OF status ON trades
+            WHEN NEW.status = 'closed' AND OLD.status IS NOT 'closed'
+            BEGIN
+                INSERT INTO trade_rollup_daily (exit_date, trades, wins, losses, pnl_usd)
+                VALUES (
+                    COALESCE(NEW.exit_date, CAST(strftime('%Y%m%d', NEW.exit_time) AS INTEGER), 0),
+                    1, COALESCE(NEW.pnl_usd, 0) > 0, NEW.pnl_usd IS NOT NULL AND NEW.pnl_usd <= 0,
+                    COALESCE(NEW.pnl_usd, 0)
+                )
+                ON CONFLICT(exit_date) DO UPDATE SET
+                    trades = trades + 1,
+                    wins = wins + excluded.wins,
+                    losses = losses + excluded.losses,
+                    pnl_usd = pnl_usd + excluded.pnl_usd;
+                UPDATE trade_rollup_total SET
+                    trades = trades + 1,
+                    wins = wins + (COALESCE(NEW.pnl_usd, 0) > 0),
+                    losses = losses + (NEW.pnl_usd IS NOT NULL AND NEW.pnl_usd <= 0),
+                    pnl_usd = pnl_usd + COALESCE(NEW.pnl_usd, 0)
+                WHERE id = 1;
+            END
+        ''',
+    ],
+]
+
+
 def init_database():
     """Initialize SQLite database for trade tracking"""
-    conn = sqlite3.connect(TRADES_DB)
-    c = conn.cursor()
-
-    # Trades table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS trades (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            symbol TEXT NOT NULL,
-            exchange TEXT NOT NULL,
-            direction TEXT NOT NULL,
-            entry_price REAL NOT NULL,
-            stop_loss REAL NOT NULL,
-            take_profit_1 REAL,
-            take_profit_2 REAL,
-            take_profit_3 REAL,
-            position_size_usd REAL NOT NULL,
-            leverage INTEGER NOT NULL,
-            confidence INTEGER NOT NULL,
-            grade TEXT NOT NULL,
-            entry_time TEXT NOT NULL,
-            exit_time TEXT,
-            exit_price REAL,
-            exit_reason TEXT,
-            pnl_usd REAL,
-            pnl_percent REAL,
-            reasons TEXT,
-            status TEXT DEFAULT 'open'
-        )
-    ''')
-
-    # Daily PnL table
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS daily_pnl (
-            date TEXT PRIMARY KEY,
-            total_pnl REAL NOT NULL,
-            trades_count INTEGER NOT NULL,
-            win_count INTEGER NOT NULL,
-            loss_count INTEGER NOT NULL,
-            win_rate REAL
-        )
-    ''')
-
-    conn.commit()
-    conn.close()
+    with get_db(TRADES_DB).transaction() as conn:
+        c = conn.cursor()
+
+        # Trades table
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS trades (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT NOT NULL,
+                exchange TEXT NOT NULL,
+                direction TEXT NOT NULL,
+                entry_price REAL NOT NULL,
+                stop_loss REAL NOT NULL,
+                take_profit_1 REAL,
+                take_profit_2 REAL,
+                take_profit_3 REAL,
+                position_size_usd REAL NOT NULL,
+                leverage INTEGER NOT NULL,
+                confidence INTEGER NOT NULL,
+                grade TEXT NOT NULL,
+                entry_time TEXT NOT NULL,
+                exit_time TEXT,
+                exit_price REAL,
+                exit_reason TEXT,
+                pnl_usd REAL,
+                pnl_percent REAL,
+                reasons TEXT,
+                status TEXT DEFAULT 'open'
+            )
+        ''')
+
+        # Daily PnL table
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS daily_pnl (
+                date TEXT PRIMARY KEY,
+                total_pnl REAL NOT NULL,
+                trades_count INTEGER NOT NULL,
+                win_count INTEGER NOT NULL,
+                loss_count INTEGER NOT NULL,
+                win_rate REAL
+            )
+        ''')
+
+    get_db(TRADES_DB).migrate(TRADES_MIGRATIONS)
 
 
 # ====================== CORE BOT CLASS ======================
@@ -319,34 +462,37 @@ class BountySeekerV5:
         init_database()
         self.open_trades = self.load_open_trades()
         self.watchlist = []
+        self.pruned: Dict[str, int] = {}  # Symbols dropped per cascade stage this scan
 
         # Initialize exchange (MEXC, OKX, or Kraken)
         exchange_name = PREFERRED_EXCHANGE.lower()
         if exchange_name == "mexc":
             self.exchange = ccxt.mexc({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}  # Perpetual futures
             })
             self.exchange_name = "MEXC"
         elif exchange_name == "okx":
             self.exchange = ccxt.okx({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}  # Perpetual futures
             })
             self.exchange_name = "OKX"
         elif exchange_name == "kraken":
             self.exchange = ccxt.kraken({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}  # Perpetual futures
             })
             self.exchange_name = "KRAKEN"
         else:
             # Fallback to MEXC
             self.exchange = ccxt.mexc({
-                "enableRateLimit": True,
+                "enableRateLimit": False,  # Paced by shared.rate_limiter
                 "options": {"defaultType": "swap"}
             })
             self.exchange_name = "MEXC"
+        self.tickers = TickerSnapshot(self.exchange)
+        self.candles = ResamplingCache(OHLCVFetcher(self.exchange), RESAMPLED_TIMEFRAMES)
 
         self.log("🚀 BountySeekerV5 initialized")
         self.log(f"💰 Paper Trading Balance: ${self.paper_balance:.2f}")
@@ -356,29 +502,26 @@ class BountySeekerV5:
         self.check_trade_exits()  # Check for stop loss / take profit hits
 
     # ------------- State & Config -------------
-    def load_state(self) -> Dict:
+    def load_state(self) -> StateStore:
         if os.path.exists(STATE_FILE):
             try:
                 with open(STATE_FILE, "r") as f:
-                    return json.load(f)
+                    return StateStore(STATE_FILE, json.load(f))
             except Exception as e:
                 self.log(f"⚠️ Could not load state: {e}")
-        return {
+        return StateStore(STATE_FILE, {
             "_preview_last": {},
             "scanned_count": 0,
             "paper_balance": PAPER_CAPITAL,
             "last_daily_pnl": None,
             "signals_sent_this_hour": 0,
             "last_signal_hour": None
-        }
+        })
 
     def save_state(self):
-        try:
-            self.state["paper_balance"] = self.paper_balance
-            with open(STATE_FILE, "w") as f:
-                json.dump(self.state, f, indent=2)
-        except Exception as e:
-            self.log(f"⚠️ Could not save state: {e}")
+        """Schedule a state write (coalesced by the store, written atomically)"""
+        self.state["paper_balance"] = self.paper_balance
+        self.state.touch()
 
     def load_config(self) -> Dict:
         cfg = {
@@ -397,11 +540,7 @@ class BountySeekerV5:
 
     def load_open_trades(self) -> List[Dict]:
         """Load open trades from database"""
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-        c.execute("SELECT * FROM trades WHERE status = 'open'")
-        rows = c.fetchall()
-        conn.close()
+        rows = get_db(TRADES_DB).query("SELECT * FROM trades WHERE status = 'open'")
 
         trades = []
         for row in rows:
@@ -435,7 +574,7 @@ class BountySeekerV5:
         try:
             for i in range(0, len(embeds), 10):
                 chunk = embeds[i:i+10]
-                r = requests.post(self.webhook_url, json={"embeds": chunk}, timeout=15,
+                r = http_client.post(self.webhook_url, json={"embeds": chunk}, timeout=15,
                                   headers={"User-Agent": "BountySeeker/5"})
                 r.raise_for_status()
                 time.sleep(1)
@@ -498,11 +637,11 @@ class BountySeekerV5:
         """Load perpetual futures pairs - Top N by volume"""
         self.log(f"📋 Loading {self.exchange_name} perpetual futures (Top {SCAN_WATCHLIST_SIZE} by volume)...")
         try:
-            self.exchange.load_markets()
+            load_markets_cached(self.exchange)
             
             # Fetch all tickers efficiently
             self.log("📊 Fetching all tickers...")
-            tickers = self.exchange.fetch_tickers()
+            tickers = self.tickers.all()
             
             valid_pairs = []
             
@@ -569,10 +708,10 @@ class BountySeekerV5:
             traceback.print_exc()
 
     # ------------- Market Data -------------
-    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 200) -> Optional[List]:
+    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 200) -> Optional[Candles]:
         try:
-            # Add timeout to prevent hanging
-            return self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            # One cached 1h series per symbol; higher timeframes are resampled from it
+            return self.candles.get(symbol, timeframe, limit)
         except Exception as e:
             # Don't log every error to avoid spam - only log occasionally
             return None
@@ -590,15 +729,15 @@ class BountySeekerV5:
             if not ohlcv_1h or len(ohlcv_1h) < 100:
                 return None
 
-            closes = [float(x[4]) for x in ohlcv_1h]
-            highs = [float(x[2]) for x in ohlcv_1h]
-            lows = [float(x[3]) for x in ohlcv_1h]
-            volumes = [float(x[5]) for x in ohlcv_1h]
-            current_price = closes[-1]
+            closes = ohlcv_1h.close
+            highs = ohlcv_1h.high
+            lows = ohlcv_1h.low
+            volumes = ohlcv_1h.volume
+            current_price = float(closes[-1])
 
             # Calculate indicators
-            rsi = calculate_rsi(closes, RSI_PERIOD)
-            atr = calculate_atr(highs, lows, closes, ATR_PERIOD)
+            rsi = ta.rsi(closes, RSI_PERIOD)
+            atr = ta.atr(highs, lows, closes, ATR_PERIOD)
 
             # VWAP and Deviation
             vwap, std_dev, upper_2sigma, lower_2sigma, lower_3sigma = calculate_vwap_and_deviation(ohlcv_1h)
@@ -616,11 +755,163 @@ class BountySeekerV5:
             elif current_price <= lower_1sigma:
                 deviation_level = 1  # 1σ deviation (for bottom finding)
 
-            # GPS Calculation (Daily timeframe)
+            # BOTTOM FINDER CRITERIA - Finding coins at their lowest support ready for squeeze:
+            # 1. Price at 2σ or 3σ deviation (oversold) - REQUIRED
+            # 2. Near GPS or liquidation zone (strong bonus, but not required)
+            # 3. RSI oversold (the more oversold, the better)
+            # 4. Seller exhaustion (volume patterns, wicks, price stabilization)
+            # 5. Price at or near recent lows (support level)
+            # 6. Accumulation patterns (volume increasing while price holds)
+            #
+            # Scored as a cascade: the deviation gate, then everything the 1h candles give,
+            # and only symbols that can still reach MIN_CONFIDENCE pay for the daily GPS
+            # and liquidation-zone stage.
+
+            # Stage 1 - BOTTOM FINDER: Accept 1σ, 2σ, or 3σ deviations (more lenient)
+            if deviation_level < 1:
+                self.pruned["deviation"] = self.pruned.get("deviation", 0) + 1
+                return None
+
+            score = StagedScore(MIN_CONFIDENCE, SCORE_CAPS)
+            score.add("base", 4)  # Very low base - focus on finding ALL bottoms
+
+            # Deviation bonus (stronger weight for extreme oversold)
+            if deviation_level == 3:
+                score.add("deviation", 4, "3σ deviation (EXTREME oversold - rare bottom)")
+            elif deviation_level == 2:
+                score.add("deviation", 3, "2σ deviation (oversold - strong bottom signal)")
+            else:  # 1σ
+                score.add("deviation", 2, "1σ deviation (approaching oversold - potential bottom)")
+
+            # Stage 2 - 1h features (candles already in hand)
+            # Volume analysis
+            avg_volume = np.mean(volumes[-VOLUME_LOOKBACK:]) if len(volumes) >= VOLUME_LOOKBACK else volumes[-1]
+            volume_ratio = volumes[-1] / avg_volume if avg_volume > 0 else 1.0
+
+            # Price at or near recent lows (support level detection)
+            score.add("lows")
+            if len(lows) >= 20:
+                recent_low_20 = min(lows[-20:])
+                recent_low_10 = min(lows[-10:])
+                current_low = lows[-1]
+
+                # Check if price is at or very close to recent lows
+                distance_to_low_20 = abs(current_price - recent_low_20) / current_price * 100
+                distance_to_low_10 = abs(current_price - recent_low_10) / current_price * 100
+
+                if distance_to_low_20 < 1.0:  # Within 1% of 20-period low
+                    score.add("lows", 2, f"At/near 20-period low (${recent_low_20:.6f}) - STRONG SUPPORT")
+                elif distance_to_low_10 < 0.5:  # Within 0.5% of 10-period low
+                    score.add("lows", 1, f"At/near 10-period low (${recent_low_10:.6f}) - Support level")
+
+                # Check if making new lows (potential exhaustion)
+                if current_low <= recent_low_20 * 0.99:  # New low (1% below previous)
+                    score.add("lows", 1, "Making new lows - potential exhaustion point")
+
+            # RSI oversold (the more oversold, the better for bottom finding)
+            if rsi < 25:
+                score.add("rsi", 3, f"RSI EXTREMELY oversold ({rsi:.1f}) - RARE BOTTOM")
+            elif rsi < 30:
+                score.add("rsi", 2, f"RSI very oversold ({rsi:.1f}) - Strong bottom signal")
+            elif rsi < 35:
+                score.add("rsi", 1.5, f"RSI oversold ({rsi:.1f}) - Good bottom signal")
+            elif rsi < 40:
+                score.add("rsi", 1, f"RSI approaching oversold ({rsi:.1f})")
+            else:
+                score.add("rsi")
+
+            # Volume patterns for bottom finding
+            # High volume = seller exhaustion, Low volume = accumulation
+            if volume_ratio > 2.5:
+                score.add("volume", 2, f"Very high volume ({volume_ratio:.2f}x) - SELLER EXHAUSTION")
+            elif volume_ratio > 2.0:
+                score.add("volume", 1.5, f"Strong volume surge ({volume_ratio:.2f}x) - Exhaustion signal")
+            elif volume_ratio > 1.5:
+                score.add("volume", 1, f"Volume surge ({volume_ratio:.2f}x)")
+            elif volume_ratio > 1.2:
+                score.add("volume", 0.5, f"Above average volume ({volume_ratio:.2f}x)")
+            else:
+                score.add("volume")
+
+            # Accumulation pattern: volume increasing while price holds/consolidates
+            score.add("accumulation")
+            if len(volumes) >= 5:
+                recent_volumes = volumes[-5:]
+                volume_trend = sum(1 for i in range(1, len(recent_volumes)) if recent_volumes[i] > recent_volumes[i-1])
+                price_range = (max(highs[-5:]) - min(lows[-5:])) / current_price * 100
+
+                if volume_trend >= 3 and price_range < 2.0:  # Volume up, price tight
+                    score.add("accumulation", 2, "Accumulation pattern - Volume up, price consolidating")
+
+            # SELLER EXHAUSTION DETECTION (Critical for bottom finding)
+            recent_low = min(lows[-5:])
+            recent_close = closes[-1]
+            wick_size = recent_close - recent_low
+            body_size = abs(closes[-1] - (highs[-1] + lows[-1]) / 2)
+
+            # Large lower wick (strong rejection - buyers stepping in)
+            if body_size > 0 and wick_size > body_size * 2.5:
+                score.add("wick", 3, "MASSIVE lower wick - STRONG buyer rejection of lower prices")
+            elif body_size > 0 and wick_size > body_size * 2.0:
+                score.add("wick", 2, "Very large lower wick - Strong seller exhaustion")
+            elif body_size > 0 and wick_size > body_size * 1.5:
+                score.add("wick", 1.5, "Large lower wick - Seller exhaustion signal")
+            else:
+                score.add("wick")
+
+            # Price rejection pattern (hammer, doji, etc.) - reversal candles
+            score.add("rejection")
+            recent_candle_range = highs[-1] - lows[-1]
+            if recent_candle_range > 0:
+                lower_wick_pct = wick_size / recent_candle_range
+                upper_wick = highs[-1] - max(closes[-1], (highs[-1] + lows[-1]) / 2)
+                upper_wick_pct = upper_wick / recent_candle_range
+
+                if lower_wick_pct > 0.7:  # More than 70% lower wick - hammer
+                    score.add("rejection", 2, "Hammer pattern - Strong price rejection at bottom")
+                elif lower_wick_pct > 0.6:
+                    score.add("rejection", 1, "Price rejection pattern - Buyers defending level")
+
+                # Doji pattern (indecision at bottom = potential reversal)
+                body_pct = body_size / recent_candle_range if recent_candle_range > 0 else 0
+                if body_pct < 0.2 and recent_candle_range > 0:
+                    score.add("rejection", 1, "Doji pattern - Indecision at support (potential reversal)")
+
+            # Price stabilization at support (accumulation)
+            score.add("stabilization")
+            if len(lows) >= 10:
+                recent_lows = lows[-10:]
+                price_range_pct = (max(highs[-10:]) - min(recent_lows)) / current_price * 100
+                if price_range_pct < 1.5:  # Tight range - price holding
+                    score.add("stabilization", 1.5, "Price stabilization - Holding at support level")
+
+                # Check for downtrend exhaustion (making lower lows then stopping)
+                lower_lows_count = sum(1 for i in range(1, len(recent_lows)) if recent_lows[i] < recent_lows[i-1])
+                if lower_lows_count >= 5:  # Making lower lows
+                    # But if price is now holding, it's exhaustion
+                    if price_range_pct < 2.0:
+                        score.add("stabilization", 2, "Downtrend exhaustion - Lower lows stopped, price holding")
+                    else:
+                        score.add("stabilization", 1, "Downtrend structure - Potential reversal point")
+
+            # Volume exhaustion (volume decreasing after selloff = sellers done)
+            score.add("exhaustion")
+            if len(volumes) >= 5:
+                recent_vols = volumes[-5:]
+                volume_decreasing = sum(1 for i in range(1, len(recent_vols)) if recent_vols[i] < recent_vols[i-1])
+                if volume_decreasing >= 3 and volume_ratio < 1.0:  # Volume drying up
+                    score.add("exhaustion", 1.5, "Volume exhaustion - Sellers running out of steam")
+
+            # Even a GPS + liquidation bonus couldn't lift this to an A setup: skip the costly stage
+            if not score.reachable(lambda s: int(round(s))):
+                self.pruned["1h score"] = self.pruned.get("1h score", 0) + 1
+                return None
+
+            # Stage 3 - GPS Calculation (Daily timeframe)
             ohlcv_daily = self.fetch_ohlcv(symbol, "1d", 50)
             if ohlcv_daily and len(ohlcv_daily) >= 2:
-                daily_high = max([float(x[2]) for x in ohlcv_daily[-30:]])
-                daily_low = min([float(x[3]) for x in ohlcv_daily[-30:]])
+                daily_high = float(ohlcv_daily.high[-30:].max())
+                daily_low = float(ohlcv_daily.low[-30:].min())
                 gp_high, gp_low = calculate_gps(daily_high, daily_low)
 
                 # Check GPS proximity
@@ -648,219 +939,69 @@ class BountySeekerV5:
                 current_price, liquidation_data["levels"], liquidation_data["importance"], threshold_pct=1.0
             )
 
-            # Volume analysis
-            avg_volume = np.mean(volumes[-VOLUME_LOOKBACK:]) if len(volumes) >= VOLUME_LOOKBACK else volumes[-1]
-            volume_ratio = volumes[-1] / avg_volume if avg_volume > 0 else 1.0
+            # GPS proximity OR Liquidation zone - STRONG BONUS (not required, but adds confidence)
+            if near_gps:
+                score.add("gps", 3, f"Near GPS support ({gps_distance_pct:.2f}% away) - KEY LEVEL")  # GPS is very strong support level
+            else:
+                score.add("gps")
+
+            if near_liquidation:
+                score.add("liquidation", 3, f"Near liquidation zone (importance: {liq_importance:.1f}%) - SELLER EXHAUSTION")
+            else:
+                score.add("liquidation")
 
             # Signal generation - ULTIMATE BOTTOM FINDER (reversal at lowest support)
             signals = []
-
-            # BOTTOM FINDER CRITERIA - Finding coins at their lowest support ready for squeeze:
-            # 1. Price at 2σ or 3σ deviation (oversold) - REQUIRED
-            # 2. Near GPS or liquidation zone (strong bonus, but not required)
-            # 3. RSI oversold (the more oversold, the better)
-            # 4. Seller exhaustion (volume patterns, wicks, price stabilization)
-            # 5. Price at or near recent lows (support level)
-            # 6. Accumulation patterns (volume increasing while price holds)
-
-            # BOTTOM FINDER: Accept 1σ, 2σ, or 3σ deviations (more lenient)
-            if deviation_level >= 1:  # At least 1σ deviation for bottom finding
-                confidence = 4  # Very low base - focus on finding ALL bottoms
-                reasons = []
-
-                # Deviation bonus (stronger weight for extreme oversold)
-                if deviation_level == 3:
-                    confidence += 4  # 3σ is extreme - very strong bottom signal
-                    reasons.append("3σ deviation (EXTREME oversold - rare bottom)")
-                elif deviation_level == 2:
-                    confidence += 3
-                    reasons.append("2σ deviation (oversold - strong bottom signal)")
-                else:  # 1σ
-                    confidence += 2
-                    reasons.append("1σ deviation (approaching oversold - potential bottom)")
-
-                # GPS proximity OR Liquidation zone - STRONG BONUS (not required, but adds confidence)
-                if near_gps:
-                    confidence += 3  # GPS is very strong support level
-                    reasons.append(f"Near GPS support ({gps_distance_pct:.2f}% away) - KEY LEVEL")
-
-                if near_liquidation:
-                    confidence += 3  # Liquidation zone is strong support
-                    reasons.append(f"Near liquidation zone (importance: {liq_importance:.1f}%) - SELLER EXHAUSTION")
-
-                # Price at or near recent lows (support level detection)
-                if len(lows) >= 20:
-                    recent_low_20 = min(lows[-20:])
-                    recent_low_10 = min(lows[-10:])
-                    current_low = lows[-1]
-
-                    # Check if price is at or very close to recent lows
-                    distance_to_low_20 = abs(current_price - recent_low_20) / current_price * 100
-                    distance_to_low_10 = abs(current_price - recent_low_10) / current_price * 100
-
-                    if distance_to_low_20 < 1.0:  # Within 1% of 20-period low
-                        confidence += 2
-                        reasons.append(f"At/near 20-period low (${recent_low_20:.6f}) - STRONG SUPPORT")
-                    elif distance_to_low_10 < 0.5:  # Within 0.5% of 10-period low
-                        confidence += 1
-                        reasons.append(f"At/near 10-period low (${recent_low_10:.6f}) - Support level")
-
-                    # Check if making new lows (potential exhaustion)
-                    if current_low <= recent_low_20 * 0.99:  # New low (1% below previous)
-                        confidence += 1
-                        reasons.append("Making new lows - potential exhaustion point")
-
-                # RSI oversold (the more oversold, the better for bottom finding)
-                if rsi < 25:
-                    confidence += 3  # Extremely oversold - very strong bottom signal
-                    reasons.append(f"RSI EXTREMELY oversold ({rsi:.1f}) - RARE BOTTOM")
-                elif rsi < 30:
-                    confidence += 2  # Very oversold
-                    reasons.append(f"RSI very oversold ({rsi:.1f}) - Strong bottom signal")
-                elif rsi < 35:
-                    confidence += 1.5
-                    reasons.append(f"RSI oversold ({rsi:.1f}) - Good bottom signal")
-                elif rsi < 40:
-                    confidence += 1
-                    reasons.append(f"RSI approaching oversold ({rsi:.1f})")
-
-                # Volume patterns for bottom finding
-                # High volume = seller exhaustion, Low volume = accumulation
-                if volume_ratio > 2.5:
-                    confidence += 2  # Very high volume - seller exhaustion
-                    reasons.append(f"Very high volume ({volume_ratio:.2f}x) - SELLER EXHAUSTION")
-                elif volume_ratio > 2.0:
-                    confidence += 1.5
-                    reasons.append(f"Strong volume surge ({volume_ratio:.2f}x) - Exhaustion signal")
-                elif volume_ratio > 1.5:
-                    confidence += 1
-                    reasons.append(f"Volume surge ({volume_ratio:.2f}x)")
-                elif volume_ratio > 1.2:
-                    confidence += 0.5
-                    reasons.append(f"Above average volume ({volume_ratio:.2f}x)")
-
-                # Accumulation pattern: volume increasing while price holds/consolidates
-                if len(volumes) >= 5:
-                    recent_volumes = volumes[-5:]
-                    volume_trend = sum(1 for i in range(1, len(recent_volumes)) if recent_volumes[i] > recent_volumes[i-1])
-                    price_range = (max(highs[-5:]) - min(lows[-5:])) / current_price * 100
-
-                    if volume_trend >= 3 and price_range < 2.0:  # Volume up, price tight
-                        confidence += 2
-                        reasons.append("Accumulation pattern - Volume up, price consolidating")
-
-                # SELLER EXHAUSTION DETECTION (Critical for bottom finding)
-                recent_low = min(lows[-5:])
-                recent_close = closes[-1]
-                wick_size = recent_close - recent_low
-                body_size = abs(closes[-1] - (highs[-1] + lows[-1]) / 2)
-
-                # Large lower wick (strong rejection - buyers stepping in)
-                if body_size > 0 and wick_size > body_size * 2.5:
-                    confidence += 3  # Very strong rejection
-                    reasons.append("MASSIVE lower wick - STRONG buyer rejection of lower prices")
-                elif body_size > 0 and wick_size > body_size * 2.0:
-                    confidence += 2
-                    reasons.append("Very large lower wick - Strong seller exhaustion")
-                elif body_size > 0 and wick_size > body_size * 1.5:
-                    confidence += 1.5
-                    reasons.append("Large lower wick - Seller exhaustion signal")
-
-                # Price rejection pattern (hammer, doji, etc.) - reversal candles
-                recent_candle_range = highs[-1] - lows[-1]
-                if recent_candle_range > 0:
-                    lower_wick_pct = wick_size / recent_candle_range
-                    upper_wick = highs[-1] - max(closes[-1], (highs[-1] + lows[-1]) / 2)
-                    upper_wick_pct = upper_wick / recent_candle_range
-
-                    if lower_wick_pct > 0.7:  # More than 70% lower wick - hammer
-                        confidence += 2
-                        reasons.append("Hammer pattern - Strong price rejection at bottom")
-                    elif lower_wick_pct > 0.6:
-                        confidence += 1
-                        reasons.append("Price rejection pattern - Buyers defending level")
-
-                    # Doji pattern (indecision at bottom = potential reversal)
-                    body_pct = body_size / recent_candle_range if recent_candle_range > 0 else 0
-                    if body_pct < 0.2 and recent_candle_range > 0:
-                        confidence += 1
-                        reasons.append("Doji pattern - Indecision at support (potential reversal)")
-
-                # Price stabilization at support (accumulation)
-                if len(lows) >= 10:
-                    recent_lows = lows[-10:]
-                    price_range_pct = (max(highs[-10:]) - min(recent_lows)) / current_price * 100
-                    if price_range_pct < 1.5:  # Tight range - price holding
-                        confidence += 1.5
-                        reasons.append("Price stabilization - Holding at support level")
-
-                    # Check for downtrend exhaustion (making lower lows then stopping)
-                    lower_lows_count = sum(1 for i in range(1, len(recent_lows)) if recent_lows[i] < recent_lows[i-1])
-                    if lower_lows_count >= 5:  # Making lower lows
-                        # But if price is now holding, it's exhaustion
-                        if price_range_pct < 2.0:
-                            confidence += 2
-                            reasons.append("Downtrend exhaustion - Lower lows stopped, price holding")
-                        else:
-                            confidence += 1
-                            reasons.append("Downtrend structure - Potential reversal point")
-
-                # Volume exhaustion (volume decreasing after selloff = sellers done)
-                if len(volumes) >= 5:
-                    recent_vols = volumes[-5:]
-                    volume_decreasing = sum(1 for i in range(1, len(recent_vols)) if recent_vols[i] < recent_vols[i-1])
-                    if volume_decreasing >= 3 and volume_ratio < 1.0:  # Volume drying up
-                        confidence += 1.5
-                        reasons.append("Volume exhaustion - Sellers running out of steam")
-
-                # Convert confidence to integer for grading
-                confidence_int = int(round(confidence))
-
-                # Only A (8+) and A+ (9+) setups
-                if confidence_int >= MIN_CONFIDENCE:
-                    grade = "A+" if confidence_int >= A_PLUS_CONFIDENCE else "A"
-
-                    # Calculate entry, stop, targets
-                    entry = current_price
-                    stop = recent_low - (atr * 0.5)  # Stop below recent low
-                    risk = max(entry - stop, entry * 0.001)  # Minimum 0.1% risk
-
-                    # Take profit levels (2:1, 3:1, 4.5:1 RR)
-                    tp1 = entry + (risk * 2.0)
-                    tp2 = entry + (risk * 3.0)
-                    tp3 = entry + (risk * 4.5)
-
-                    rr_ratio = (tp2 - entry) / risk
-
-                    if rr_ratio >= MIN_RR_RATIO:
-                        signals.append({
-                            "exchange": self.exchange_name.lower(),
-                            "symbol": symbol,
-                            "direction": "LONG",
-                            "confidence": min(confidence_int, 10),
-                            "grade": grade,
-                            "entry": entry,
-                            "stop": stop,
-                            "tp1": tp1,
-                            "tp2": tp2,
-                            "tp3": tp3,
-                            "risk_reward": f"{rr_ratio:.2f}",
-                            "reasons": reasons,
-                            "rsi": rsi,
-                            "volume_ratio": volume_ratio,
-                            "deviation_level": deviation_level,
-                            "deviation_pct": deviation_pct,
-                            "near_gps": near_gps,
-                            "gps_distance_pct": gps_distance_pct,
-                            "near_liquidation": near_liquidation,
-                            "liq_importance": liq_importance,
-                            "vwap": vwap,
-                            "lower_2sigma": lower_2sigma,
-                            "lower_3sigma": lower_3sigma,
-                            "_closes": closes,
-                            "_highs": highs,
-                            "_lows": lows
-                        })
+            reasons = score.reasons
+
+            # Convert confidence to integer for grading
+            confidence_int = int(round(score.score))
+
+            # Only A (8+) and A+ (9+) setups
+            if confidence_int >= MIN_CONFIDENCE:
+                grade = "A+" if confidence_int >= A_PLUS_CONFIDENCE else "A"
+
+                # Calculate entry, stop, targets
+                entry = current_price
+                stop = recent_low - (atr * 0.5)  # Stop below recent low
+                risk = max(entry - stop, entry * 0.001)  # Minimum 0.1% risk
+
+                # Take profit levels (2:1, 3:1, 4.5:1 RR)
+                tp1 = entry + (risk * 2.0)
+                tp2 = entry + (risk * 3.0)
+                tp3 = entry + (risk * 4.5)
+
+                rr_ratio = (tp2 - entry) / risk
+
+                if rr_ratio >= MIN_RR_RATIO:
+                    signals.append({
+                        "exchange": self.exchange_name.lower(),
+                        "symbol": symbol,
+                        "direction": "LONG",
+                        "confidence": min(confidence_int, 10),
+                        "grade": grade,
+                        "entry": entry,
+                        "stop": stop,
+                        "tp1": tp1,
+                        "tp2": tp2,
+                        "tp3": tp3,
+                        "risk_reward": f"{rr_ratio:.2f}",
+                        "reasons": reasons,
+                        "rsi": rsi,
+                        "volume_ratio": volume_ratio,
+                        "deviation_level": deviation_level,
+                        "deviation_pct": deviation_pct,
+                        "near_gps": near_gps,
+                        "gps_distance_pct": gps_distance_pct,
+                        "near_liquidation": near_liquidation,
+                        "liq_importance": liq_importance,
+                        "vwap": vwap,
+                        "lower_2sigma": lower_2sigma,
+                        "lower_3sigma": lower_3sigma,
+                        "_closes": closes,
+                        "_highs": highs,
+                        "_lows": lows
+                    })
 
             return signals[0] if signals else None
 
@@ -897,9 +1038,7 @@ class BountySeekerV5:
             return False
 
         # Record trade in database
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-        c.execute('''
+        trade_id = get_db(TRADES_DB).execute('''
             INSERT INTO trades (symbol, exchange, direction, entry_price, stop_loss,
                               take_profit_1, take_profit_2, take_profit_3, position_size_usd,
                               leverage, confidence, grade, entry_time, reasons, status)
@@ -919,10 +1058,7 @@ class BountySeekerV5:
             signal["grade"],
             datetime.utcnow().isoformat(),
             ", ".join(signal["reasons"])
-        ))
-        trade_id = c.lastrowid
-        conn.commit()
-        conn.close()
+        )).lastrowid
 
         # Update open trades list
         self.open_trades.append({
@@ -974,12 +1110,16 @@ class BountySeekerV5:
         if not self.open_trades:
             return
 
+        # One bulk ticker snapshot covers every open trade
+        prices = self.tickers.last_prices({trade["symbol"] for trade in self.open_trades})
+
         updated_trades = []
         for trade in self.open_trades:
             try:
-                # Fetch current price
-                ticker = self.exchange.fetch_ticker(trade["symbol"])
-                current_price = float(ticker["last"])
+                current_price = prices.get(trade["symbol"])
+                if current_price is None:
+                    updated_trades.append(trade)
+                    continue
 
                 exit_reason = None
                 exit_price = None
@@ -1020,23 +1160,21 @@ class BountySeekerV5:
                 # Close trade if exit condition met
                 if exit_reason:
                     # Update database
-                    conn = sqlite3.connect(TRADES_DB)
-                    c = conn.cursor()
-                    c.execute('''
+                    exit_time = datetime.utcnow()
+                    get_db(TRADES_DB).execute('''
                         UPDATE trades
-                        SET exit_time = ?, exit_price = ?, exit_reason = ?,
+                        SET exit_time = ?, exit_date = ?, exit_price = ?, exit_reason = ?,
                             pnl_usd = ?, pnl_percent = ?, status = 'closed'
                         WHERE id = ?
                     ''', (
-                        datetime.utcnow().isoformat(),
+                        exit_time.isoformat(),
+                        date_key(exit_time),
                         exit_price,
                         exit_reason,
                         pnl_usd,
                         pnl_percent,
                         trade["id"]
                     ))
-                    conn.commit()
-                    conn.close()
 
                     # Update paper balance
                     self.paper_balance += pnl_usd
@@ -1138,6 +1276,7 @@ class BountySeekerV5:
         if now - last < cooldown_sec:
             return False
         self.state.setdefault("_preview_last", {})[key] = now
+        self.state.touch()
         return True
 
     # ------------- Repeat Trade Control -------------
@@ -1206,6 +1345,7 @@ class BountySeekerV5:
             "stop": float(signal.get("stop", 0.0)),
             "ts": time.time(),
         }
+        self.state.touch()
 
     def _build_combined_signals_card(self, signals: List[Dict]) -> Dict:
         """Build a single Discord embed card with LONG ONLY signals"""
@@ -1367,27 +1507,18 @@ class BountySeekerV5:
         if self.state.get("last_daily_pnl") == today:
             return
 
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-
-        # Get today's trades
-        c.execute('''
-            SELECT COUNT(*), SUM(pnl_usd),
-                   SUM(CASE WHEN pnl_usd > 0 THEN 1 ELSE 0 END) as wins,
-                   SUM(CASE WHEN pnl_usd < 0 THEN 1 ELSE 0 END) as losses
-            FROM trades
-            WHERE DATE(exit_time) = ? AND status = 'closed'
-        ''', (today,))
+        # Today's closed trades (one row of the daily rollup); a flat close counts as a loss, as in the 4-hourly report
+        row = get_db(TRADES_DB).query_one(
+            "SELECT trades, pnl_usd, wins, losses FROM trade_rollup_daily WHERE exit_date = ?",
+            (date_key(datetime.utcnow().date()),)
+        ) or (0, 0.0, 0, 0)
 
-        row = c.fetchone()
         trades_count = row[0] or 0
         total_pnl = row[1] or 0.0
         wins = row[2] or 0
         losses = row[3] or 0
         win_rate = (wins / trades_count * 100) if trades_count > 0 else 0.0
 
-        conn.close()
-
         if trades_count > 0:
             embed = {
                 "title": "📊 Daily PnL Report",
@@ -1417,26 +1548,13 @@ class BountySeekerV5:
         if last_hour_block == current_hour_block:
             return
 
-        conn = sqlite3.connect(TRADES_DB)
-        c = conn.cursor()
-
-        # Get stats for all time
-        c.execute('SELECT COUNT(*) FROM trades WHERE status = "closed"')
-        trades_count = c.fetchone()[0] or 0
-
-        c.execute('SELECT SUM(CASE WHEN pnl_usd > 0 THEN 1 ELSE 0 END) FROM trades WHERE status = "closed"')
-        wins = c.fetchone()[0] or 0
+        db = get_db(TRADES_DB)
 
-        c.execute('SELECT SUM(CASE WHEN pnl_usd <= 0 THEN 1 ELSE 0 END) FROM trades WHERE status = "closed"')
-        losses = c.fetchone()[0] or 0
-
-        c.execute('SELECT SUM(pnl_usd) FROM trades WHERE status = "closed"')
-        total_pnl = c.fetchone()[0] or 0.0
-
-        c.execute('SELECT COUNT(*) FROM trades WHERE status = "open"')
-        open_trades = c.fetchone()[0] or 0
-
-        conn.close()
+        # Get stats for all time (the all-time rollup row; open count uses the status index)
+        trades_count, wins, losses, total_pnl = db.query_one(
+            "SELECT trades, wins, losses, pnl_usd FROM trade_rollup_total WHERE id = 1"
+        ) or (0, 0, 0, 0.0)
+        open_trades = db.query_one("SELECT COUNT(*) FROM trades WHERE status = 'open'")[0] or 0
 
         win_rate = (wins / trades_count * 100) if trades_count > 0 else 0.0
 
@@ -1469,6 +1587,10 @@ class BountySeekerV5:
         self.log(f"🔍 Scanning {len(self.watchlist)} {self.exchange_name} pairs for bottoms...")
         scanned = 0
         errors = 0
+        self.pruned = {}
+
+        # Seed / top up every symbol's base series concurrently (long history is paged in once)
+        self.candles.prefetch(self.watchlist, CANDLE_TIMEFRAMES)
 
         for symbol in self.watchlist:
             try:
@@ -1488,6 +1610,7 @@ class BountySeekerV5:
                 self.log(f"  ... scanned {scanned}/{len(self.watchlist)} (errors: {errors})")
         
         self.log(f"✅ Scan complete: {scanned}/{len(self.watchlist)} pairs scanned, {errors} errors")
+        self.log(f"🪜 Cascade pruned: {cascade_stats(self.pruned)}")
 
         # Sort by confidence
         signals.sort(key=lambda x: x.get("confidence", 0), reverse=True)
@@ -1660,6 +1783,7 @@ class BountySeekerV5:
             except KeyboardInterrupt:
                 self.log("🛑 Shutting down gracefully...")
                 self.save_state()
+                self.state.close()
                 break
             except Exception as e:
                 self.log(f"❌ CRITICAL ERROR: {e}")
@@ -1668,6 +1792,7 @@ class BountySeekerV5:
 
             if "--once" in sys.argv:
                 self.log("🛑 One-time scan complete. Exiting.")
+                self.state.close()
                 break
 
             time.sleep(SCAN_INTERVAL_SEC)
@@ -1690,4 +1815,12 @@ if __name__ == "__main__":
         print("Continuing without Discord notifications...\n")
 
     bot = BountySeekerV5(webhook_url=webhook)
+
+    def shutdown(signum, frame):
+        bot.log("🛑 Received SIGTERM, saving state")
+        bot.save_state()
+        bot.state.close()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
     bot.run_scan_loop()
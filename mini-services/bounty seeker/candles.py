@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Columnar OHLCV candles for the Bounty Seeker bots.
+ccxt's list-of-lists is parsed once, when it arrives, into a structured NumPy
+array; indicators read typed column views instead of re-running
+float(c[4]) comprehensions over the same candles.
+"""
+
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+CANDLE_DTYPE = np.dtype([
+    ("ts", np.int64),
+    ("o", np.float64),
+    ("h", np.float64),
+    ("l", np.float64),
+    ("c", np.float64),
+    ("v", np.float64),
+])
+
+
+class Candles:
+    """Oldest-first OHLCV series backed by one structured array"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: np.ndarray):
+        self.data = data
+
+    @classmethod
+    def from_ohlcv(cls, rows: Optional[Sequence[Sequence]]) -> "Candles":
+        """Parse ccxt [[ts, o, h, l, c, v], ...] (missing values become NaN)"""
+        if not rows:
+            return cls(np.empty(0, dtype=CANDLE_DTYPE))
+        raw = np.array([row[:6] for row in rows], dtype=np.float64)
+        data = np.empty(len(raw), dtype=CANDLE_DTYPE)
+        data["ts"] = raw[:, 0]
+        for i, name in enumerate(("o", "h", "l", "c", "v"), start=1):
+            data[name] = raw[:, i]
+        return cls(data)
+
+    # ---- Column views (no copies) ----
+    @property
+    def ts(self) -> np.ndarray:
+        return self.data["ts"]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.data["o"]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.data["h"]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.data["l"]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.data["c"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.data["v"]
+
+    # ---- Sequence behaviour, so code written for ccxt lists keeps working ----
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Candles(self.data[index])
+        return self.data[index]  # Row: row[0] is ts, row[4] is close
+
+    def __iter__(self) -> Iterator:
+        return iter(self.data)
+
+    def tail(self, n: int) -> "Candles":
+        return Candles(self.data[-n:]) if n > 0 else Candles(self.data[:0])
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        return int(self.data["ts"][-1]) if len(self.data) else None
+
+    def to_list(self) -> List[List[float]]:
+        """Back to ccxt's list-of-lists (for JSON / legacy consumers)"""
+        return [[int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4]), float(r[5])] for r in self.data]
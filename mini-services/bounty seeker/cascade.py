@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Staged scoring for the Bounty Seeker scanners.
+A setup's score is built component by component, cheapest data first. After
+each stage the best score still reachable is known, so a symbol that can no
+longer pass is dropped before the costly stages (extra timeframes,
+liquidation zones) run for it.
+"""
+
+from typing import Dict, List, Optional
+
+
+class StagedScore:
+    """Additive score whose unscored components count at their maximum.
+
+    `caps` maps component -> max points, in the order its reasons are reported.
+    """
+
+    __slots__ = ("threshold", "caps", "score", "_reasons", "_pending")
+
+    def __init__(self, threshold: float, caps: Dict[str, float]):
+        self.threshold = threshold
+        self.caps = caps
+        self.score = 0
+        self._reasons: Dict[str, List[str]] = {}
+        self._pending = dict(caps)
+
+    def add(self, component: str, points: float = 0, reason: Optional[str] = None):
+        """Score a component (call once per component, with 0 points if it didn't fire)"""
+        self._pending.pop(component, None)
+        self.score += points
+        if reason:
+            self._reasons.setdefault(component, []).append(reason)
+
+    @property
+    def best_case(self) -> float:
+        """Score if every component not scored yet hits its cap"""
+        return self.score + sum(self._pending.values())
+
+    def reachable(self, rounding=None) -> bool:
+        """Can this score still reach the threshold? (`rounding` maps a score to how it's graded)"""
+        best = self.best_case
+        return (rounding(best) if rounding else best) >= self.threshold
+
+    @property
+    def reasons(self) -> List[str]:
+        return [reason for component in self.caps for reason in self._reasons.get(component, [])]
+
+
+def cascade_stats(pruned: Dict[str, int]) -> str:
+    """'stage: n' summary of where symbols left the cascade"""
+    return ", ".join(f"{stage}: {count}" for stage, count in pruned.items()) or "none"
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite connection manager for the Bounty Seeker bots.
+One long-lived connection per database file instead of a connect/close per
+query. The database runs in WAL mode, so the website can read trades while
+the bot writes them, and sqlite3's statement cache keeps the bot's
+repeated queries prepared.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# ====================== CONFIGURATION ======================
+BUSY_TIMEOUT_SEC = 10.0  # Wait this long on a lock held by another process
+CACHED_STATEMENTS = 64  # Prepared statements kept per connection
+
+_databases: Dict[str, "Database"] = {}
+_databases_lock = threading.Lock()
+
+
+class Database:
+    """Shared connection to one SQLite file; safe to use from any thread.
+
+    Statements run in autocommit mode; group writes with transaction().
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(
+            path,
+            timeout=BUSY_TIMEOUT_SEC,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # Durable at checkpoints; safe with WAL
+        self.lock = threading.RLock()
+        self._depth = 0
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Run one statement (lastrowid / rowcount are on the returned cursor)"""
+        with self.lock:
+            return self.conn.execute(sql, params)
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """All rows of a SELECT"""
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        """First row of a SELECT (None if empty)"""
+        with self.lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Commit everything in the block at once, or roll it all back on error (nests)"""
+        with self.lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.conn
+                finally:
+                    self._depth -= 1
+                return
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def migrate(self, migrations: Sequence[Sequence[str]]) -> int:
+        """Apply the migrations newer than PRAGMA user_version, each in one transaction.
+
+        migrations[n] holds the statements taking the schema to version n + 1;
+        only ever append to the list. Returns the schema version.
+        """
+        with self.lock:
+            version = self.query_one("PRAGMA user_version")[0]
+            for number, statements in enumerate(migrations[version:], start=version + 1):
+                with self.transaction() as conn:
+                    for sql in statements:
+                        conn.execute(sql)
+                    conn.execute(f"PRAGMA user_version = {number}")
+            return max(version, len(migrations))
+
+    def close(self):
+        with _databases_lock, self.lock:
+            self.conn.close()
+            if _databases.get(self.path) is self:
+                del _databases[self.path]
+
+
+def date_key(day: date) -> int:
+    """Sortable integer date (YYYYMMDD) for indexed date columns"""
+    return day.year * 10000 + day.month * 100 + day.day
+
+
+def get_db(path: str) -> Database:
+    """The process-wide Database for `path`, opened on first use"""
+    with _databases_lock:
+        db = _databases.get(path)
+        if db is None:
+            db = _databases[path] = Database(path)
+        return db
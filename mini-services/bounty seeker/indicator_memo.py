@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Indicator memoization for the Bounty Seeker bots.
+Results are cached per (indicator, symbol, timeframe, candles, params). Closed
+candles never change, so a series is identified by its length, its last
+candle's open time and the values of that (possibly still forming) candle:
+identical candles are never recomputed, and any tick on the forming bar or a
+newly opened bar is a miss.
+"""
+
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from candles import Candles
+
+T = TypeVar("T")
+
+# ====================== CONFIGURATION ======================
+MEMO_CAPACITY = 2048  # Entries kept before the least recently used is evicted
+
+
+def params_hash(params: Optional[Dict[str, Any]]) -> str:
+    """Stable short hash of indicator parameters"""
+    if not params:
+        return ""
+    raw = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def series_key(candles: Candles) -> Tuple[int, Optional[int], bytes]:
+    """(bars, last candle time, last candle values) - identifies a candle series"""
+    if not len(candles):
+        return 0, None, b""
+    return len(candles), candles.last_ts, candles.data[-1].tobytes()
+
+
+class IndicatorMemo:
+    """Thread-safe LRU of indicator results keyed by the candles they came from"""
+
+    def __init__(self, capacity: int = MEMO_CAPACITY):
+        self.capacity = capacity
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, symbol: str, timeframe: str, candles: Candles,
+            params: Optional[Dict[str, Any]], compute: Callable[[], T]) -> T:
+        """Cached result for these candles, or compute() it once and remember it"""
+        key = (name, symbol, timeframe, series_key(candles), params_hash(params))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit / miss counters for logs and the status file"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
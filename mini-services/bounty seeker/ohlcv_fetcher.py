@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Concurrent OHLCV fetch engine and scan-scoped data context for the Bounty Seeker scanners.
+Fetches candles for a whole watchlist with a bounded worker pool; every request
+goes through the shared token-bucket rate limiter, so all workers respect the
+exchange limit together.
+"""
+
+import os
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Optional, Tuple
+
+import ccxt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.rate_limiter import RateLimiter, get_rate_limiter
+
+from candles import Candles
+
+logger = logging.getLogger(__name__)
+
+# ====================== CONFIGURATION ======================
+FETCH_WORKERS = 8  # Max requests in flight at once
+FETCH_RETRIES = 2
+HISTORY_PAGE_LIMIT = 100  # Candles per page when paging back through history (OKX history cap)
+
+
+class OHLCVFetcher:
+    """Bounded-concurrency OHLCV fetcher for a ccxt exchange"""
+
+    def __init__(self, exchange, max_workers: int = FETCH_WORKERS,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.exchange = exchange
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+
+    def fetch(self, symbol: str, timeframe: str, limit: int, since: Optional[int] = None) -> Optional[Candles]:
+        """Fetch a single OHLCV series (parsed once into Candles), retrying on rate limit / network errors"""
+        for attempt in range(FETCH_RETRIES + 1):
+            try:
+                return Candles.from_ohlcv(self.rate_limiter.ccxt_call(
+                    self.exchange, "candles", self.exchange.fetch_ohlcv, symbol, timeframe, since=since, limit=limit
+                ))
+            except (ccxt.RateLimitExceeded, ccxt.DDoSProtection) as e:
+                # The limiter has already paused and slowed the bucket
+                logger.warning(f"⏳ Rate limited fetching {symbol} {timeframe}, backing off: {e}")
+            except ccxt.NetworkError as e:
+                if attempt == FETCH_RETRIES:
+                    logger.error(f"Error fetching {symbol} {timeframe}: {e}")
+                    return None
+            except Exception as e:
+                logger.error(f"Error fetching {symbol} {timeframe}: {e}")
+                return None
+        return None
+
+    def fetch_history(self, symbol: str, timeframe: str, bars: int) -> Optional[Candles]:
+        """Fetch the newest `bars` candles, paging forward from `since` when one request can't hold them"""
+        if bars <= HISTORY_PAGE_LIMIT:
+            return self.fetch(symbol, timeframe, bars)
+
+        bar_ms = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        now_ms = int(time.time() * 1000)
+        since = (now_ms // bar_ms - bars + 1) * bar_ms
+        pages = []
+        while since <= now_ms:
+            page = self.fetch(symbol, timeframe, HISTORY_PAGE_LIMIT, since=since)
+            if not page:
+                break
+            pages.append(page.data)
+            if page.last_ts + bar_ms <= since:
+                break  # Exchange ignored `since`; don't loop on the same page
+            since = page.last_ts + bar_ms
+        if not pages:
+            return None
+
+        data = np.concatenate(pages)
+        _, first = np.unique(data["ts"], return_index=True)  # Sorted, one row per bar
+        return Candles(data[first][-bars:])
+
+    def fetch_many(self, jobs: Iterable[Tuple[str, str, int]]) -> Dict[Tuple[str, str], Optional[Candles]]:
+        """Fetch many (symbol, timeframe, limit) requests concurrently, keyed by (symbol, timeframe)"""
+        jobs = list(jobs)
+        results: Dict[Tuple[str, str], Optional[Candles]] = {}
+        if not jobs:
+            return results
+
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self.fetch, symbol, timeframe, limit): (symbol, timeframe)
+                for symbol, timeframe, limit in jobs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        failed = sum(1 for data in results.values() if not data)
+        logger.info(
+            f"📥 Fetched {len(results) - failed}/{len(results)} OHLCV series in {time.time() - started:.1f}s"
+        )
+        return results
+
+
+class ScanDataContext:
+    """Scan-scoped OHLCV store keyed by (symbol, timeframe, last candle time).
+
+    Every consumer in one scan reads through the context, so each series is
+    fetched once. A series stays valid while its last candle is still the
+    forming bar, so data never outlives the bar it was fetched in.
+    """
+
+    def __init__(self, fetcher: OHLCVFetcher):
+        self.fetcher = fetcher
+        self._series: Dict[Tuple[str, str, int], Tuple[Candles, int]] = {}  # key -> (candles, limit requested)
+        self._latest: Dict[Tuple[str, str], int] = {}  # (symbol, timeframe) -> last candle time
+        self.fetched = 0
+        self.reused = 0
+
+    def _lookup(self, symbol: str, timeframe: str, limit: int) -> Optional[Candles]:
+        last_ts = self._latest.get((symbol, timeframe))
+        if last_ts is None:
+            return None
+        candles, requested = self._series[(symbol, timeframe, last_ts)]
+        bar_ms = ccxt.Exchange.parse_timeframe(timeframe) * 1000
+        if time.time() * 1000 - last_ts >= bar_ms or requested < limit:
+            return None  # A newer bar has opened, or we hold too few candles
+        return candles[-limit:]
+
+    def _store(self, symbol: str, timeframe: str, limit: int, candles: Optional[Candles]):
+        if not candles:
+            return
+        last_ts = candles.last_ts
+        self._series[(symbol, timeframe, last_ts)] = (candles, limit)
+        self._latest[(symbol, timeframe)] = last_ts
+
+    def prefetch(self, symbols: Iterable[str], timeframes: Dict[str, int]):
+        """Concurrently fetch every (symbol, timeframe) series not already held"""
+        missing = [
+            (symbol, timeframe, limit)
+            for symbol in symbols
+            for timeframe, limit in timeframes.items()
+            if self._lookup(symbol, timeframe, limit) is None
+        ]
+        self.reused += sum(len(timeframes) for _ in symbols) - len(missing)
+        if not missing:
+            return
+        limits = {(symbol, timeframe): limit for symbol, timeframe, limit in missing}
+        for (symbol, timeframe), candles in self.fetcher.fetch_many(missing).items():
+            self._store(symbol, timeframe, limits[(symbol, timeframe)], candles)
+        self.fetched += len(missing)
+
+    def get(self, symbol: str, timeframe: str, limit: int) -> Optional[Candles]:
+        """Candles from the context, fetching (once) if not held yet"""
+        candles = self._lookup(symbol, timeframe, limit)
+        if candles is not None:
+            self.reused += 1
+            return candles
+        candles = self.fetcher.fetch(symbol, timeframe, limit)
+        self.fetched += 1
+        self._store(symbol, timeframe, limit, candles)
+        return candles[-limit:] if candles else candles
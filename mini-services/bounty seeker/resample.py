@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local multi-timeframe resampling for the Bounty Seeker bots.
+Higher timeframes (15m -> 1h / 4h / 1d, 1d -> 1w) are aggregated from one
+cached base series on the exchange's own session boundaries, so each symbol
+costs one candle request per scan instead of one per timeframe.
+"""
+
+import os
+import sys
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+import ccxt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.rate_limiter import get_rate_limiter
+
+from candles import CANDLE_DTYPE, Candles
+
+logger = logging.getLogger(__name__)
+
+# ====================== CONFIGURATION ======================
+# Where each exchange opens its native session bars. OKX's own 1D / 1W candles
+# open at 00:00 Hong Kong time (UTC+8), but ccxt asks for the UTC-aligned ones
+# (options['fetchOHLCV']['timezone'] == 'UTC', e.g. '1Dutc') unless told
+# otherwise. The offset is a no-op for 4h and below.
+SESSION_OFFSETS_MS = {"okx": -8 * 3600 * 1000}
+WEEK_ANCHOR_MS = 4 * 86400 * 1000  # 1970-01-01 was a Thursday; weekly bars open on Monday
+REFRESH_SEC = 60  # Base series younger than this are served without a request
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """Bar length in milliseconds (calendar months can't be resampled on a fixed grid)"""
+    if timeframe.endswith("M"):
+        raise ValueError(f"Cannot resample to calendar timeframe {timeframe}")
+    return ccxt.Exchange.parse_timeframe(timeframe) * 1000
+
+
+def session_offset_ms(exchange) -> int:
+    """Offset from UTC midnight of the 1d / 1w bars this ccxt client fetches"""
+    fetch_options = (getattr(exchange, "options", None) or {}).get("fetchOHLCV") or {}
+    if str(fetch_options.get("timezone", "")).upper() == "UTC":
+        return 0
+    return SESSION_OFFSETS_MS.get(getattr(exchange, "id", ""), 0)
+
+
+def bar_origin(timeframe: str, offset_ms: int = 0) -> int:
+    """Timestamp any bar of `timeframe` opens at, modulo the bar length"""
+    origin = offset_ms
+    if timeframe.endswith("w"):
+        origin += WEEK_ANCHOR_MS
+    return origin
+
+
+def base_bars(timeframe: str, base_timeframe: str, limit: int) -> int:
+    """Base candles needed for `limit` resampled bars (plus one partly covered bucket)"""
+    ratio = -(-timeframe_ms(timeframe) // timeframe_ms(base_timeframe))
+    return (limit + 1) * ratio
+
+
+def resample(candles: Candles, timeframe: str, offset_ms: int = 0) -> Candles:
+    """Aggregate candles into `timeframe` bars opening on exchange session boundaries.
+
+    A leading bucket the base series only partly covers is dropped; the last
+    (forming) bar is kept, as the exchange would return it.
+    """
+    if not len(candles):
+        return candles
+    tf_ms = timeframe_ms(timeframe)
+    origin = bar_origin(timeframe, offset_ms)
+    ts = candles.ts
+    starts = (ts - origin) // tf_ms * tf_ms + origin
+
+    first = np.flatnonzero(np.r_[True, np.diff(starts) != 0])
+    if ts[0] != starts[0]:
+        first = first[1:]
+    if not len(first):
+        return Candles(np.empty(0, dtype=CANDLE_DTYPE))
+
+    data = candles.data[first[0]:]
+    idx = first - first[0]
+    out = np.empty(len(idx), dtype=CANDLE_DTYPE)
+    out["ts"] = starts[first]
+    out["o"] = data["o"][idx]
+    out["h"] = np.maximum.reduceat(data["h"], idx)
+    out["l"] = np.minimum.reduceat(data["l"], idx)
+    out["c"] = data["c"][np.r_[idx[1:], len(data)] - 1]
+    out["v"] = np.add.reduceat(data["v"], idx)
+    return Candles(out)
+
+
+class ResamplingCache:
+    """Base candle series kept across scans; derived timeframes are resampled locally.
+
+    Each base series is seeded once with as much history as its consumers need
+    (paged through fetcher.fetch_history), then topped up with the few newest
+    bars on later scans.
+    """
+
+    def __init__(self, fetcher, sources: Dict[str, str], refresh_sec: int = REFRESH_SEC):
+        self.fetcher = fetcher
+        self.sources = sources  # timeframe -> base timeframe it is derived from
+        self.refresh_sec = refresh_sec
+        self.offset_ms = session_offset_ms(fetcher.exchange)
+        self._series: Dict[Tuple[str, str], Candles] = {}
+        self._depth: Dict[Tuple[str, str], int] = {}  # Base bars kept per series
+        self._fetched_at: Dict[Tuple[str, str], float] = {}
+        self.requests = 0
+        self.derived = 0
+
+    def _plan(self, timeframe: str, limit: int) -> Tuple[str, int]:
+        """(base timeframe, base bars) serving `limit` bars of `timeframe`"""
+        base_tf = self.sources.get(timeframe, timeframe)
+        if base_tf == timeframe:
+            return base_tf, limit
+        return base_tf, base_bars(timeframe, base_tf, limit)
+
+    def _refresh(self, symbol: str, base_tf: str, bars: int) -> Optional[Candles]:
+        key = (symbol, base_tf)
+        held = self._series.get(key)
+        depth = max(bars, self._depth.get(key, 0))
+        now = time.time()
+        bar_ms = timeframe_ms(base_tf)
+
+        if held is not None and self._depth[key] >= bars:
+            if now - self._fetched_at[key] < self.refresh_sec and now * 1000 - held.last_ts < bar_ms:
+                return held
+            missing = int((now * 1000 - held.last_ts) // bar_ms) + 1
+            if missing < depth:
+                tail = self.fetcher.fetch(symbol, base_tf, missing + 1)
+                self.requests += 1
+                if tail:
+                    keep = held.data[held.ts < tail.ts[0]]
+                    merged = Candles(np.concatenate([keep, tail.data])[-depth:])
+                    self._series[key], self._fetched_at[key] = merged, now
+                    return merged
+                return held
+
+        # First sight of this series, or a consumer needs more history: seed it
+        series = self.fetcher.fetch_history(symbol, base_tf, depth)
+        self.requests += 1
+        if not series:
+            return held
+        self._series[key], self._depth[key], self._fetched_at[key] = series, depth, now
+        return series
+
+    def get(self, symbol: str, timeframe: str, limit: int) -> Optional[Candles]:
+        """Newest `limit` bars of `timeframe`, resampled from the base series when derived"""
+        base_tf, bars = self._plan(timeframe, limit)
+        series = self._refresh(symbol, base_tf, bars)
+        if not series:
+            return None
+        if base_tf != timeframe:
+            self.derived += 1
+            series = resample(series, timeframe, self.offset_ms)
+        return series.tail(limit)
+
+    def prefetch(self, symbols: Iterable[str], timeframes: Dict[str, int]):
+        """Concurrently bring every base series the scan needs up to date; drop the rest"""
+        symbols = list(symbols)
+        keep = set(symbols)
+        for key in [key for key in self._series if key[0] not in keep]:
+            del self._series[key], self._depth[key], self._fetched_at[key]
+
+        needs: Dict[str, int] = {}
+        for timeframe, limit in timeframes.items():
+            base_tf, bars = self._plan(timeframe, limit)
+            needs[base_tf] = max(needs.get(base_tf, 0), bars)
+        jobs = [(symbol, base_tf, bars) for symbol in symbols for base_tf, bars in needs.items()]
+        with ThreadPoolExecutor(max_workers=self.fetcher.max_workers) as pool:
+            list(pool.map(lambda job: self._refresh(*job), jobs))
+        logger.info(f"📦 Candle cache: {len(self._series)} base series, {self.requests} requests, {self.derived} resampled")
+
+
+def check_alignment(exchange, symbol: str, timeframe: str = "1d", base_timeframe: str = "1h",
+                    bars: int = 3) -> bool:
+    """Compare locally resampled bars with the exchange's own `timeframe` candles.
+
+    Checks the last `bars` closed bars (open time, open, high, low, close);
+    run it after changing SESSION_OFFSETS_MS or an exchange's fetch options.
+    """
+    limiter = get_rate_limiter()
+    ratio = timeframe_ms(timeframe) // timeframe_ms(base_timeframe)
+    base = Candles.from_ohlcv(limiter.ccxt_call(
+        exchange, "candles", exchange.fetch_ohlcv, symbol, base_timeframe, limit=(bars + 2) * ratio
+    ))
+    native = Candles.from_ohlcv(limiter.ccxt_call(
+        exchange, "candles", exchange.fetch_ohlcv, symbol, timeframe, limit=bars + 1
+    ))[:-1]  # Closed bars only
+    local = resample(base, timeframe, session_offset_ms(exchange))
+    local = Candles(local.data[np.isin(local.ts, native.ts)])
+    if len(local) != len(native) or not len(native):
+        logger.warning(f"⚠️ {exchange.id} {symbol} {timeframe}: resampled bars open at "
+                       f"{local.ts[-bars:].tolist()}, exchange bars at {native.ts.tolist()}")
+        return False
+    fields = ("o", "h", "l", "c")
+    matches = all(np.allclose(local.data[f], native.data[f], rtol=1e-9) for f in fields)
+    if not matches:
+        logger.warning(f"⚠️ {exchange.id} {symbol} {timeframe}: resampled OHLC differs from the exchange's")
+    return matches
+
+
+if __name__ == "__main__":
+    # python resample.py [exchange] [symbol] - check session alignment against live candles
+    logging.basicConfig(level=logging.INFO)
+    exchange_id = sys.argv[1] if len(sys.argv) > 1 else "okx"
+    symbol = sys.argv[2] if len(sys.argv) > 2 else "BTC/USDT:USDT"
+    exchange = getattr(ccxt, exchange_id)({"enableRateLimit": False})  # Paced by shared.rate_limiter
+    for timeframe in ("1d", "1w"):
+        base_timeframe = "1h" if timeframe == "1d" else "1d"
+        ok = check_alignment(exchange, symbol, timeframe, base_timeframe)
+        print(f"{'✅' if ok else '❌'} {exchange_id} {symbol} {timeframe} from {base_timeframe}")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Debounced, crash-safe JSON state for the Bounty Seeker bots.
+State changes are coalesced and written at most once per debounce window
+(and at shutdown), as compact JSON through a temp file + fsync + os.replace,
+so a crash mid-write never leaves a truncated state file behind.
+"""
+
+import os
+import json
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# ====================== CONFIGURATION ======================
+DEBOUNCE_SEC = 1.0  # Longest a change waits before it is written
+_MISSING = object()
+
+
+def write_json_atomic(path: str, data: Any, **dump_kwargs):
+    """Replace `path` with `data` as JSON; readers see the old or the new file, never half of one"""
+    dump_kwargs.setdefault("separators", (",", ":"))
+    payload = json.dumps(data, **dump_kwargs)  # Serialize first: a bad value never touches the disk
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class StateStore(dict):
+    """dict persisted to a JSON file, written whole when anything changed.
+
+    Top-level assignments mark the state dirty; after mutating a nested value
+    in place, call touch(). Dirty state is flushed debounce_sec after the
+    first change, on flush() / close(), and at interpreter exit.
+    """
+
+    def __init__(self, path: str, data: Optional[Dict] = None, debounce_sec: float = DEBOUNCE_SEC):
+        super().__init__(data or {})
+        self.path = path
+        self.debounce_sec = debounce_sec
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self.writes = 0
+        atexit.register(self.flush)
+
+    # ---- Change tracking ----
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self._mark()
+
+    def __delitem__(self, key):
+        with self._lock:
+            super().__delitem__(key)
+            self._mark()
+
+    def setdefault(self, key, default=None):
+        with self._lock:
+            if key not in self:
+                self[key] = default
+            return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        with self._lock:
+            for key, value in dict(*args, **kwargs).items():
+                self[key] = value
+
+    def pop(self, key, default=_MISSING):
+        with self._lock:
+            if key in self:
+                value = super().pop(key)
+                self._mark()
+                return value
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+    def touch(self):
+        """Mark the state dirty after a nested value was changed in place"""
+        with self._lock:
+            self._mark()
+
+    @property
+    def dirty(self) -> bool:
+        """True when there are changes not written yet"""
+        return self._dirty
+
+    def _mark(self):
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(self.debounce_sec, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # ---- Persistence ----
+    def flush(self) -> bool:
+        """Write the state now if anything changed; True when a write happened"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return False
+            self._dirty = False
+            try:
+                write_json_atomic(self.path, dict(self))
+            except Exception as e:
+                self._dirty = True  # Retried on the next change or flush
+                logger.error(f"Failed to save state {self.path}: {e}")
+                return False
+            self.writes += 1
+            return True
+
+    def close(self):
+        """Final flush (shutdown)"""
+        self.flush()
+        atexit.unregister(self.flush)
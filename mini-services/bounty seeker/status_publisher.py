@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Change-aware status publishing for the Bounty Seeker website feed.
+Each user-facing top-level section of the status payload is hashed; the
+status file is only rewritten when one of them changed, and the signal
+server is sent just the changed sections (with a periodic full snapshot to
+resync it).
+"""
+
+import json
+import time
+import hashlib
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from state_store import write_json_atomic
+
+# ====================== CONFIGURATION ======================
+FULL_SYNC_SEC = 300  # Send the whole payload at least this often (signal server restarts)
+
+
+def section_hash(value: Any) -> str:
+    """Stable digest of one JSON section"""
+    raw = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class StatusPublisher:
+    """Writes the status file and webhook updates only for sections that changed.
+
+    `send(data) -> bool` delivers a webhook message; a failed delivery makes
+    the next publish a full snapshot. Only the `tracked` sections (all when
+    None) are compared; the rest, e.g. scan timestamps, ride along with
+    every write and delta but never trigger one.
+    """
+
+    def __init__(self, path: str, send: Callable[[Dict], bool], update_type: str,
+                 tracked: Optional[Iterable[str]] = None, full_sync_sec: int = FULL_SYNC_SEC):
+        self.path = path
+        self.send = send
+        self.update_type = update_type
+        self.tracked = frozenset(tracked) if tracked is not None else None
+        self.full_sync_sec = full_sync_sec
+        self._hashes: Dict[str, str] = {}
+        self._last_full = 0.0
+        self.writes = 0
+        self.skipped = 0
+
+    def publish(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Publish a full status payload; returns the sections that changed"""
+        hashes = {
+            key: section_hash(value) for key, value in payload.items()
+            if self.tracked is None or key in self.tracked
+        }
+        changed = {key: payload[key] for key, digest in hashes.items() if self._hashes.get(key) != digest}
+        removed = [key for key in self._hashes if key not in hashes]
+        now = time.time()
+        full_sync_due = now - self._last_full >= self.full_sync_sec
+        if not changed and not removed:
+            # Nothing to write, but keep resyncing a signal server that may have restarted
+            if full_sync_due and self.send({"type": self.update_type, "payload": payload}):
+                self._last_full = now
+            self.skipped += 1
+            return {}
+
+        write_json_atomic(self.path, payload)
+        self._hashes = hashes
+        self.writes += 1
+
+        if full_sync_due or removed:
+            if self.send({"type": self.update_type, "payload": payload}):
+                self._last_full = now
+        else:
+            delta = {key: value for key, value in payload.items() if key in changed or key not in hashes}
+            if not self.send({"type": self.update_type, "delta": True, "payload": delta}):
+                self._last_full = 0.0  # Missed a delta: resync with a full snapshot next time
+        return changed
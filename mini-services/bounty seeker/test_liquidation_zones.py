@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests pinning v5's clustered liquidation zones to the per-candle scan they
+replaced (copied below as the reference).
+
+    python -m pytest "mini-services/bounty seeker/test_liquidation_zones.py"
+"""
+
+import importlib
+import os
+import sys
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+# ---- Reference implementation (v5 before clustering) ----
+def old_detect_liquidation_zones(highs: List[float], lows: List[float], closes: List[float],
+                                 volumes: List[float], timeframe: str = "1h") -> Dict:
+    if len(highs) < 20:
+        return {"levels": [], "importance": []}
+
+    avg_volume = np.mean(volumes[-20:])
+    liquidation_levels = []
+    importance_scores = []
+
+    for i in range(-min(50, len(highs)), 0):
+        vol_ratio = volumes[i] / avg_volume if avg_volume > 0 else 0
+        wick_lower = min(closes[i], (highs[i] + lows[i]) / 2) - lows[i]
+        wick_upper = highs[i] - max(closes[i], (highs[i] + lows[i]) / 2)
+        total_range = highs[i] - lows[i]
+
+        if total_range == 0:
+            continue
+
+        wick_ratio = max(wick_lower, wick_upper) / total_range
+
+        if vol_ratio > 2.0 and wick_ratio > 0.4:
+            if wick_lower > wick_upper:
+                level = lows[i]
+            else:
+                level = highs[i]
+            liquidation_levels.append(level)
+            importance_scores.append(min(100, (vol_ratio - 2.0) * 20 + wick_ratio * 30))
+
+    return {"levels": liquidation_levels, "importance": importance_scores}
+
+
+def old_check_proximity(price: float, liquidation_levels: List[float],
+                        importance_scores: List[float], threshold_pct: float = 1.0) -> Tuple[bool, float]:
+    if not liquidation_levels:
+        return False, 0.0
+    for level, importance in zip(liquidation_levels, importance_scores):
+        distance_pct = abs(price - level) / price * 100
+        if distance_pct <= threshold_pct:
+            return True, importance
+    return False, 0.0
+
+
+# ---- Fixtures ----
+@pytest.fixture
+def v5(tmp_path, monkeypatch):
+    # v5 creates its data directory (../../public/data) relative to the working directory on import
+    workdir = tmp_path / "run" / "bot"
+    workdir.mkdir(parents=True)
+    monkeypatch.chdir(workdir)
+    return importlib.import_module("bounty_seeker_v5")
+
+
+def hourly_candles(rng: np.random.Generator, bars: int = 200):
+    """1h-shaped series: random-walk closes, exponential wicks, lognormal volume with spikes"""
+    vol = rng.choice([0.003, 0.01, 0.02])
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, vol, bars)))
+    opens = np.r_[closes[0], closes[:-1]]
+    highs = np.maximum(opens, closes) * (1 + rng.exponential(vol * 0.6, bars))
+    lows = np.minimum(opens, closes) * (1 - rng.exponential(vol * 0.6, bars))
+    volumes = rng.lognormal(0, 0.8, bars)
+    return list(highs), list(lows), list(closes), list(volumes)
+
+
+def proximity(detect, check, series):
+    highs, lows, closes, volumes = series
+    zones = detect(highs, lows, closes, volumes, "1h")
+    return check(closes[-1], zones["levels"], zones["importance"], 1.0)
+
+
+# ---- Tests ----
+def test_unclustered_levels_match_old_scan(v5, monkeypatch):
+    monkeypatch.setattr(v5, "LIQUIDATION_CLUSTER_PCT", 0.0)  # Only identical levels merge
+    rng = np.random.default_rng(14)
+    for _ in range(500):
+        series = hourly_candles(rng)
+        old = old_detect_liquidation_zones(*series)
+        new = v5.detect_liquidation_zones(*series)
+        np.testing.assert_allclose(sorted(set(old["levels"])), new["levels"])
+        assert sum(new["counts"]) == len(old["levels"])
+
+        old_near, _ = proximity(old_detect_liquidation_zones, old_check_proximity, series)
+        new_near, _ = proximity(v5.detect_liquidation_zones, v5.check_proximity_to_liquidation, series)
+        assert new_near == old_near
+
+
+def test_clustering_rarely_flips_near_liquidation(v5):
+    # Documented behaviour change: proximity is measured to the merged zone, not its members
+    rng = np.random.default_rng(25)
+    near = flips = 0
+    for _ in range(3000):
+        series = hourly_candles(rng)
+        old_near, _ = proximity(old_detect_liquidation_zones, old_check_proximity, series)
+        new_near, _ = proximity(v5.detect_liquidation_zones, v5.check_proximity_to_liquidation, series)
+        near += old_near or new_near
+        flips += old_near != new_near
+    assert near > 1000
+    assert flips / near < 0.01
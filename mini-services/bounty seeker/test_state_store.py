@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for state_store: debounced writes and atomic replacement.
+
+    python -m pytest "mini-services/bounty seeker/test_state_store.py"
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from state_store import StateStore, write_json_atomic
+
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_changes_are_coalesced_into_one_write(tmp_path):
+    path = str(tmp_path / "state.json")
+    state = StateStore(path, {"watchlist": []}, debounce_sec=60)
+    state["last_scan_time"] = "10:00"
+    state["watchlist"].append("BTC/USDT")
+    state.touch()
+    state.setdefault("signals", 0)
+    assert state.dirty and not os.path.exists(path)
+
+    assert state.flush()
+    assert read(path) == {"watchlist": ["BTC/USDT"], "last_scan_time": "10:00", "signals": 0}
+    assert state.writes == 1 and not state.dirty
+    assert not state.flush()  # Nothing new to write
+    state.close()
+
+
+def test_close_writes_pending_changes(tmp_path):
+    path = str(tmp_path / "state.json")
+    state = StateStore(path, debounce_sec=60)
+    state["paper_balance"] = 1000.0
+    state.close()
+    assert read(path) == {"paper_balance": 1000.0}
+
+
+def test_failed_serialization_keeps_old_file(tmp_path):
+    path = str(tmp_path / "state.json")
+    write_json_atomic(path, {"ok": True})
+    with pytest.raises(TypeError):
+        write_json_atomic(path, {"bad": object()})
+    assert read(path) == {"ok": True}
+    assert os.listdir(tmp_path) == ["state.json"]
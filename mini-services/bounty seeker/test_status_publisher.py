@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for status_publisher.StatusPublisher change detection.
+
+    python -m pytest "mini-services/bounty seeker/test_status_publisher.py"
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from status_publisher import StatusPublisher
+
+
+class Webhook:
+    """Records sent messages; `ok` is what the signal server answers"""
+
+    def __init__(self):
+        self.sent = []
+        self.ok = True
+
+    def __call__(self, data):
+        self.sent.append(data)
+        return self.ok
+
+
+def make_publisher(tmp_path, webhook):
+    path = str(tmp_path / "status.json")
+    return StatusPublisher(path, webhook, "bounty_seeker_update", tracked=("status", "open_trades"))
+
+
+def test_untracked_sections_alone_do_not_publish(tmp_path):
+    webhook = Webhook()
+    publisher = make_publisher(tmp_path, webhook)
+    publisher.publish({"status": "ACTIVE", "open_trades": [], "next_scan_time": "10:00"})
+    assert publisher.writes == 1 and len(webhook.sent) == 1
+
+    assert publisher.publish({"status": "ACTIVE", "open_trades": [], "next_scan_time": "10:30"}) == {}
+    assert publisher.writes == 1 and publisher.skipped == 1
+    assert len(webhook.sent) == 1
+
+
+def test_tracked_change_sends_delta_with_untracked_sections(tmp_path):
+    webhook = Webhook()
+    publisher = make_publisher(tmp_path, webhook)
+    publisher.publish({"status": "ACTIVE", "open_trades": [], "next_scan_time": "10:00"})
+
+    payload = {"status": "ACTIVE", "open_trades": [{"symbol": "BTC/USDT"}], "next_scan_time": "10:30"}
+    assert publisher.publish(payload) == {"open_trades": [{"symbol": "BTC/USDT"}]}
+    assert webhook.sent[-1] == {
+        "type": "bounty_seeker_update",
+        "delta": True,
+        "payload": {"open_trades": [{"symbol": "BTC/USDT"}], "next_scan_time": "10:30"},
+    }
+    with open(publisher.path) as f:
+        assert json.load(f) == payload
+
+
+def test_full_sync_when_due_or_after_failed_delta(tmp_path):
+    webhook = Webhook()
+    publisher = make_publisher(tmp_path, webhook)
+    publisher.publish({"status": "ACTIVE", "open_trades": []})
+
+    webhook.ok = False
+    publisher.publish({"status": "SCANNING", "open_trades": []})
+    assert webhook.sent[-1]["delta"]
+
+    webhook.ok = True
+    publisher.publish({"status": "SCANNING", "open_trades": []})  # Unchanged, but a resync is owed
+    assert webhook.sent[-1] == {"type": "bounty_seeker_update", "payload": {"status": "SCANNING", "open_trades": []}}
+
+    publisher.publish({"status": "SCANNING", "open_trades": []})
+    assert len(webhook.sent) == 3
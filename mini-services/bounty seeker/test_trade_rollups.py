@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the v5 trade rollup migrations: the daily and all-time rollups
+must match the closed trades they summarize, flat closes included.
+
+    python -m pytest "mini-services/bounty seeker/test_trade_rollups.py"
+"""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from db import Database
+
+EXIT_TIME = "2026-03-02T10:00:00"
+EXIT_DATE = 20260302
+PNLS = [12.5, -4.0, 0.0, None, 3.0, 0.0]
+
+
+@pytest.fixture
+def v5(tmp_path, monkeypatch):
+    # v5 creates its data directory (../../public/data) relative to the working directory on import
+    workdir = tmp_path / "run" / "bot"
+    workdir.mkdir(parents=True)
+    monkeypatch.chdir(workdir)
+    return importlib.import_module("bounty_seeker_v5")
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = Database(str(tmp_path / "trades.db"))
+    yield db
+    db.close()
+
+
+def create_trades_table(db):
+    db.execute('''
+        CREATE TABLE trades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            symbol TEXT NOT NULL,
+            exit_time TEXT,
+            pnl_usd REAL,
+            status TEXT DEFAULT 'open'
+        )
+    ''')
+
+
+def open_trades(db, count):
+    return [db.execute("INSERT INTO trades (symbol) VALUES ('BTC/USDT')").lastrowid for _ in range(count)]
+
+
+def close_trades(db, ids, pnls):
+    for trade_id, pnl in zip(ids, pnls):
+        db.execute(
+            "UPDATE trades SET exit_time = ?, exit_date = ?, pnl_usd = ?, status = 'closed' WHERE id = ?",
+            (EXIT_TIME, EXIT_DATE, pnl, trade_id),
+        )
+
+
+def expected(pnls):
+    priced = [p for p in pnls if p is not None]
+    return (len(pnls), sum(p > 0 for p in priced), sum(p <= 0 for p in priced), sum(priced))
+
+
+def rollups(db):
+    daily = db.query_one("SELECT trades, wins, losses, pnl_usd FROM trade_rollup_daily WHERE exit_date = ?",
+                         (EXIT_DATE,))
+    total = db.query_one("SELECT trades, wins, losses, pnl_usd FROM trade_rollup_total WHERE id = 1")
+    return daily, total
+
+
+def test_trigger_counts_flat_close_as_loss_in_both_rollups(v5, db):
+    create_trades_table(db)
+    assert db.migrate(v5.TRADES_MIGRATIONS) == len(v5.TRADES_MIGRATIONS)
+    close_trades(db, open_trades(db, len(PNLS)), PNLS)
+
+    daily, total = rollups(db)
+    assert daily == pytest.approx(expected(PNLS))
+    assert total == pytest.approx(expected(PNLS))
+
+
+def test_upgrade_recomputes_existing_rollups(v5, db):
+    create_trades_table(db)
+    before, after = PNLS[:3], PNLS[3:]
+    ids = open_trades(db, len(PNLS))
+    db.execute(  # Closed before the rollups (and exit_date) existed
+        "UPDATE trades SET exit_time = ?, pnl_usd = ?, status = 'closed' WHERE id = ?", (EXIT_TIME, before[0], ids[0])
+    )
+
+    db.migrate(v5.TRADES_MIGRATIONS[:2])
+    close_trades(db, ids[1:3], before[1:])  # Closed under the version 2 trigger
+    daily, _ = rollups(db)
+    assert daily[2] == 1  # Version 2 still counted the flat close as neither win nor loss
+
+    db.migrate(v5.TRADES_MIGRATIONS)
+    close_trades(db, ids[3:], after)
+    daily, total = rollups(db)
+    assert daily == pytest.approx(expected(PNLS))
+    assert total == pytest.approx(expected(PNLS))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulk ticker snapshot for the Bounty Seeker bots.
+One fetch_tickers call covers every open trade, the majors and the watchlist;
+the result is cached for a few seconds so every caller in a loop shares it.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+TICKER_TTL_SECONDS = 5.0  # How long one snapshot is served before refetching
+
+
+def ticker_price(ticker: Optional[Dict]) -> float:
+    """Last traded price from a ccxt ticker (0.0 when unavailable)"""
+    if not ticker:
+        return 0.0
+    try:
+        return float(ticker.get("last") or ticker.get("close") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class TickerSnapshot:
+    """Short-TTL cache of exchange.fetch_tickers() shared across the bot"""
+
+    def __init__(self, exchange, ttl: float = TICKER_TTL_SECONDS):
+        self.exchange = exchange
+        self.ttl = ttl
+        self._tickers: Dict[str, Dict] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self.rate_limiter = get_rate_limiter()
+
+    def _fetch_ticker(self, symbol: str) -> Dict:
+        return self.rate_limiter.ccxt_call(self.exchange, "ticker", self.exchange.fetch_ticker, symbol)
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.ttl
+
+    def all(self, force: bool = False) -> Dict[str, Dict]:
+        """Every ticker on the exchange, refetched at most once per TTL"""
+        with self._lock:
+            if force or self._is_stale() or not self._tickers:
+                self._tickers = self.rate_limiter.ccxt_call(
+                    self.exchange, "tickers", self.exchange.fetch_tickers
+                )
+                self._fetched_at = time.monotonic()
+            return self._tickers
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Ticker for one symbol, falling back to fetch_ticker if the bulk call missed it"""
+        ticker = self.all().get(symbol)
+        if ticker is None:
+            ticker = self._fetch_ticker(symbol)
+            with self._lock:
+                self._tickers[symbol] = ticker
+        return ticker
+
+    def last_prices(self, symbols: Iterable[str]) -> Dict[str, float]:
+        """symbol -> last price for every symbol with a usable price"""
+        symbols = list(symbols)
+        if not symbols:
+            return {}
+        try:
+            tickers = self.all()
+        except Exception as e:
+            logger.warning(f"⚠️ Bulk ticker fetch failed, falling back to per-symbol tickers: {e}")
+            tickers = {}
+
+        prices: Dict[str, float] = {}
+        for symbol in symbols:
+            ticker = tickers.get(symbol)
+            if ticker is None:
+                try:
+                    ticker = self._fetch_ticker(symbol)
+                except Exception as e:
+                    logger.error(f"Failed to fetch ticker for {symbol}: {e}")
+                    continue
+            price = ticker_price(ticker)
+            if price > 0:
+                prices[symbol] = price
+        return prices
@@ -0,0 +1,7 @@
+"""
+Shared infrastructure for the SnipersRUs mini-service bots.
+
+Bots live in sibling folders and add the mini-services directory to sys.path:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from shared.metadata_cache import load_markets_cached
+"""
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Pooled keep-alive HTTP client shared by every bot in the process.
+
+One requests.Session with per-host connection pools, so OKX REST polling,
+Discord webhooks and the local signal server reuse open TLS connections
+instead of paying a handshake on every call.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ====================== CONFIGURATION ======================
+# URL prefix -> connections kept open (sized to the threads that hit each host)
+POOL_SIZES: Dict[str, int] = {
+    "https://www.okx.com": 32,      # Hub / fetcher worker pools
+    "https://discord.com": 4,       # Webhooks are sent one batch at a time
+    "https://discordapp.com": 4,
+    "http://localhost:3001": 2,     # Local signal server
+    "http://127.0.0.1:3001": 2,
+}
+DEFAULT_POOL_SIZE = 10
+CONNECT_RETRIES = 2  # Only connection setup is retried; rate-limit handling stays with the caller
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "srus-bots/1.0",
+}
+
+
+def _adapter(pool_size: int) -> HTTPAdapter:
+    retry = Retry(total=None, connect=CONNECT_RETRIES, read=0, status=0, redirect=3, backoff_factor=0.3)
+    return HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=False, max_retries=retry)
+
+
+def create_session(pool_sizes: Optional[Dict[str, int]] = None) -> requests.Session:
+    """Session with keep-alive, gzip and a sized connection pool per host"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", _adapter(DEFAULT_POOL_SIZE))
+    session.mount("http://", _adapter(DEFAULT_POOL_SIZE))
+    # requests picks the longest matching prefix, so these win over the defaults
+    for prefix, size in (pool_sizes or POOL_SIZES).items():
+        session.mount(prefix, _adapter(size))
+    return session
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """The process-wide pooled session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return get_session().post(url, **kwargs)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Versioned on-disk cache for exchange market / instrument metadata.
+
+Startup reads the cached copy (well under a second) instead of blocking on
+load_markets() or the instruments endpoint. Stale entries are still served
+immediately and revalidated on a background thread.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from shared.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# ====================== CONFIGURATION ======================
+CACHE_DIR = os.getenv(
+    "SRUS_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"),
+)
+CACHE_VERSION = 1  # Bump when the cached payload format changes
+METADATA_TTL_SECONDS = 6 * 3600  # Markets / instruments rarely change intraday
+
+
+class MetadataCache:
+    """One JSON file holding {version, saved_at, data} with TTL + background revalidation"""
+
+    def __init__(self, name: str, ttl: float = METADATA_TTL_SECONDS,
+                 version: int = CACHE_VERSION, cache_dir: str = CACHE_DIR):
+        self.name = name
+        self.ttl = ttl
+        self.version = version
+        self.path = os.path.join(cache_dir, f"{name}.json")
+        self._refreshing = threading.Lock()
+
+    def read(self) -> Optional[Tuple[Any, float]]:
+        """(data, age_seconds) or None if missing, unreadable or from another version"""
+        try:
+            with open(self.path, "r") as f:
+                entry = json.load(f)
+            if entry.get("version") != self.version:
+                return None
+            return entry["data"], time.time() - float(entry["saved_at"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable metadata cache {self.path}: {e}")
+            return None
+
+    def write(self, data: Any):
+        """Atomically replace the cache file"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            entry = {"version": self.version, "saved_at": time.time(), "data": data}
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f, separators=(",", ":"), default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write metadata cache {self.path}: {e}")
+
+    def load(self, fetch: Callable[[], Any],
+             on_refresh: Optional[Callable[[Any], None]] = None) -> Any:
+        """Cached data if present (revalidating in the background when stale), else fetch now"""
+        cached = self.read()
+        if cached is None:
+            data = fetch()
+            self.write(data)
+            return data
+
+        data, age = cached
+        if age > self.ttl:
+            logger.info(f"🔄 {self.name} metadata is {age / 3600:.1f}h old, refreshing in background")
+            self.revalidate(fetch, on_refresh)
+        return data
+
+    def revalidate(self, fetch: Callable[[], Any],
+                   on_refresh: Optional[Callable[[Any], None]] = None):
+        """Fetch fresh data on a daemon thread, then persist it and hand it to on_refresh"""
+        if not self._refreshing.acquire(blocking=False):
+            return  # Already refreshing
+
+        def worker():
+            try:
+                data = fetch()
+                self.write(data)
+                if on_refresh:
+                    on_refresh(data)
+                logger.info(f"✅ {self.name} metadata refreshed")
+            except Exception as e:
+                logger.warning(f"⚠️ Background refresh of {self.name} failed: {e}")
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=worker, name=f"refresh-{self.name}", daemon=True).start()
+
+
+# ====================== CCXT MARKETS ======================
+def _fetch_ccxt_markets(exchange) -> Dict[str, Any]:
+    """Raw fetch_markets / fetch_currencies output, as load_markets() would use it"""
+    limiter = get_rate_limiter()
+    currencies = None
+    if exchange.has.get("fetchCurrencies") is True:
+        try:
+            currencies = limiter.ccxt_call(exchange, "instruments", exchange.fetch_currencies)
+        except Exception as e:
+            logger.debug(f"{exchange.id} fetch_currencies failed: {e}")
+    markets = limiter.ccxt_call(exchange, "instruments", exchange.fetch_markets)
+    return {"markets": markets, "currencies": currencies}
+
+
+def load_markets_cached(exchange, ttl: float = METADATA_TTL_SECONDS) -> Dict:
+    """Drop-in for exchange.load_markets() backed by the on-disk metadata cache"""
+    market_type = exchange.options.get("defaultType", "default")
+    cache = MetadataCache(f"ccxt_{exchange.id}_{market_type}_markets", ttl)
+
+    def apply(payload: Dict[str, Any]):
+        exchange.set_markets(payload["markets"], payload.get("currencies"))
+
+    payload = cache.load(lambda: _fetch_ccxt_markets(exchange), on_refresh=apply)
+    apply(payload)
+    return exchange.markets
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Process-wide adaptive token-bucket rate limiter for exchange REST calls.
+
+Buckets are keyed by (exchange, endpoint class) and sized from the exchanges'
+published limits. A 429 / OKX 50011 halves the bucket's rate and pauses it;
+clean responses grow the rate back toward the published limit (AIMD).
+Rate-limit headers (Retry-After, X-RateLimit-*, Binance used-weight) pause
+the bucket before the exchange has to reject us.
+
+Set SRUS_RATE_LIMIT_DIR to share buckets between processes (e.g. the short
+hunter fleet): bucket state then lives in small files guarded by flock.
+"""
+
+import os
+import json
+import time
+import fcntl
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import ccxt
+except ImportError:  # Short hunter bots talk to OKX REST directly
+    ccxt = None
+
+logger = logging.getLogger(__name__)
+
+# ====================== CONFIGURATION ======================
+# (exchange, endpoint class) -> (requests, per seconds); "*" matches any endpoint
+DEFAULT_LIMITS: Dict[Tuple[str, str], Tuple[float, float]] = {
+    ("okx", "candles"): (40, 2.0),      # GET /market/candles: 40 req / 2s per IP
+    ("okx", "tickers"): (20, 2.0),      # GET /market/tickers
+    ("okx", "ticker"): (20, 2.0),       # GET /market/ticker
+    ("okx", "instruments"): (20, 2.0),  # GET /public/instruments
+    ("okx", "*"): (20, 2.0),
+    ("binance", "*"): (1200, 60.0),     # ~2400 weight / min, most market calls weigh 1-2
+    ("binanceusdm", "*"): (1200, 60.0),
+    ("mexc", "*"): (20, 2.0),
+    ("bybit", "*"): (50, 5.0),          # 600 req / 5s per IP, kept conservative
+    ("bitget", "*"): (20, 1.0),
+    ("kraken", "*"): (1, 1.0),
+    ("*", "*"): (10, 1.0),
+}
+SAFETY_FACTOR = 0.95  # Run just under the published limit
+MIN_RATE_FRACTION = 0.1  # Never back off below 10% of the published rate
+RECOVERY_STEP = 0.05  # Fraction of the published rate regained per clean window
+RECOVERY_WINDOW = 50  # Clean responses between recovery steps
+DEFAULT_PENALTY_SEC = 2.0  # Pause after a 429 without Retry-After
+BINANCE_WEIGHT_LIMIT = 2400
+RATE_LIMIT_DIR = os.getenv("SRUS_RATE_LIMIT_DIR")  # Enables cross-process buckets
+
+
+class TokenBucket:
+    """Adaptive token bucket (thread-safe)"""
+
+    def __init__(self, name: str, requests: float, per_seconds: float):
+        self.name = name
+        self.base_rate = requests / per_seconds * SAFETY_FACTOR
+        self.capacity = max(1.0, requests * SAFETY_FACTOR)
+        self._lock = threading.Lock()
+        self._state = {
+            "tokens": self.capacity,
+            "rate": self.base_rate,
+            "updated": time.time(),
+            "paused_until": 0.0,
+            "clean": 0,
+        }
+
+    # State access is overridden by FileTokenBucket for cross-process sharing
+    def _transact(self, fn: Callable[[Dict], Any]) -> Any:
+        with self._lock:
+            return fn(self._state)
+
+    @staticmethod
+    def _refill(state: Dict, now: float, capacity: float):
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(capacity, state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+
+    def _try_take(self, cost: float) -> float:
+        """Take tokens if available; otherwise return seconds to wait"""
+        def take(state: Dict) -> float:
+            now = time.time()
+            if now < state["paused_until"]:
+                return state["paused_until"] - now
+            self._refill(state, now, self.capacity)
+            if state["tokens"] >= cost:
+                state["tokens"] -= cost
+                return 0.0
+            return (cost - state["tokens"]) / state["rate"]
+        return self._transact(take)
+
+    def acquire(self, cost: float = 1.0):
+        """Block until the bucket can pay for this request"""
+        while True:
+            wait = self._try_take(cost)
+            if wait <= 0:
+                return
+            time.sleep(min(wait, 5.0))
+
+    def penalize(self, pause: Optional[float] = None):
+        """Multiplicative decrease + pause after the exchange rejected us"""
+        pause = DEFAULT_PENALTY_SEC if pause is None else pause
+
+        def apply(state: Dict):
+            now = time.time()
+            state["rate"] = max(self.base_rate * MIN_RATE_FRACTION, state["rate"] * 0.5)
+            state["tokens"] = 0.0
+            state["updated"] = now
+            state["paused_until"] = max(state["paused_until"], now + pause)
+            state["clean"] = 0
+            return state["rate"]
+        rate = self._transact(apply)
+        logger.warning(f"⏳ Rate limited on {self.name}: pausing {pause:.1f}s, rate now {rate:.1f} req/s")
+
+    def pause(self, seconds: float):
+        """Hold the bucket without changing its rate (headers said we're nearly out)"""
+        def apply(state: Dict):
+            state["paused_until"] = max(state["paused_until"], time.time() + seconds)
+        self._transact(apply)
+
+    def record_success(self):
+        """Additive increase back toward the published rate"""
+        def apply(state: Dict):
+            if state["rate"] >= self.base_rate:
+                return
+            state["clean"] += 1
+            if state["clean"] >= RECOVERY_WINDOW:
+                state["clean"] = 0
+                state["rate"] = min(self.base_rate, state["rate"] + self.base_rate * RECOVERY_STEP)
+        self._transact(apply)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared by every process using the same file"""
+
+    def __init__(self, name: str, requests: float, per_seconds: float, directory: str):
+        super().__init__(name, requests, per_seconds)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{name.replace('/', '_')}.bucket")
+
+    def _transact(self, fn: Callable[[Dict], Any]) -> Any:
+        with self._lock:
+            with open(self.path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    raw = f.read()
+                    state = dict(self._state)
+                    if raw:
+                        try:
+                            state.update(json.loads(raw))
+                        except ValueError:
+                            pass
+                    result = fn(state)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                    self._state = state
+                    return result
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter:
+    """Registry of buckets keyed by (exchange, endpoint class)"""
+
+    def __init__(self, limits: Optional[Dict[Tuple[str, str], Tuple[float, float]]] = None,
+                 shared_dir: Optional[str] = RATE_LIMIT_DIR):
+        self.limits = dict(DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self.shared_dir = shared_dir
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+        # ccxt instance id -> [calls in flight, calls started]; last_response_headers is per
+        # instance, so it only describes our call when no other call overlapped it
+        self._in_flight: Dict[int, List[int]] = {}
+
+    def _limit_for(self, exchange: str, endpoint: str) -> Tuple[Tuple[str, str], Tuple[float, float]]:
+        for key in ((exchange, endpoint), (exchange, "*"), ("*", "*")):
+            if key in self.limits:
+                return key, self.limits[key]
+        return ("*", "*"), (10, 1.0)
+
+    def bucket(self, exchange: str, endpoint: str = "*") -> TokenBucket:
+        exchange = exchange.lower()
+        key, (requests, per_seconds) = self._limit_for(exchange, endpoint)
+        # Endpoints without their own limit share the exchange-wide bucket
+        bucket_key = (exchange, key[1])
+        with self._lock:
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                name = f"{exchange}/{key[1] if key[1] != '*' else 'default'}"
+                if self.shared_dir:
+                    bucket = FileTokenBucket(name, requests, per_seconds, self.shared_dir)
+                else:
+                    bucket = TokenBucket(name, requests, per_seconds)
+                self._buckets[bucket_key] = bucket
+            return bucket
+
+    def acquire(self, exchange: str, endpoint: str = "*", cost: float = 1.0):
+        self.bucket(exchange, endpoint).acquire(cost)
+
+    def penalize(self, exchange: str, endpoint: str = "*", retry_after: Optional[float] = None):
+        self.bucket(exchange, endpoint).penalize(retry_after)
+
+    def observe_headers(self, exchange: str, endpoint: str, headers: Optional[Dict]) -> bool:
+        """Adapt to rate-limit headers; returns True if the bucket was paused"""
+        if not headers:
+            return False
+        h = {str(k).lower(): v for k, v in headers.items()}
+        bucket = self.bucket(exchange, endpoint)
+        try:
+            remaining = h.get("x-ratelimit-remaining") or h.get("x-bapi-limit-status")
+            if remaining is not None and float(remaining) <= 0:
+                reset = h.get("x-ratelimit-reset") or h.get("x-bapi-limit-reset-timestamp")
+                wait = 1.0
+                if reset is not None:
+                    reset = float(reset)
+                    # Either seconds-until-reset or an epoch (s or ms)
+                    if reset > 1e12:
+                        wait = reset / 1000 - time.time()
+                    elif reset > 1e9:
+                        wait = reset - time.time()
+                    else:
+                        wait = reset
+                bucket.pause(max(0.1, min(wait, 60.0)))
+                return True
+            used = h.get("x-mbx-used-weight-1m")
+            if used is not None and float(used) >= BINANCE_WEIGHT_LIMIT * SAFETY_FACTOR:
+                bucket.pause(60.0 - time.time() % 60)  # Weight resets on the minute
+                return True
+        except (TypeError, ValueError):
+            pass
+        return False
+
+    def observe_response(self, exchange: str, endpoint: str, resp) -> bool:
+        """Adapt to a requests.Response; returns True if we were rate limited"""
+        limited = resp.status_code == 429
+        if not limited and resp.status_code >= 400:
+            try:
+                limited = str(resp.json().get("code")) == "50011"
+            except Exception:
+                pass
+        if limited:
+            retry_after = resp.headers.get("Retry-After")
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None
+            self.penalize(exchange, endpoint, retry_after)
+            return True
+        self.observe_headers(exchange, endpoint, resp.headers)
+        self.bucket(exchange, endpoint).record_success()
+        return False
+
+    def _begin_call(self, exchange) -> Tuple[int, bool]:
+        with self._lock:
+            calls = self._in_flight.setdefault(id(exchange), [0, 0])
+            calls[0] += 1
+            calls[1] += 1
+            return calls[1], calls[0] == 1
+
+    def _end_call(self, exchange, started: int, alone: bool) -> bool:
+        """True if no other call on this instance overlapped ours (its headers are ours)"""
+        with self._lock:
+            calls = self._in_flight[id(exchange)]
+            serialized = alone and calls[1] == started
+            calls[0] -= 1
+            if not calls[0]:
+                del self._in_flight[id(exchange)]
+            return serialized
+
+    def ccxt_call(self, exchange, endpoint: str, method: Callable, *args, **kwargs):
+        """Run a ccxt call through the bucket, adapting to 429s and response headers.
+
+        Headers are only read when no concurrent call shared the ccxt instance
+        (e.g. OHLCVFetcher workers); 429s adapt the bucket either way.
+        """
+        self.acquire(exchange.id, endpoint)
+        started, alone = self._begin_call(exchange)
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            self._end_call(exchange, started, alone)
+            if ccxt is not None and isinstance(e, (ccxt.RateLimitExceeded, ccxt.DDoSProtection)):
+                self.penalize(exchange.id, endpoint)
+            raise
+        if self._end_call(exchange, started, alone):
+            self.observe_headers(exchange.id, endpoint, getattr(exchange, "last_response_headers", None))
+        self.bucket(exchange.id, endpoint).record_success()
+        return result
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """The process-wide limiter every fetch path shares"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Fixed-size float64 ring buffer with zero-copy ordered views.
+
+Every value is written twice, at i and i + capacity, so the newest `size`
+samples always sit in one contiguous slice: appends are O(1) and reading
+the window in time order never copies.
+"""
+
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+
+class RingBuffer:
+    """Preallocated circular buffer of scalars, or of rows when width is given"""
+
+    __slots__ = ("capacity", "width", "_data", "_head", "_size")
+
+    def __init__(self, capacity: int, width: Optional[int] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.width = width
+        shape = (2 * capacity,) if width is None else (2 * capacity, width)
+        self._data = np.zeros(shape, dtype=np.float64)
+        self._head = 0  # Next write position in [0, capacity)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index):
+        return self.view()[index]
+
+    def __array__(self, dtype=None, copy=None):
+        view = self.view()
+        return view.astype(dtype) if dtype is not None else view
+
+    @property
+    def full(self) -> bool:
+        return self._size == self.capacity
+
+    def append(self, value: Union[float, Sequence[float]]):
+        """Add one sample, overwriting the oldest once full"""
+        self._data[self._head] = value
+        self._data[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values: Iterable):
+        for value in values:
+            self.append(value)
+
+    def view(self) -> np.ndarray:
+        """Oldest-first read-only view of the stored samples (no copy)"""
+        start = (self._head - self._size) % self.capacity
+        view = self._data[start:start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def last(self, n: int) -> np.ndarray:
+        """Read-only view of the newest n samples"""
+        return self.view()[-n:] if n > 0 else self.view()[:0]
+
+    def clear(self):
+        self._head = 0
+        self._size = 0
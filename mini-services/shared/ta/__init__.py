@@ -0,0 +1,39 @@
+"""
+Technical indicators shared by the bots.
+
+    from shared.ta import rsi, atr, market_snapshot
+
+Single-series indicators (RSI / Wilder RSI, ATR, VWAP bands, volume spikes, Golden Pocket,
+SFP) live in shared.ta.core. Column-wise kernels over (symbols x bars) panels
+live in shared.ta.panel. Incremental O(1)-per-update indicators for live
+feeds live in shared.ta.streaming.
+"""
+
+from shared.ta.core import (
+    atr,
+    golden_pocket,
+    rsi,
+    rsi_series,
+    sfp_high,
+    sfp_low,
+    volume_spike,
+    vwap_bands,
+    wilder_rsi,
+    zone_distance,
+)
+from shared.ta.panel import market_snapshot, stack_candles
+
+__all__ = [
+    "atr",
+    "golden_pocket",
+    "market_snapshot",
+    "rsi",
+    "rsi_series",
+    "sfp_high",
+    "sfp_low",
+    "stack_candles",
+    "volume_spike",
+    "vwap_bands",
+    "wilder_rsi",
+    "zone_distance",
+]
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Vectorized indicators shared by every bot.
+
+One implementation per indicator, so all bots score the same candles the
+same way. Functions take NumPy arrays (oldest first); RSI also accepts a
+(symbols x bars) panel and works along the last axis. Streaming (O(1) per
+tick) equivalents live in shared.ta.streaming.
+"""
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+GP_LEVELS = (0.618, 0.65)  # Golden Pocket retracement band
+VOL_LENGTH = 20
+VOL_MULTIPLIER = 2.0
+VOL_EXTREME_MULTIPLIER = 3.5
+SFP_WICK_RATIO = 0.5  # Rejection wick must exceed this fraction of the body
+
+
+# ---- Momentum ----
+def rsi(closes: np.ndarray, period: int = RSI_PERIOD) -> Union[float, np.ndarray]:
+    """Simple-average RSI over the last `period` changes (50 without enough data).
+
+    A 1-D series gives a float; a 2-D panel gives one value per row.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.shape[-1] < period + 1:
+        return 50.0 if closes.ndim == 1 else np.full(closes.shape[:-1], 50.0)
+    deltas = np.diff(closes[..., -period - 1:], axis=-1)
+    avg_gain = np.clip(deltas, 0, None).sum(axis=-1) / period
+    avg_loss = np.clip(-deltas, 0, None).sum(axis=-1) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return float(values) if closes.ndim == 1 else values
+
+
+def wilder_rsi(closes: np.ndarray, period: int = RSI_PERIOD) -> Union[float, np.ndarray]:
+    """Wilder-smoothed RSI of the last bar over the whole series (50 without enough data).
+
+    Seeded with the mean of the first `period` changes, then smoothed with
+    alpha = 1 / period over every later change. A 1-D series gives a float;
+    a 2-D panel gives one value per row.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.shape[-1] < period + 1:
+        return 50.0 if closes.ndim == 1 else np.full(closes.shape[:-1], 50.0)
+    deltas = np.diff(closes, axis=-1)
+    steps = deltas.shape[-1] - period
+    alpha = 1.0 / period
+    decay = (1 - alpha) ** np.arange(steps - 1, -1, -1)
+
+    def smooth(values: np.ndarray) -> np.ndarray:
+        # Closed form of avg = avg * (1 - alpha) + alpha * value, applied once per later change
+        return values[..., :period].mean(axis=-1) * (1 - alpha) ** steps + alpha * (values[..., period:] @ decay)
+
+    avg_gain = smooth(np.clip(deltas, 0, None))
+    avg_loss = smooth(np.clip(-deltas, 0, None))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return float(values) if closes.ndim == 1 else values
+
+
+def rsi_series(closes: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """RSI at every bar along the last axis (NaN until `period` changes exist).
+
+    Missing closes count as no change, so NaN-padded panels keep their values.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    out = np.full(closes.shape, np.nan)
+    if closes.shape[-1] < period + 1:
+        return out
+    deltas = np.diff(closes, axis=-1)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    avg_gain = sliding_window_view(gains, period, axis=-1).mean(axis=-1)
+    avg_loss = sliding_window_view(losses, period, axis=-1).mean(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[..., period:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+# ---- Volatility ----
+def atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = ATR_PERIOD) -> float:
+    """Average True Range over the last `period` bars (0 without enough data)"""
+    if len(highs) < period + 1:
+        return 0.0
+    hi = highs[-period:]
+    lo = lows[-period:]
+    prev_close = closes[-period - 1:-1]
+    true_range = np.maximum(hi - lo, np.maximum(np.abs(hi - prev_close), np.abs(lo - prev_close)))
+    return float(true_range.mean())
+
+
+def vwap_bands(closes: np.ndarray, volumes: np.ndarray,
+               volume_weighted: bool = True) -> Tuple[Optional[float], Optional[float]]:
+    """(VWAP of closes, std of closes) for sigma bands; (None, None) without volume.
+
+    The std is volume-weighted around the VWAP, or the plain std of the closes.
+    """
+    total_volume = volumes.sum()
+    if total_volume == 0:
+        return None, None
+    vwap = float(np.dot(closes, volumes) / total_volume)
+    if volume_weighted:
+        variance = float(np.dot(volumes, (closes - vwap) ** 2) / total_volume)
+        return vwap, float(np.sqrt(variance)) if variance > 0 else 0.0
+    return vwap, float(np.std(closes))
+
+
+# ---- Volume ----
+def volume_spike(volumes: np.ndarray, length: int = VOL_LENGTH, multiplier: float = VOL_MULTIPLIER,
+                 extreme_multiplier: float = VOL_EXTREME_MULTIPLIER) -> Tuple[float, float, float, bool, bool, bool]:
+    """VPSR volume classification of the last bar.
+
+    Returns (vol_ema, vol_std, volume_ratio, is_abnormal, is_extreme, prev_was_extreme);
+    the EMA is seeded with the window's SMA and run over the same window.
+    """
+    if len(volumes) < length + 1:
+        return 0.0, 0.0, 1.0, False, False, False
+    window = volumes[-length:]
+    alpha = 2.0 / (length + 1.0)
+    decay = (1 - alpha) ** np.arange(length - 1, -1, -1)
+    vol_ema = float(window.mean() * (1 - alpha) ** length + alpha * np.dot(decay, window))
+    vol_std = float(np.std(window))
+
+    current, prev = volumes[-1], volumes[-2]
+    extreme_threshold = vol_ema + vol_std * extreme_multiplier
+    return (
+        vol_ema,
+        vol_std,
+        float(current / vol_ema) if vol_ema > 0 else 1.0,
+        bool(current > vol_ema + vol_std * multiplier),
+        bool(current > extreme_threshold),
+        bool(prev > extreme_threshold),
+    )
+
+
+# ---- Levels ----
+def golden_pocket(high: float, low: float, from_high: bool = False,
+                  levels: Tuple[float, float] = GP_LEVELS) -> Optional[Tuple[float, float]]:
+    """(lower, upper) bound of the Golden Pocket retracement of a range, measured up from
+    the low or down from the high; None for an empty range"""
+    range_size = high - low
+    if range_size <= 0:
+        return None
+    if from_high:
+        return high - range_size * levels[1], high - range_size * levels[0]
+    return low + range_size * levels[0], low + range_size * levels[1]
+
+
+def zone_distance(price: float, zone: Optional[Tuple[float, float]]) -> Tuple[bool, float]:
+    """(price inside zone, % distance to its nearest edge); (False, 100) without a zone"""
+    if zone is None:
+        return False, 100.0
+    lower, upper = zone
+    if lower <= price <= upper:
+        return True, 0.0
+    edge = lower if price < lower else upper
+    return False, abs(price - edge) / price * 100
+
+
+# ---- Patterns ----
+def sfp_low(opens: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+            wick_ratio: float = SFP_WICK_RATIO) -> bool:
+    """Swing failure at a low: lower low, higher close, and a rejection wick on the last bar"""
+    if len(closes) < 5:
+        return False
+    if not (lows[-3] > lows[-2] and closes[-2] < closes[-1]):
+        return False
+    lower_wick = min(opens[-1], closes[-1]) - lows[-1]
+    return bool(lower_wick > abs(closes[-1] - opens[-1]) * wick_ratio)
+
+
+def sfp_high(opens: np.ndarray, highs: np.ndarray, closes: np.ndarray,
+             wick_ratio: float = SFP_WICK_RATIO) -> bool:
+    """Swing failure at a high: higher high, lower close, and a rejection wick on the last bar"""
+    if len(closes) < 5:
+        return False
+    if not (highs[-3] < highs[-2] and closes[-2] > closes[-1]):
+        return False
+    upper_wick = highs[-1] - max(opens[-1], closes[-1])
+    return bool(upper_wick > abs(closes[-1] - opens[-1]) * wick_ratio)
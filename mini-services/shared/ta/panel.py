@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Cross-symbol indicator kernel.
+
+Candles for the whole universe are stacked into one (symbols x bars) panel
+and every indicator is computed for all symbols in a handful of NumPy passes
+instead of one Python loop per symbol.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from shared.ta.core import rsi, wilder_rsi  # Work row-wise on a panel
+
+# Column order of a panel row: [open, high, low, close, volume]
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(5)
+
+DEFAULT_LOOKBACK = 96  # ~24h of 15m candles
+SWEEP_WINDOW = 20
+VOL_WINDOW = 20
+VOL_ABNORMAL_MULT = 2.0
+VOL_EXTREME_MULT = 3.5
+
+
+def stack_candles(series: Dict[str, Sequence[Sequence[float]]],
+                  bars: int) -> Tuple[List[str], np.ndarray]:
+    """Align the newest `bars` [o, h, l, c, v] rows of every series with enough history.
+
+    Returns (keys, panel) where panel has shape (len(keys), bars, 5).
+    """
+    keys = [key for key, candles in series.items() if candles and len(candles) >= bars]
+    panel = np.empty((len(keys), bars, 5), dtype=np.float64)
+    for i, key in enumerate(keys):
+        panel[i] = np.asarray(series[key][-bars:], dtype=np.float64)[:, :5]
+    return keys, panel
+
+
+def vwap(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+         volumes: np.ndarray) -> np.ndarray:
+    """Typical-price VWAP per row; the last close where a row has no volume"""
+    typicals = (highs + lows + closes) / 3.0
+    vol_sum = volumes.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = (typicals * volumes).sum(axis=1) / vol_sum
+    return np.where(vol_sum > 0, values, closes[:, -1])
+
+
+def sigma_deviation(closes: np.ndarray, anchor: np.ndarray) -> np.ndarray:
+    """(last close - anchor) in population standard deviations of the closes"""
+    std = closes.std(axis=1)
+    std = np.where(std > 0, std, 1.0)
+    return (closes[:, -1] - anchor) / std
+
+
+def volume_stats(volumes: np.ndarray, window: int = VOL_WINDOW) -> Tuple[np.ndarray, np.ndarray]:
+    """(mean, population std) of the last `window` volumes per row"""
+    recent = volumes[:, -window:]
+    return recent.mean(axis=1), recent.std(axis=1)
+
+
+def sweep_high(highs: np.ndarray, closes: np.ndarray, window: int = SWEEP_WINDOW) -> np.ndarray:
+    """Last bar broke the prior `window` bars' high and closed back below it"""
+    if highs.shape[1] <= window + 1:
+        return np.zeros(highs.shape[0], dtype=bool)
+    prev_high = highs[:, -window - 1:-1].max(axis=1)
+    return (highs[:, -1] > prev_high) & (closes[:, -1] < prev_high)
+
+
+def market_snapshot(series: Dict[str, Sequence[Sequence[float]]],
+                    lookback: int = DEFAULT_LOOKBACK, wilder: bool = False) -> Dict[str, Dict]:
+    """Short Hunter market snapshot for every series with at least `lookback` candles.
+
+    RSI is the simple 14-change average, or Wilder-smoothed over the whole
+    lookback when `wilder` is set (as the v2 / v2.5 / v3 bots compute it).
+    """
+    keys, panel = stack_candles(series, lookback)
+    if not keys:
+        return {}
+
+    highs, lows = panel[:, :, HIGH], panel[:, :, LOW]
+    closes, volumes = panel[:, :, CLOSE], panel[:, :, VOLUME]
+    last_c, last_v = closes[:, -1], volumes[:, -1]
+
+    high = highs.max(axis=1)
+    low = lows.min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = np.where(low > 0, (last_c - low) / low * 100, 0.0)
+    vwaps = vwap(highs, lows, closes, volumes)
+    devs = sigma_deviation(closes, vwaps)
+    rsis = wilder_rsi(closes) if wilder else rsi(closes)
+    sweeps = sweep_high(highs, closes)
+    vol_ma, vol_std = volume_stats(volumes)
+    abnormal = last_v > vol_ma + vol_std * VOL_ABNORMAL_MULT
+    extreme = last_v > vol_ma + vol_std * VOL_EXTREME_MULT
+
+    snapshot: Dict[str, Dict] = {}
+    for i, key in enumerate(keys):
+        snapshot[key] = {
+            "price": float(last_c[i]),
+            "high": float(high[i]),
+            "low": float(low[i]),
+            "change": float(change[i]),
+            "rsi": float(rsis[i]),
+            "vwap": float(vwaps[i]),
+            "dev": round(float(devs[i]), 2),
+            "is_sweep": bool(sweeps[i]),
+            "volume": float(last_v[i]),
+            "vol_ma": float(vol_ma[i]),
+            "vol_std": float(vol_std[i]),
+            "is_abnormal_volume": bool(abnormal[i]),
+            "is_extreme_volume": bool(extreme[i]),
+        }
+    return snapshot
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Incremental indicators for live feeds.
+
+Each object is updated with one new tick or bar at a time and answers in
+O(1) (amortized for the rolling extrema), so a streamer can re-evaluate a
+symbol on every message instead of recomputing whole windows.
+"""
+
+import math
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+RESYNC_INTERVAL = 10_000  # Updates between exact recomputes of windowed sums (float drift)
+
+
+class RunningVWAP:
+    """Volume-weighted average price over the last `window` samples"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._pv = 0.0
+        self._volume = 0.0
+        self._price = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def update(self, price: float, volume: float):
+        self._samples.append((price, volume))
+        self._pv += price * volume
+        self._volume += volume
+        self._price += price
+        if len(self._samples) > self.window:
+            old_price, old_volume = self._samples.popleft()
+            self._pv -= old_price * old_volume
+            self._volume -= old_volume
+            self._price -= old_price
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            self._pv = sum(p * v for p, v in self._samples)
+            self._volume = sum(v for _, v in self._samples)
+            self._price = sum(p for p, _ in self._samples)
+
+    @property
+    def value(self) -> float:
+        """VWAP, or the plain mean when the window carries no volume"""
+        if not self._samples:
+            return 0.0
+        if self._volume <= 0:
+            return self._price / len(self._samples)
+        return self._pv / self._volume
+
+
+class RollingVariance:
+    """Welford mean / population variance over the last `window` samples"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, value: float):
+        self._values.append(value)
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            # Replace `old` with `value` in a window of constant size
+            old_mean = self._mean
+            self._mean += (value - old) / self.window
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+        else:
+            delta = value - self._mean
+            self._mean += delta / len(self._values)
+            self._m2 += delta * (value - self._mean)
+        self._updates += 1
+        if self._updates % RESYNC_INTERVAL == 0:
+            n = len(self._values)
+            self._mean = sum(self._values) / n
+            self._m2 = sum((v - self._mean) ** 2 for v in self._values)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        n = len(self._values)
+        return max(0.0, self._m2 / n) if n else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RollingExtrema:
+    """Rolling high / low over the last `window` samples via monotonic deques"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._index = 0
+        self._maxq: Deque[Tuple[int, float]] = deque()
+        self._minq: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return min(self._index, self.window)
+
+    def update(self, high: float, low: Optional[float] = None):
+        low = high if low is None else low
+        while self._maxq and self._maxq[-1][1] <= high:
+            self._maxq.pop()
+        self._maxq.append((self._index, high))
+        while self._minq and self._minq[-1][1] >= low:
+            self._minq.pop()
+        self._minq.append((self._index, low))
+        self._index += 1
+        expired = self._index - self.window
+        if self._maxq[0][0] < expired:
+            self._maxq.popleft()
+        if self._minq[0][0] < expired:
+            self._minq.popleft()
+
+    @property
+    def high(self) -> float:
+        return self._maxq[0][1] if self._maxq else 0.0
+
+    @property
+    def low(self) -> float:
+        return self._minq[0][1] if self._minq else 0.0
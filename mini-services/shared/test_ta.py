@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Tests for shared.ta: each shared indicator is pinned to the per-bot
+implementation it replaced (copied below as the reference).
+
+    python -m pytest mini-services/shared/test_ta.py
+"""
+
+import os
+import sys
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import ta
+from shared.ta.panel import market_snapshot
+
+# Bounty Seeker bot settings the references ran with
+GPS_LOW, GPS_HIGH = 0.618, 0.65
+VOL_MA_LENGTH, VOL_MULTIPLIER, VOL_EXTREME_MULTIPLIER = 20, 1.5, 2.5
+
+
+def random_candles(rng: np.random.Generator, bars: int, vol: float = 0.01) -> np.ndarray:
+    """Realistic-looking [o, h, l, c, v] rows (random walk closes, wicks, lognormal volume)"""
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, vol, bars)))
+    opens = np.r_[closes[0], closes[:-1]]
+    highs = np.maximum(opens, closes) * (1 + rng.random(bars) * vol)
+    lows = np.minimum(opens, closes) * (1 - rng.random(bars) * vol)
+    volumes = rng.lognormal(0, 0.7, bars)
+    return np.c_[opens, highs, lows, closes, volumes]
+
+
+@pytest.fixture
+def rng() -> np.random.Generator:
+    return np.random.default_rng(20)
+
+
+# ---- Reference implementations (as they were in the bots) ----
+def short_hunter_wilder_rsi(closes: List[float], period: int = 14) -> float:
+    """short_hunter_bot_v2 / v25 / v3 _compute_rsi"""
+    if len(closes) < period + 1:
+        return 50.0
+
+    gains = []
+    losses = []
+
+    for i in range(1, len(closes)):
+        change = closes[i] - closes[i - 1]
+        gains.append(max(0, change))
+        losses.append(max(0, -change))
+
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+
+    for i in range(period, len(gains)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def short_hunter_simple_rsi(closes: List[float], period: int = 14) -> float:
+    """short_hunter_bot _compute_rsi"""
+    if len(closes) < period + 1:
+        return 50.0
+    gains = []
+    losses = []
+    for i in range(1, period + 1):
+        delta = closes[-i] - closes[-i - 1]
+        if delta >= 0:
+            gains.append(delta)
+        else:
+            losses.append(abs(delta))
+    avg_gain = sum(gains) / period if gains else 0.0
+    avg_loss = sum(losses) / period if losses else 0.0
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def bounty_seeker_rsi(prices: List[float], period: int = 14) -> float:
+    """bounty_seeker_bot / v5 calculate_rsi"""
+    if len(prices) < period + 1:
+        return 50.0
+    deltas = np.diff(prices[-period-1:])
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains)
+    avg_loss = np.mean(losses)
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def v4_rsi(close: pd.Series) -> pd.Series:
+    """bounty_seeker_v4 rolling RSI"""
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
+    return 100 - (100 / (1 + gain / loss.replace(0, np.nan)))
+
+
+def v5_atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> float:
+    """bounty_seeker_v5 calculate_atr"""
+    if len(highs) < period + 1:
+        return 0.0
+    hi = highs[-period:]
+    lo = lows[-period:]
+    prev_close = closes[-period - 1:-1]
+    true_range = np.maximum(hi - lo, np.maximum(np.abs(hi - prev_close), np.abs(lo - prev_close)))
+    return float(true_range.mean())
+
+
+def bot_vwap(closes: np.ndarray, volumes: np.ndarray):
+    """bounty_seeker_bot calculate_vwap_and_deviation (close-weighted VWAP, plain std)"""
+    total_volume = volumes.sum()
+    if total_volume == 0:
+        return None, None
+    vwap = float(np.dot(closes, volumes) / total_volume)
+    return vwap, float(np.std(closes))
+
+
+def v5_vwap(prices: np.ndarray, volumes: np.ndarray):
+    """bounty_seeker_v5 calculate_vwap_and_deviation (volume-weighted std)"""
+    total_volume = volumes.sum()
+    if total_volume == 0:
+        return None, None
+    vwap = float(np.dot(prices, volumes) / total_volume)
+    variance = float(np.dot(volumes, (prices - vwap) ** 2) / total_volume)
+    std_dev = np.sqrt(variance) if variance > 0 else 0.0
+    return vwap, std_dev
+
+
+def bot_gps_zone(high: float, low: float, current_price: float):
+    """bounty_seeker_bot calculate_gps_zone"""
+    range_size = high - low
+    if range_size == 0:
+        return False, 100.0
+    gp_low_level = low + (range_size * GPS_LOW)
+    gp_high_level = low + (range_size * GPS_HIGH)
+    if gp_low_level <= current_price <= gp_high_level:
+        return True, 0.0
+    if current_price < gp_low_level:
+        distance = abs(current_price - gp_low_level) / current_price * 100
+    else:
+        distance = abs(current_price - gp_high_level) / current_price * 100
+    return False, distance
+
+
+def bot_upper_gps_zone(high: float, low: float, current_price: float):
+    """bounty_seeker_bot calculate_upper_gps_zone"""
+    range_size = high - low
+    if range_size == 0:
+        return False, 100.0
+    gp_high_level = high - (range_size * GPS_LOW)
+    gp_low_level = high - (range_size * GPS_HIGH)
+    if gp_low_level <= current_price <= gp_high_level:
+        return True, 0.0
+    if current_price > gp_high_level:
+        distance = abs(current_price - gp_high_level) / current_price * 100
+    else:
+        distance = abs(current_price - gp_low_level) / current_price * 100
+    return False, distance
+
+
+def v5_gps(high: float, low: float):
+    """bounty_seeker_v5 calculate_gps -> (gp_high, gp_low)"""
+    if high <= low:
+        return None, None
+    range_size = high - low
+    gp_high = high - (range_size * 0.618)
+    gp_low = high - (range_size * 0.65)
+    return gp_high, gp_low
+
+
+def bot_sfp_low(c: np.ndarray) -> bool:
+    """bounty_seeker_bot detect_sfp_reversal"""
+    if len(c) < 5:
+        return False
+    lows = c[-3:, 2]
+    closes = c[-3:, 3]
+    if lows[0] > lows[1] and closes[1] < closes[2]:
+        lower_wick = min(c[-1, 0], c[-1, 3]) - c[-1, 2]
+        body = abs(c[-1, 3] - c[-1, 0])
+        if lower_wick > body * 0.5:
+            return True
+    return False
+
+
+def bot_sfp_high(c: np.ndarray) -> bool:
+    """bounty_seeker_bot detect_sfp_reversal_high"""
+    if len(c) < 5:
+        return False
+    highs = c[-3:, 1]
+    closes = c[-3:, 3]
+    if highs[0] < highs[1] and closes[1] > closes[2]:
+        upper_wick = c[-1, 1] - max(c[-1, 0], c[-1, 3])
+        body = abs(c[-1, 3] - c[-1, 0])
+        if upper_wick > body * 0.5:
+            return True
+    return False
+
+
+def bot_volume_spike(volumes: np.ndarray):
+    """bounty_seeker_bot calculate_volume_spike_metrics (before the bullish-bar check)"""
+    if len(volumes) < VOL_MA_LENGTH + 1:
+        return 0.0, 0.0, 1.0, False, False, False
+    current_volume = volumes[-1]
+    prev_volume = volumes[-2]
+    vol_ema = np.mean(volumes[-VOL_MA_LENGTH:])
+    alpha = 2.0 / (VOL_MA_LENGTH + 1.0)
+    for vol in volumes[-VOL_MA_LENGTH:]:
+        vol_ema = alpha * vol + (1 - alpha) * vol_ema
+    vol_stddev = np.std(volumes[-VOL_MA_LENGTH:])
+    dynamic_threshold = vol_ema + (vol_stddev * VOL_MULTIPLIER)
+    extreme_threshold = vol_ema + (vol_stddev * VOL_EXTREME_MULTIPLIER)
+    volume_ratio = current_volume / vol_ema if vol_ema > 0 else 1.0
+    return (vol_ema, vol_stddev, volume_ratio, current_volume > dynamic_threshold,
+            current_volume > extreme_threshold, prev_volume > extreme_threshold)
+
+
+# ---- RSI ----
+def test_wilder_rsi_matches_short_hunter(rng):
+    for bars in (10, 15, 16, 50, 96, 200):
+        closes = random_candles(rng, bars)[:, 3]
+        assert ta.wilder_rsi(closes) == pytest.approx(short_hunter_wilder_rsi(list(closes)), abs=1e-9)
+
+
+def test_wilder_rsi_panel_matches_rows(rng):
+    panel = np.stack([random_candles(rng, 96)[:, 3] for _ in range(30)])
+    expected = [short_hunter_wilder_rsi(list(row)) for row in panel]
+    np.testing.assert_allclose(ta.wilder_rsi(panel), expected, atol=1e-9)
+
+
+def test_wilder_rsi_without_losses_is_100():
+    assert ta.wilder_rsi(np.arange(1.0, 40.0)) == 100.0
+
+
+def test_market_snapshot_rsi_smoothing(rng):
+    series = {f"S{i}": random_candles(rng, 120).tolist() for i in range(40)}
+    wilder = market_snapshot(series, 96, wilder=True)
+    simple = market_snapshot(series, 96)
+    for key, candles in series.items():
+        closes = [row[3] for row in candles[-96:]]
+        assert wilder[key]["rsi"] == pytest.approx(short_hunter_wilder_rsi(closes), abs=1e-9)
+        assert simple[key]["rsi"] == pytest.approx(short_hunter_simple_rsi(closes), abs=1e-9)
+
+
+def test_rsi_matches_bounty_seeker(rng):
+    for bars in (10, 15, 50, 200):
+        closes = random_candles(rng, bars)[:, 3]
+        assert ta.rsi(closes) == pytest.approx(bounty_seeker_rsi(closes), abs=1e-9)
+    panel = np.stack([random_candles(rng, 60)[:, 3] for _ in range(10)])
+    np.testing.assert_allclose(ta.rsi(panel), [bounty_seeker_rsi(row) for row in panel], atol=1e-9)
+
+
+def test_rsi_series_matches_v4(rng):
+    closes = random_candles(rng, 300)[:, 3]
+    expected = v4_rsi(pd.Series(closes)).to_numpy()
+    np.testing.assert_allclose(ta.rsi_series(closes)[14:], expected[14:], atol=1e-9)
+
+    panel = np.stack([random_candles(rng, 120)[:, 3] for _ in range(8)])
+    expected = np.stack([v4_rsi(pd.Series(row)).to_numpy() for row in panel])
+    np.testing.assert_allclose(ta.rsi_series(panel)[:, 14:], expected[:, 14:], atol=1e-9)
+
+
+def test_rsi_series_without_losses_is_100_not_nan():
+    # v4 read NaN when a 14-change window had no down move, so neither the
+    # oversold nor the overbought rule could fire; it now reads 100 and the
+    # overbought rule can trigger on those bars
+    closes = np.r_[np.linspace(100, 90, 20), np.linspace(90, 110, 20)]
+    old = v4_rsi(pd.Series(closes)).to_numpy()
+    new = ta.rsi_series(closes)
+    flat = np.isnan(old[14:])
+    assert flat.any()
+    np.testing.assert_array_equal(new[14:][flat], 100.0)
+    np.testing.assert_allclose(new[14:][~flat], old[14:][~flat], atol=1e-9)
+
+
+# ---- ATR / VWAP ----
+def test_atr_matches_v5(rng):
+    for bars in (10, 15, 200):
+        c = random_candles(rng, bars)
+        assert ta.atr(c[:, 1], c[:, 2], c[:, 3]) == pytest.approx(v5_atr(c[:, 1], c[:, 2], c[:, 3]), abs=1e-12)
+
+
+def test_vwap_bands_match_bots(rng):
+    for _ in range(20):
+        c = random_candles(rng, 200)
+        closes, volumes = c[:, 3], c[:, 4]
+        assert ta.vwap_bands(closes, volumes, volume_weighted=False) == pytest.approx(bot_vwap(closes, volumes))
+        assert ta.vwap_bands(closes, volumes) == pytest.approx(v5_vwap(closes, volumes))
+    assert ta.vwap_bands(closes, np.zeros_like(volumes)) == (None, None)
+
+
+# ---- Volume ----
+def test_volume_spike_matches_bot(rng):
+    for bars in (15, 21, 200):
+        for _ in range(20):
+            volumes = random_candles(rng, bars)[:, 4]
+            volumes[-rng.integers(1, 3)] *= rng.choice([1.0, 4.0, 10.0])  # Some real spikes
+            got = ta.volume_spike(volumes, VOL_MA_LENGTH, VOL_MULTIPLIER, VOL_EXTREME_MULTIPLIER)
+            expected = bot_volume_spike(volumes)
+            assert got[:3] == pytest.approx(expected[:3], rel=1e-12)
+            assert got[3:] == tuple(bool(flag) for flag in expected[3:])
+
+
+# ---- Levels ----
+def test_golden_pocket_matches_bots(rng):
+    for _ in range(500):
+        low = rng.uniform(1, 100)
+        high = low * rng.uniform(1.0, 1.5)
+        price = rng.uniform(low * 0.9, high * 1.1)
+        lower = ta.zone_distance(price, ta.golden_pocket(high, low, levels=(GPS_LOW, GPS_HIGH)))
+        upper = ta.zone_distance(price, ta.golden_pocket(high, low, from_high=True, levels=(GPS_LOW, GPS_HIGH)))
+        assert lower == pytest.approx(bot_gps_zone(high, low, price))
+        assert upper == pytest.approx(bot_upper_gps_zone(high, low, price))
+        gp_high, gp_low = v5_gps(high, low) if high > low else (None, None)
+        zone = ta.golden_pocket(high, low, from_high=True)
+        assert zone == (pytest.approx((gp_low, gp_high)) if gp_high is not None else None)
+    assert ta.zone_distance(5.0, ta.golden_pocket(10.0, 10.0)) == bot_gps_zone(10.0, 10.0, 5.0)
+
+
+# ---- Patterns ----
+def test_sfp_matches_bot(rng):
+    hits = 0
+    for _ in range(2000):
+        c = random_candles(rng, int(rng.integers(3, 8)), vol=0.02)
+        o, h, l, cl = c[:, 0], c[:, 1], c[:, 2], c[:, 3]
+        assert ta.sfp_low(o, l, cl) == bot_sfp_low(c)
+        assert ta.sfp_high(o, h, cl) == bot_sfp_high(c)
+        hits += bot_sfp_low(c) + bot_sfp_high(c)
+    assert hits  # The patterns actually fired
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Incremental OKX candle cache.
+Keeps confirmed candles per instrument so each scan only has to fetch the
+candles that closed since the last one, plus the still-forming open candle.
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# OKX bar strings -> milliseconds
+BAR_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "1H": 3_600_000,
+    "4H": 14_400_000,
+}
+
+
+def parse_okx_row(row: List) -> Optional[List]:
+    """[ts, o, h, l, c, vol, volCcy, volCcyQuote, confirm] -> [ts, o, h, l, c, v, confirmed]"""
+    try:
+        confirmed = str(row[8]) == "1" if len(row) > 8 else True
+        return [
+            int(row[0]),
+            float(row[1]),
+            float(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+            confirmed,
+        ]
+    except Exception:
+        return None
+
+
+class CandleCache:
+    """Confirmed-candle store with delta refresh sizing"""
+
+    def __init__(self, bar: str = "15m", max_candles: int = 100):
+        self.bar = bar
+        self.bar_ms = BAR_MS[bar]
+        self.max_candles = max_candles
+        self._confirmed: Dict[str, Deque[List]] = {}
+        self._open: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self.full_fetches = 0
+        self.delta_fetches = 0
+
+    def last_confirmed_ts(self, inst_id: str) -> Optional[int]:
+        with self._lock:
+            rows = self._confirmed.get(inst_id)
+            return rows[-1][0] if rows else None
+
+    def delta_limit(self, inst_id: str, now_ms: Optional[int] = None) -> Optional[int]:
+        """Number of newest candles to request, or None when a full fetch is needed"""
+        last_ts = self.last_confirmed_ts(inst_id)
+        if last_ts is None:
+            return None
+        if now_ms is None:
+            now_ms = int(time.time() * 1000)
+        current_open = now_ms - now_ms % self.bar_ms
+        missing_closed = max(0, (current_open - last_ts) // self.bar_ms - 1)
+        # Missing closed candles + the open candle + one overlap candle to detect gaps
+        limit = int(missing_closed) + 2
+        if limit >= self.max_candles:
+            return None
+        return limit
+
+    def merge(self, inst_id: str, rows: List, full: bool) -> Optional[List[List[float]]]:
+        """Merge raw OKX rows (newest first) into the cache.
+
+        Returns oldest-first [o, h, l, c, v] candles including the open candle,
+        or None when a delta does not connect to the cached series.
+        """
+        parsed = [p for p in (parse_okx_row(r) for r in rows) if p]
+        parsed.sort(key=lambda p: p[0])
+        closed = [p[:6] for p in parsed if p[6]]
+        open_rows = [p[:6] for p in parsed if not p[6]]
+
+        with self._lock:
+            cached = self._confirmed.get(inst_id)
+            if full or cached is None:
+                cached = deque(closed, maxlen=self.max_candles)
+                self._confirmed[inst_id] = cached
+                self.full_fetches += 1
+            else:
+                last_ts = cached[-1][0]
+                new_rows = [p for p in closed if p[0] > last_ts]
+                final = [p for p in closed if p[0] == last_ts]
+                overlap = bool(final)
+                if final:
+                    # Final values for a candle we already hold (e.g. promoted from open)
+                    cached[-1] = final[-1]
+                if new_rows and not overlap and new_rows[0][0] != last_ts + self.bar_ms:
+                    # Gap between cache and delta - caller should refetch everything
+                    del self._confirmed[inst_id]
+                    self._open.pop(inst_id, None)
+                    return None
+                cached.extend(new_rows)
+                self.delta_fetches += 1
+
+            if open_rows and (not cached or open_rows[-1][0] > cached[-1][0]):
+                previous = self._open.get(inst_id)
+                if (
+                    previous
+                    and cached
+                    and previous[0] == cached[-1][0] + self.bar_ms
+                    and open_rows[-1][0] > previous[0]
+                ):
+                    # A newer bar opened before the close was confirmed - keep the finished bar
+                    cached.append(previous)
+                self._open[inst_id] = open_rows[-1]
+            else:
+                previous = self._open.get(inst_id)
+                if full or (previous and cached and previous[0] <= cached[-1][0]):
+                    # The open candle we held has since closed
+                    self._open.pop(inst_id, None)
+
+            return self._window(inst_id)
+
+    def candles(self, inst_id: str, include_open: bool = True) -> List[List[float]]:
+        """Cached oldest-first [o, h, l, c, v] window, optionally ending at the last closed bar"""
+        with self._lock:
+            return self._window(inst_id, include_open)
+
+    def _window(self, inst_id: str, include_open: bool = True) -> List[List[float]]:
+        rows = list(self._confirmed.get(inst_id, ()))
+        open_row = self._open.get(inst_id) if include_open else None
+        if open_row:
+            rows = rows[-(self.max_candles - 1):] + [open_row]
+        else:
+            rows = rows[-self.max_candles:]
+        return [row[1:6] for row in rows]
@@ -64,6 +64,13 @@ BOTS = [
     }
 ]
 
+# Shared market data hub - fetches each instrument once per bar for every bot
+HUB = {
+    'name': 'Market Data Hub',
+    'script': 'market_data_hub.py',
+    'description': 'Shared OKX candle feed (Unix socket)',
+}
+
 BOT_DIR = Path.home() / "Desktop/bots/short hunter"
 processes = {}
 
@@ -106,7 +113,7 @@ def stop_all_bots():
 
 def check_bot_health():
     """Check if bots are running, restart if needed"""
-    for bot in BOTS:
+    for bot in [HUB] + BOTS:
         name = bot['name']
         process = processes.get(name)
         
@@ -133,6 +140,11 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
+    # Start the market data hub first so bots find it on their first scan
+    logger.info(f"🔄 Starting {HUB['name']}...")
+    processes[HUB['name']] = start_bot(HUB)
+    time.sleep(2)
+
     # Start all bots
     for bot in sorted(BOTS, key=lambda x: x['priority']):
         logger.info(f"🔄 Starting {bot['name']}...")
@@ -157,7 +169,10 @@ def main():
                 last_health_check = time.time()
                 
                 # Log status
-                running = sum(1 for p in processes.values() if p and p.poll() is None)
+                running = sum(
+                    1 for bot in BOTS
+                    if processes.get(bot['name']) and processes[bot['name']].poll() is None
+                )
                 logger.info(f"📈 Fleet Status: {running}/{len(BOTS)} bots running")
                 
     except KeyboardInterrupt:
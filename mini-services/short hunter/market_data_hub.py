@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Short Hunter Market Data Hub
+Fetches each OKX instrument's 15m candles once per bar and serves them to every
+bot in the fleet over a Unix socket, so five bots no longer download the same
+candles five times.
+
+Run standalone (fleet_manager.py starts it automatically):
+    python3 market_data_hub.py
+
+Protocol: one JSON request per line, one JSON response per line.
+    {"op": "candles", "inst_ids": ["BTC-USDT-SWAP", ...]}
+    -> {"ok": true, "candles": {"BTC-USDT-SWAP": [[o, h, l, c, v], ...]}}
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import logging
+import threading
+import socketserver
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client
+from shared.rate_limiter import get_rate_limiter
+
+from candle_cache import CandleCache
+
+# ==========================================
+# CONFIGURATION
+# ==========================================
+HUB_SOCKET_PATH = os.getenv("SHORT_HUNTER_HUB_SOCKET", "/tmp/short_hunter_market_hub.sock")
+OKX_CANDLES_URL = "https://www.okx.com/api/v5/market/candles"
+OKX_CANDLE_BAR = "15m"
+OKX_CANDLE_LIMIT = 100
+HUB_CONFIRM_RETRY_SECONDS = 10  # Re-ask this often after a rollover until OKX confirms the closed bar
+HUB_FETCH_WORKERS = 8  # Instruments fetched at once (paced by the shared rate limiter)
+HUB_CLIENT_TIMEOUT = 90  # A cold hub may need to fetch the full universe
+HUB_RETRY_AFTER = 60  # Seconds a client waits before retrying a dead hub
+
+logger = logging.getLogger(__name__)
+
+
+# ==========================================
+# HUB SERVER
+# ==========================================
+class MarketDataHub:
+    """Single fetcher for the whole fleet, backed by the incremental candle cache"""
+
+    def __init__(self):
+        self.session = http_client.get_session()
+        self.cache = CandleCache(OKX_CANDLE_BAR, OKX_CANDLE_LIMIT)
+        self._refreshed_at: Dict[str, float] = {}
+        self._in_flight: Dict[str, Future] = {}  # inst_id -> the fetch every concurrent caller waits on
+        self._in_flight_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=HUB_FETCH_WORKERS, thread_name_prefix="hub-fetch")
+        self.rate_limiter = get_rate_limiter()
+        self.requests_served = 0
+        self.okx_requests = 0
+
+    def _is_fresh(self, inst_id: str) -> bool:
+        """Fresh once the last closed bar is confirmed; only a bar rollover makes it stale"""
+        now = time.time()
+        now_ms = int(now * 1000)
+        last_closed_open = now_ms - now_ms % self.cache.bar_ms - self.cache.bar_ms
+        last_confirmed = self.cache.last_confirmed_ts(inst_id)
+        if last_confirmed is not None and last_confirmed >= last_closed_open:
+            return True
+        refreshed = self._refreshed_at.get(inst_id)
+        return refreshed is not None and now - refreshed < HUB_CONFIRM_RETRY_SECONDS
+
+    def _fetch(self, inst_id: str) -> Future:
+        """The in-flight fetch for inst_id, starting one if none is running"""
+        with self._in_flight_lock:
+            future = self._in_flight.get(inst_id)
+            if future is None:
+                future = self._in_flight[inst_id] = self._pool.submit(self._fetch_once, inst_id)
+            return future
+
+    def _fetch_once(self, inst_id: str) -> List[List[float]]:
+        try:
+            if self._is_fresh(inst_id):  # Another fetch finished while this one was queued
+                return self.cache.candles(inst_id)
+            return self._refresh(inst_id)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(inst_id, None)
+
+    def _refresh(self, inst_id: str, retries: int = 3) -> List[List[float]]:
+        for attempt in range(retries):
+            try:
+                limit = self.cache.delta_limit(inst_id)
+                params = {"instId": inst_id, "bar": OKX_CANDLE_BAR, "limit": limit or OKX_CANDLE_LIMIT}
+                self.rate_limiter.acquire("okx", "candles")
+                self.okx_requests += 1
+                resp = self.session.get(OKX_CANDLES_URL, params=params, timeout=15)
+                self.rate_limiter.observe_response("okx", "candles", resp)
+                resp.raise_for_status()
+                candles = self.cache.merge(inst_id, resp.json().get("data", []), full=limit is None)
+                if candles is None:
+                    continue
+                self._refreshed_at[inst_id] = time.time()
+                return candles
+            except requests.exceptions.RequestException as e:
+                if attempt < retries - 1:
+                    time.sleep((attempt + 1) * 2)
+                else:
+                    logger.warning(f"Failed to fetch candles for {inst_id} after {retries} attempts: {e}")
+            except Exception as e:
+                logger.warning(f"Unexpected error fetching candles for {inst_id}: {e}")
+                break
+        # Serve whatever we still have rather than nothing
+        return self.cache.candles(inst_id)
+
+    def get_candles(self, inst_ids: List[str]) -> Dict[str, List[List[float]]]:
+        """Candles for every requested instrument, fetching the stale ones concurrently"""
+        pending = {inst_id: self._fetch(inst_id) for inst_id in inst_ids if not self._is_fresh(inst_id)}
+        result: Dict[str, List[List[float]]] = {}
+        for inst_id in inst_ids:
+            candles = pending[inst_id].result() if inst_id in pending else self.cache.candles(inst_id)
+            if candles:
+                result[inst_id] = candles
+        self.requests_served += 1
+        return result
+
+    def close(self):
+        self._pool.shutdown(wait=False)
+
+
+class _HubRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                op = request.get("op")
+                if op == "candles":
+                    response = {"ok": True, "candles": self.server.hub.get_candles(request.get("inst_ids", []))}
+                elif op == "ping":
+                    response = {"ok": True}
+                else:
+                    response = {"ok": False, "error": f"unknown op: {op}"}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _HubServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: str = HUB_SOCKET_PATH):
+    """Run the hub until SIGINT/SIGTERM"""
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = _HubServer(socket_path, _HubRequestHandler)
+    server.hub = MarketDataHub()
+
+    def shutdown(signum, frame):
+        logger.info("🛑 Market data hub shutting down")
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    logger.info(f"📡 Market data hub listening on {socket_path}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        server.hub.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        logger.info(
+            f"📊 Hub served {server.hub.requests_served} bot requests with {server.hub.okx_requests} OKX requests"
+        )
+
+
+# ==========================================
+# HUB CLIENT (used by the bots)
+# ==========================================
+class HubClient:
+    """Reads candles from the hub; returns {} so callers fall back to OKX when it is down"""
+
+    def __init__(self, socket_path: str = HUB_SOCKET_PATH, timeout: float = HUB_CLIENT_TIMEOUT):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._retry_at = 0.0
+
+    def fetch_candles(self, inst_ids: List[str]) -> Dict[str, List[List[float]]]:
+        if not inst_ids or time.time() < self._retry_at or not os.path.exists(self.socket_path):
+            return {}
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                request = {"op": "candles", "inst_ids": list(inst_ids)}
+                sock.sendall(json.dumps(request).encode() + b"\n")
+                with sock.makefile("rb") as reader:
+                    response = json.loads(reader.readline())
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error", "hub error"))
+            candles = response.get("candles", {})
+            logger.info(f"📡 Market data hub served {len(candles)}/{len(inst_ids)} instruments")
+            return candles
+        except Exception as e:
+            logger.warning(f"⚠️ Market data hub unavailable, fetching from OKX directly: {e}")
+            self._retry_at = time.time() + HUB_RETRY_AFTER
+            return {}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+        handlers=[logging.StreamHandler(), logging.FileHandler("market_data_hub.log")],
+    )
+    serve(sys.argv[1] if len(sys.argv) > 1 else HUB_SOCKET_PATH)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+OKX WebSocket candle stream.
+Subscribes to the candle15m channel for the whole perp universe, split across
+several connections, and keeps each instrument's window in a CandleCache so
+the bot can analyze fresh data the moment a bar closes instead of REST polling.
+"""
+
+import json
+import time
+import logging
+import threading
+from typing import Callable, List, Set
+
+from candle_cache import CandleCache
+
+try:
+    import websocket  # websocket-client
+except ImportError:  # Optional dependency - bot falls back to REST polling
+    websocket = None
+
+logger = logging.getLogger(__name__)
+
+# ==========================================
+# CONFIGURATION
+# ==========================================
+OKX_WS_BUSINESS_URL = "wss://ws.okx.com:8443/ws/v5/business"  # Candle channels live here
+WS_SUBS_PER_CONNECTION = 100  # Instruments per connection
+WS_CONNECT_STAGGER = 0.5  # OKX allows 3 new connections / second per IP
+WS_PING_INTERVAL = 25  # OKX drops connections idle for 30s
+WS_RECONNECT_DELAY = 5  # Seconds, doubled per failure up to WS_RECONNECT_MAX
+WS_RECONNECT_MAX = 60
+
+
+def stream_available() -> bool:
+    return websocket is not None
+
+
+class _StreamConnection:
+    """One WebSocket connection carrying a slice of the universe"""
+
+    def __init__(self, stream: "OKXCandleStream", index: int, inst_ids: List[str]):
+        self.stream = stream
+        self.index = index
+        self.inst_ids = inst_ids
+        self.app = None
+        self.connected = False
+        self.last_message = 0.0
+        self.thread = threading.Thread(
+            target=self._run, name=f"okx-ws-{index}", daemon=True
+        )
+
+    def _on_open(self, ws):
+        args = [{"channel": self.stream.channel, "instId": inst_id} for inst_id in self.inst_ids]
+        ws.send(json.dumps({"op": "subscribe", "args": args}))
+        self.connected = True
+        logger.info(f"📡 WS #{self.index} subscribed to {len(self.inst_ids)} instruments")
+        # Fill whatever closed while we were disconnected
+        self.stream.request_reseed(self.inst_ids)
+
+    def _on_message(self, ws, message):
+        self.last_message = time.time()
+        if message == "pong":
+            return
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            return
+        if payload.get("event") == "error":
+            logger.warning(f"⚠️ WS #{self.index} error: {payload.get('msg')}")
+            return
+        inst_id = payload.get("arg", {}).get("instId")
+        data = payload.get("data")
+        if inst_id and data:
+            self.stream.on_candles(inst_id, data)
+
+    def _on_close(self, ws, status_code, msg):
+        self.connected = False
+
+    def _on_error(self, ws, error):
+        logger.debug(f"WS #{self.index} error: {error}")
+
+    def _keepalive(self):
+        while self.stream.running:
+            time.sleep(WS_PING_INTERVAL)
+            if self.connected and self.app:
+                try:
+                    self.app.send("ping")
+                except Exception:
+                    pass
+
+    def _run(self):
+        threading.Thread(target=self._keepalive, daemon=True).start()
+        delay = WS_RECONNECT_DELAY
+        while self.stream.running:
+            started = time.time()
+            self.app = websocket.WebSocketApp(
+                self.stream.url,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_close=self._on_close,
+                on_error=self._on_error,
+            )
+            self.app.run_forever()
+            self.connected = False
+            if not self.stream.running:
+                break
+            if time.time() - started > WS_RECONNECT_MAX:
+                delay = WS_RECONNECT_DELAY  # Connection was healthy for a while
+            logger.warning(f"⚠️ WS #{self.index} disconnected, reconnecting in {delay}s")
+            time.sleep(delay)
+            delay = min(delay * 2, WS_RECONNECT_MAX)
+
+
+class OKXCandleStream:
+    """Streams OKX candles for many instruments into a CandleCache"""
+
+    def __init__(
+        self,
+        inst_ids: List[str],
+        cache: CandleCache,
+        seed: Callable[[str], List],
+        url: str = OKX_WS_BUSINESS_URL,
+    ):
+        self.cache = cache
+        self.channel = f"candle{cache.bar}"
+        self.seed = seed  # REST fetch that (re)fills one instrument's window
+        self.url = url
+        self.running = False
+        self.connections = [
+            _StreamConnection(self, i, inst_ids[start:start + WS_SUBS_PER_CONNECTION])
+            for i, start in enumerate(range(0, len(inst_ids), WS_SUBS_PER_CONNECTION))
+        ]
+        self._reseed: Set[str] = set()
+        self._reseed_lock = threading.Lock()
+        self._reseed_event = threading.Event()
+        self.messages = 0
+
+    def start(self):
+        if not stream_available():
+            raise RuntimeError("websocket-client is not installed")
+        self.running = True
+        threading.Thread(target=self._reseed_worker, name="okx-ws-reseed", daemon=True).start()
+        for conn in self.connections:
+            conn.thread.start()
+            time.sleep(WS_CONNECT_STAGGER)
+        logger.info(f"📡 OKX candle stream started: {len(self.connections)} connections")
+
+    def stop(self):
+        self.running = False
+        for conn in self.connections:
+            if conn.app:
+                try:
+                    conn.app.close()
+                except Exception:
+                    pass
+        self._reseed_event.set()
+
+    def is_healthy(self) -> bool:
+        return self.running and all(conn.connected for conn in self.connections)
+
+    def on_candles(self, inst_id: str, rows: List):
+        self.messages += 1
+        if self.cache.merge(inst_id, rows, full=False) is None:
+            # Missed bars (e.g. dropped frames) - refill from REST
+            self.request_reseed([inst_id])
+
+    def request_reseed(self, inst_ids: List[str]):
+        with self._reseed_lock:
+            self._reseed.update(inst_ids)
+        self._reseed_event.set()
+
+    def _reseed_worker(self):
+        while self.running:
+            self._reseed_event.wait()
+            self._reseed_event.clear()
+            with self._reseed_lock:
+                pending, self._reseed = sorted(self._reseed), set()
+            for inst_id in pending:
+                if not self.running:
+                    return
+                try:
+                    self.seed(inst_id)
+                except Exception as e:
+                    logger.debug(f"Reseed failed for {inst_id}: {e}")
+            if pending:
+                logger.info(f"📥 Seeded {len(pending)} candle windows from REST")
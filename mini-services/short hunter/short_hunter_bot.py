@@ -13,9 +13,19 @@ import signal
 import sys
 from datetime import datetime, timedelta, timezone
 from collections import deque
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, List, Set, Optional
 from dataclasses import dataclass, field
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.metadata_cache import MetadataCache
+from shared import http_client
+from shared.rate_limiter import get_rate_limiter
+from shared.ta import market_snapshot
+
+from candle_cache import CandleCache
+from okx_candle_stream import OKXCandleStream, stream_available
+from market_data_hub import HubClient
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
@@ -28,7 +38,14 @@ OKX_INST_TYPE = "SWAP"
 OKX_SETTLE = "USDT"
 OKX_CANDLE_BAR = "15m"
 OKX_CANDLE_LIMIT = 100
+RATE_LIMITER = get_rate_limiter()  # Shared token buckets for every OKX call
 OKX_LOOKBACK = 96  # ~24h of 15m candles
+OKX_INSTRUMENTS_CACHE = MetadataCache("okx_swap_instruments")
+
+# Ingestion: "rest" polls every SCAN_INTERVAL, "stream" follows OKX WebSocket candles
+# and scans as soon as each 15m bar closes
+INGESTION_MODE = os.getenv("SHORT_HUNTER_INGESTION", "rest").lower()
+STREAM_BAR_SETTLE_SECONDS = 5  # Let close confirmations arrive before scanning
 TRADES_FILE = "/Users/bishop/Desktop/output/workspace-99190f76-187d-40a3-8ab6-30b756622125/public/data/active_trades.json"
 
 # Global market data cache
@@ -228,7 +245,7 @@ def send_webhook(data: Dict):
     """Send data to local signal server"""
     try:
         payload = {"source": "short_hunter", "data": data}
-        requests.post(SIGNAL_SERVER_URL, json=payload, timeout=1)
+        http_client.post(SIGNAL_SERVER_URL, json=payload, timeout=1)
     except Exception:
         # Fail silently if signal server is down
         pass
@@ -447,61 +464,19 @@ def _normalize_okx_symbol(inst_id: str) -> Optional[str]:
     return f"{base}{quote}"
 
 
-def load_okx_perps(
-    limit: Optional[int] = None, retries: int = 3
-) -> List[Dict[str, str]]:
-    """Load OKX perpetuals with retry logic"""
+def _fetch_okx_instruments(retries: int = 3) -> List[Dict]:
+    """Raw OKX SWAP instrument list with retry logic"""
     for attempt in range(retries):
         try:
             params = {"instType": OKX_INST_TYPE}
-            resp = requests.get(OKX_INSTRUMENTS_URL, params=params, timeout=15)
+            RATE_LIMITER.acquire("okx", "instruments")
+            resp = http_client.get(OKX_INSTRUMENTS_URL, params=params, timeout=15)
+            RATE_LIMITER.observe_response("okx", "instruments", resp)
             resp.raise_for_status()
-            payload = resp.json()
-            data = payload.get("data", [])
-            symbols: List[Dict[str, str]] = []
-            for item in data:
-                if item.get("instType") != OKX_INST_TYPE:
-                    continue
-                if item.get("settleCcy") != OKX_SETTLE:
-                    continue
-                sym = _normalize_okx_symbol(item.get("instId", ""))
-                if not sym:
-                    continue
-                # Skip stablecoin pairs (can't trade stablecoin vs stablecoin)
-                base = sym.replace("USDT", "")
-                stablecoins = [
-                    "USDC",
-                    "DAI",
-                    "TUSD",
-                    "FDUSD",
-                    "PYUSD",
-                    "USDE",
-                    "EURT",
-                    "USDD",
-                    "BUSD",
-                    "USDP",
-                    "WBTC",
-                    "CBETH",
-                    "STETH",
-                    "WETH",
-                    "USDT",
-                ]
-                if (
-                    base in stablecoins
-                    or sym.startswith("USDC")
-                    or sym.startswith("USDT")
-                ):
-                    logger.debug(f"Skipping stablecoin/wrapped pair: {sym}")
-                    continue
-                symbols.append({"s": sym, "n": base})
-            symbols = sorted(symbols, key=lambda x: x["s"])
-            if limit is not None and len(symbols) > limit:
-                symbols = symbols[:limit]
-            logger.info(
-                f"📊 Loaded {len(symbols)} OKX perps"
-                + (f" (limited to {limit})" if limit else "")
-            )
-            return symbols
+            data = resp.json().get("data", [])
+            if not data:
+                raise ValueError("empty instrument list")
+            return data
         except requests.exceptions.RequestException as e:
             if attempt < retries - 1:
                 wait_time = (attempt + 1) * 2
@@ -510,16 +485,88 @@ def load_okx_perps(
                 )
                 time.sleep(wait_time)
             else:
-                logger.error(
-                    f"❌ Failed to load OKX perps after {retries} attempts: {e}"
-                )
-                return []
-        except Exception as exc:
-            logger.error(f"❌ Failed to load OKX perps: {exc}")
-            return []
+                raise
     return []
 
 
+def _perps_from_instruments(
+    data: List[Dict], limit: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """Filter raw OKX instruments down to tradeable USDT perps"""
+    symbols: List[Dict[str, str]] = []
+    for item in data:
+        if item.get("instType") != OKX_INST_TYPE:
+            continue
+        if item.get("settleCcy") != OKX_SETTLE:
+            continue
+        sym = _normalize_okx_symbol(item.get("instId", ""))
+        if not sym:
+            continue
+        # Skip stablecoin pairs (can't trade stablecoin vs stablecoin)
+        base = sym.replace("USDT", "")
+        stablecoins = [
+            "USDC",
+            "DAI",
+            "TUSD",
+            "FDUSD",
+            "PYUSD",
+            "USDE",
+            "EURT",
+            "USDD",
+            "BUSD",
+            "USDP",
+            "WBTC",
+            "CBETH",
+            "STETH",
+            "WETH",
+            "USDT",
+        ]
+        if (
+            base in stablecoins
+            or sym.startswith("USDC")
+            or sym.startswith("USDT")
+        ):
+            logger.debug(f"Skipping stablecoin/wrapped pair: {sym}")
+            continue
+        symbols.append({"s": sym, "n": base})
+    symbols = sorted(symbols, key=lambda x: x["s"])
+    if limit is not None and len(symbols) > limit:
+        symbols = symbols[:limit]
+    return symbols
+
+
+def load_okx_perps(
+    limit: Optional[int] = None,
+    retries: int = 3,
+    on_refresh: Optional[Callable[[List[Dict[str, str]]], None]] = None,
+) -> List[Dict[str, str]]:
+    """Load OKX perpetuals from the on-disk instrument cache (refreshed in the background)
+
+    on_refresh receives the new perp list when a stale cache is revalidated.
+    """
+    try:
+        data = OKX_INSTRUMENTS_CACHE.load(
+            lambda: _fetch_okx_instruments(retries),
+            on_refresh=(
+                (lambda fresh: on_refresh(_perps_from_instruments(fresh, limit)))
+                if on_refresh
+                else None
+            ),
+        )
+        symbols = _perps_from_instruments(data, limit)
+        logger.info(
+            f"📊 Loaded {len(symbols)} OKX perps"
+            + (f" (limited to {limit})" if limit else "")
+        )
+        return symbols
+    except requests.exceptions.RequestException as e:
+        logger.error(f"❌ Failed to load OKX perps after {retries} attempts: {e}")
+        return []
+    except Exception as exc:
+        logger.error(f"❌ Failed to load OKX perps: {exc}")
+        return []
+
+
 def tradingview_symbol(symbol: str) -> str:
     """Format symbol for TradingView OKX perp charts: OKX:BTCUSDT.P"""
     return f"OKX:{symbol}.P"
@@ -532,60 +579,41 @@ def _symbol_to_okx_inst(symbol: str) -> Optional[str]:
     return f"{base}-USDT-SWAP"
 
 
-def _compute_rsi(closes: List[float], period: int = 14) -> float:
-    if len(closes) < period + 1:
-        return 50.0
-    gains = []
-    losses = []
-    for i in range(1, period + 1):
-        delta = closes[-i] - closes[-i - 1]
-        if delta >= 0:
-            gains.append(delta)
-        else:
-            losses.append(abs(delta))
-    avg_gain = sum(gains) / period if gains else 0.0
-    avg_loss = sum(losses) / period if losses else 0.0
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100.0 - (100.0 / (1.0 + rs))
-
-
 # ==========================================
 # MARKET DATA ENGINE (OKX LIVE)
 # ==========================================
 class MarketEngine:
     def __init__(self, assets: List[Dict[str, str]]):
         self.assets = assets
-        self.session = requests.Session()
+        self.session = http_client.get_session()
+        self.hub = HubClient()
+        self.candle_cache = CandleCache(OKX_CANDLE_BAR, OKX_CANDLE_LIMIT)
         self.trade_tracker = TradeTracker()
 
     def _fetch_candles(self, inst_id: str, retries: int = 3) -> List[List[float]]:
-        """Fetch candles with retry logic for network resilience"""
+        """Fetch candles with retry logic for network resilience.
+
+        Only candles newer than the cached confirmed series are requested;
+        a full window is fetched on first use or when the delta leaves a gap.
+        """
         for attempt in range(retries):
             try:
+                limit = self.candle_cache.delta_limit(inst_id)
                 params = {
                     "instId": inst_id,
                     "bar": OKX_CANDLE_BAR,
-                    "limit": OKX_CANDLE_LIMIT,
+                    "limit": limit or OKX_CANDLE_LIMIT,
                 }
+                RATE_LIMITER.acquire("okx", "candles")
                 resp = self.session.get(OKX_CANDLES_URL, params=params, timeout=15)
+                RATE_LIMITER.observe_response("okx", "candles", resp)
                 resp.raise_for_status()
                 payload = resp.json()
                 data = payload.get("data", [])
-                candles = []
-                for row in data:
-                    try:
-                        # [ts, o, h, l, c, vol, volCcy, volCcyQuote, confirm]
-                        o = float(row[1])
-                        h = float(row[2])
-                        l = float(row[3])
-                        c = float(row[4])
-                        v = float(row[5])
-                        candles.append([o, h, l, c, v])
-                    except Exception:
-                        continue
-                candles.reverse()
+                candles = self.candle_cache.merge(inst_id, data, full=limit is None)
+                if candles is None:
+                    logger.debug(f"Candle cache gap for {inst_id}, refetching full window")
+                    continue
                 return candles
             except requests.exceptions.RequestException as e:
                 if attempt < retries - 1:
@@ -604,10 +632,18 @@ class MarketEngine:
                 return []
         return []
 
-    def tick(self) -> Dict[str, Dict]:
-        """Fetch real OKX 15m candles and build market snapshot"""
-        data: Dict[str, Dict] = {}
+    def tick(self, use_stream: bool = False) -> Dict[str, Dict]:
+        """Fetch real OKX 15m candles and build market snapshot
+
+        With use_stream the snapshot is built from the WebSocket-fed candle cache,
+        ending at the last closed bar, without any REST calls.
+        """
+        # Candles shared by the fleet's market data hub; anything it can't serve is fetched from OKX
+        hub_candles = {} if use_stream else self.hub.fetch_candles(
+            [i for i in (_symbol_to_okx_inst(asset["s"]) for asset in self.assets) if i]
+        )
 
+        candles_by_symbol: Dict[str, List[List[float]]] = {}
         for asset in self.assets:
             symbol = asset["s"]
             inst_id = _symbol_to_okx_inst(symbol)
@@ -615,86 +651,25 @@ class MarketEngine:
                 continue
 
             try:
-                candles = self._fetch_candles(inst_id)
-                if not candles or len(candles) < OKX_LOOKBACK:
-                    logger.debug(
-                        f"Not enough candles for {symbol}: {len(candles) if candles else 0}"
-                    )
-                    continue
-
-                lookback = (
-                    candles[-OKX_LOOKBACK:] if len(candles) >= OKX_LOOKBACK else candles
-                )
-                highs = [c[1] for c in lookback]
-                lows = [c[2] for c in lookback]
-                closes = [c[3] for c in lookback]
-                vols = [c[4] for c in lookback]
-                last_o, last_h, last_l, last_c, last_v = candles[-1]
-
-                high = max(highs)
-                low = min(lows)
-                change = ((last_c - low) / low) * 100 if low > 0 else 0.0
-
-                # VWAP approximation
-                typicals = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
-                vol_sum = sum(vols)
-                vwap = (
-                    sum(t * v for t, v in zip(typicals, vols)) / vol_sum
-                    if vol_sum > 0
-                    else last_c
-                )
-
-                # Deviation (std dev of closes)
-                mean_close = sum(closes) / len(closes)
-                variance = sum((c - mean_close) ** 2 for c in closes) / len(closes)
-                std_dev = variance**0.5 if variance > 0 else 1.0
-                dev = round((last_c - vwap) / std_dev, 2) if std_dev > 0 else 0.0
-
-                # RSI
-                rsi = _compute_rsi(closes, 14)
-
-                # Liquidity sweep (break + reject)
-                prev_high = (
-                    max([c[1] for c in candles[-21:-1]]) if len(candles) > 21 else high
-                )
-                is_sweep = last_h > prev_high and last_c < prev_high
-
-                # Volume spikes (20-period MA + std dev)
-                vol_slice = vols[-20:] if len(vols) >= 20 else vols
-                vol_ma = sum(vol_slice) / len(vol_slice)
-                vol_var = sum((v - vol_ma) ** 2 for v in vol_slice) / len(vol_slice)
-                vol_std = vol_var**0.5
-                dynamic_threshold = vol_ma + vol_std * 2.0
-                extreme_threshold = vol_ma + vol_std * 3.5
-                is_abnormal_volume = last_v > dynamic_threshold
-                is_extreme_volume = last_v > extreme_threshold
-
-                # Check if trade should be closed
-                if symbol in self.trade_tracker.active_trades:
-                    current_price = last_c
-                    self.trade_tracker.update_trade_status(
-                        symbol, "ACTIVE", current_price
-                    )
-
-                data[symbol] = {
-                    "price": last_c,
-                    "high": high,
-                    "low": low,
-                    "change": change,
-                    "rsi": rsi,
-                    "vwap": vwap,
-                    "dev": dev,
-                    "is_sweep": is_sweep,
-                    "volume": last_v,
-                    "vol_ma": vol_ma,
-                    "vol_std": vol_std,
-                    "is_abnormal_volume": is_abnormal_volume,
-                    "is_extreme_volume": is_extreme_volume,
-                }
-                time.sleep(0.01)
+                if use_stream:
+                    candles = self.candle_cache.candles(inst_id, include_open=False)
+                else:
+                    candles = hub_candles.get(inst_id) or self._fetch_candles(inst_id)
             except Exception as exc:
                 logger.debug(f"OKX candle fetch failed for {symbol}: {exc}")
                 continue
+            if not candles or len(candles) < OKX_LOOKBACK:
+                logger.debug(f"Not enough candles for {symbol}: {len(candles) if candles else 0}")
+                continue
+            candles_by_symbol[symbol] = candles
+
+        # Indicators for the whole universe in one vectorized pass
+        data = market_snapshot(candles_by_symbol, OKX_LOOKBACK)
+
+        # Check if trade should be closed
+        for symbol, snapshot in data.items():
+            if symbol in self.trade_tracker.active_trades:
+                self.trade_tracker.update_trade_status(symbol, "ACTIVE", snapshot["price"])
 
         return data
 
@@ -961,7 +936,7 @@ def send_discord_alert(
         }
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 DISCORD_WEBHOOK_URL,
                 json=payload,
                 headers={"Content-Type": "application/json"},
@@ -1003,7 +978,7 @@ def send_discord_alert(
 class ShortHunterBot:
     def __init__(self):
         self.running = True
-        self.assets = load_okx_perps()
+        self.assets = load_okx_perps(on_refresh=self._on_assets_refreshed)
         if len(self.assets) < 100:
             logger.warning(
                 f"⚠️  OKX perps load returned {len(self.assets)} symbols. Falling back to defaults."
@@ -1016,15 +991,58 @@ class ShortHunterBot:
         self.trades_this_hour = 0
         self.current_hour = datetime.now().hour
         self.last_scan_time = 0  # Timestamp of last successful scan
+        self.stream = None
+        self.last_stream_bar = None
+        if INGESTION_MODE == "stream":
+            self._start_stream()
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
         signal.signal(signal.SIGINT, self._signal_handler)
         logger.info("🚀 Short Hunter Bot initialized")
 
+    def _on_assets_refreshed(self, assets: List[Dict[str, str]]):
+        """Swap in the revalidated perp list (called from the cache refresh thread)"""
+        if len(assets) < 100:
+            return
+        self.assets = assets
+        if getattr(self, "engine", None):
+            self.engine.assets = assets
+        logger.info(f"🔄 OKX perp list refreshed: {len(assets)} symbols")
+
+    def _start_stream(self):
+        """Switch to WebSocket ingestion, falling back to REST polling if unavailable"""
+        if not stream_available():
+            logger.warning("⚠️ websocket-client not installed, using REST polling")
+            return
+        inst_ids = [i for i in (_symbol_to_okx_inst(a["s"]) for a in self.assets) if i]
+        self.stream = OKXCandleStream(
+            inst_ids, self.engine.candle_cache, seed=self.engine._fetch_candles
+        )
+        self.stream.start()
+        bar_seconds = self.engine.candle_cache.bar_ms / 1000
+        self.last_stream_bar = int(time.time() // bar_seconds)
+        logger.info(f"📡 Streaming {len(inst_ids)} OKX perps - scanning on every 15m close")
+
+    def _stream_bar_due(self) -> bool:
+        """True once per bar, a few seconds after it closes"""
+        bar_seconds = self.engine.candle_cache.bar_ms / 1000
+        now = time.time()
+        bar_index = int(now // bar_seconds)
+        if bar_index == self.last_stream_bar:
+            return False
+        if now - bar_index * bar_seconds < STREAM_BAR_SETTLE_SECONDS:
+            return False
+        self.last_stream_bar = bar_index
+        if not self.stream.is_healthy():
+            logger.warning("⚠️ Some candle stream connections are down, scanning with cached data")
+        return True
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals gracefully"""
         logger.info(f"🛑 Received signal {signum}. Shutting down gracefully...")
         self.running = False
+        if self.stream:
+            self.stream.stop()
 
     def reset_hourly_limits(self):
         """Reset trade limits on new hour"""
@@ -1037,7 +1055,9 @@ class ShortHunterBot:
             )
 
     def should_scan(self) -> bool:
-        """Check if it's time to scan based on SCAN_INTERVAL"""
+        """Check if it's time to scan based on SCAN_INTERVAL (or bar close when streaming)"""
+        if self.stream:
+            return self._stream_bar_due()
         current_time = time.time()
         # Initial scan or enough time has passed
         should = (current_time - self.last_scan_time) >= (SCAN_INTERVAL * 60)
@@ -1076,7 +1096,7 @@ class ShortHunterBot:
         # #endregion
 
         # Update market data
-        market_data_cache = self.engine.tick()
+        market_data_cache = self.engine.tick(use_stream=self.stream is not None)
         # #region agent log
         _debug_log(
             "H2",
@@ -1176,7 +1196,10 @@ class ShortHunterBot:
     def run(self):
         """Main bot loop"""
         logger.info("🎯 Short Hunter Bot started!")
-        logger.info(f"📅 Scan schedule: Every {SCAN_INTERVAL} minutes")
+        if self.stream:
+            logger.info("📅 Scan schedule: Every 15m bar close (WebSocket stream)")
+        else:
+            logger.info(f"📅 Scan schedule: Every {SCAN_INTERVAL} minutes")
         sample = ", ".join([a["s"] for a in self.assets[:15]])
         logger.info(f"📊 Monitoring {len(self.assets)} OKX perps (sample: {sample})")
         logger.info(f"🔔 Discord webhook: Configured")
@@ -16,6 +16,13 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared import http_client
+from shared.rate_limiter import get_rate_limiter
+from shared.ta import market_snapshot
+
+from market_data_hub import HubClient
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
@@ -27,6 +34,7 @@ OKX_INST_TYPE = "SWAP"
 OKX_SETTLE = "USDT"
 OKX_CANDLE_BAR = "15m"
 OKX_CANDLE_LIMIT = 100
+RATE_LIMITER = get_rate_limiter()  # Shared token buckets for every OKX call
 OKX_LOOKBACK = 96  # ~24h of 15m candles
 
 # Global market data cache
@@ -78,14 +86,17 @@ class MarketDataFetcher:
 
     def __init__(self, assets: List[Dict]):
         self.assets = assets
-        self.session = requests.Session()
+        self.session = http_client.get_session()
+        self.hub = HubClient()
 
     def _fetch_candles(self, inst_id: str, retries: int = 3) -> List[List[float]]:
         """Fetch candles with retry logic for network resilience"""
         for attempt in range(retries):
             try:
                 params = {"instId": inst_id, "bar": OKX_CANDLE_BAR, "limit": OKX_CANDLE_LIMIT}
+                RATE_LIMITER.acquire("okx", "candles")
                 resp = self.session.get(OKX_CANDLES_URL, params=params, timeout=15)
+                RATE_LIMITER.observe_response("okx", "candles", resp)
                 resp.raise_for_status()
                 payload = resp.json()
                 data = payload.get("data", [])
@@ -118,8 +129,12 @@ class MarketDataFetcher:
 
     def tick(self) -> Dict[str, Dict]:
         """Fetch real OKX 15m candles and build market snapshot"""
-        data: Dict[str, Dict] = {}
+        # Candles shared by the fleet's market data hub; anything it can't serve is fetched from OKX
+        hub_candles = self.hub.fetch_candles(
+            [i for i in (_symbol_to_okx_inst(asset["s"]) for asset in self.assets) if i]
+        )
 
+        candles_by_symbol: Dict[str, List[List[float]]] = {}
         for asset in self.assets:
             symbol = asset["s"]
             inst_id = _symbol_to_okx_inst(symbol)
@@ -127,70 +142,17 @@ class MarketDataFetcher:
                 continue
 
             try:
-                candles = self._fetch_candles(inst_id)
-                if not candles or len(candles) < OKX_LOOKBACK:
-                    logger.debug(f"Not enough candles for {symbol}: {len(candles) if candles else 0}")
-                    continue
-
-                lookback = candles[-OKX_LOOKBACK:] if len(candles) >= OKX_LOOKBACK else candles
-                highs = [c[1] for c in lookback]
-                lows = [c[2] for c in lookback]
-                closes = [c[3] for c in lookback]
-                vols = [c[4] for c in lookback]
-                last_o, last_h, last_l, last_c, last_v = candles[-1]
-
-                high = max(highs)
-                low = min(lows)
-                change = ((last_c - low) / low) * 100 if low > 0 else 0.0
-
-                # VWAP approximation
-                typicals = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
-                vol_sum = sum(vols)
-                vwap = sum(t * v for t, v in zip(typicals, vols)) / vol_sum if vol_sum > 0 else last_c
-
-                # Deviation (std dev of closes)
-                mean_close = sum(closes) / len(closes)
-                variance = sum((c - mean_close) ** 2 for c in closes) / len(closes)
-                std_dev = variance ** 0.5 if variance > 0 else 1.0
-                dev = round((last_c - vwap) / std_dev, 2) if std_dev > 0 else 0.0
-
-                # RSI
-                rsi = _compute_rsi(closes, 14)
-
-                # Liquidity sweep (break + reject)
-                prev_high = max([c[1] for c in candles[-21:-1]]) if len(candles) > 21 else high
-                is_sweep = last_h > prev_high and last_c < prev_high
-
-                # Volume spikes (20-period MA + std dev)
-                vol_slice = vols[-20:] if len(vols) >= 20 else vols
-                vol_ma = sum(vol_slice) / len(vol_slice)
-                vol_var = sum((v - vol_ma) ** 2 for v in vol_slice) / len(vol_slice)
-                vol_std = vol_var ** 0.5
-                dynamic_threshold = vol_ma + vol_std * 2.0
-                extreme_threshold = vol_ma + vol_std * 3.5
-                is_abnormal_volume = last_v > dynamic_threshold
-                is_extreme_volume = last_v > extreme_threshold
-
-                data[symbol] = {
-                    "price": last_c,
-                    "high": high,
-                    "low": low,
-                    "change": change,
-                    "rsi": rsi,
-                    "vwap": vwap,
-                    "dev": dev,
-                    "is_sweep": is_sweep,
-                    "volume": last_v,
-                    "vol_ma": vol_ma,
-                    "vol_std": vol_std,
-                    "is_abnormal_volume": is_abnormal_volume,
-                    "is_extreme_volume": is_extreme_volume,
-                }
-                time.sleep(0.01)
+                candles = hub_candles.get(inst_id) or self._fetch_candles(inst_id)
             except Exception as exc:
                 logger.debug(f"OKX candle fetch failed for {symbol}: {exc}")
                 continue
+            if not candles or len(candles) < OKX_LOOKBACK:
+                logger.debug(f"Not enough candles for {symbol}: {len(candles) if candles else 0}")
+                continue
+            candles_by_symbol[symbol] = candles
 
+        # Indicators for the whole universe in one vectorized pass
+        data = market_snapshot(candles_by_symbol, OKX_LOOKBACK, wilder=True)
         return data
 
 
@@ -272,32 +234,6 @@ def _symbol_to_okx_inst(symbol: str) -> Optional[str]:
     return f"{base}-USDT-SWAP"
 
 
-def _compute_rsi(closes: List[float], period: int = 14) -> float:
-    """Compute RSI from closing prices"""
-    if len(closes) < period + 1:
-        return 50.0
-
-    gains = []
-    losses = []
-
-    for i in range(1, len(closes)):
-        change = closes[i] - closes[i - 1]
-        gains.append(max(0, change))
-        losses.append(max(0, -change))
-
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
-
-    for i in range(period, len(gains)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100.0 - (100.0 / (1.0 + rs))
-
-
 # ==========================================
 # DISCORD ALERTS
 # ==========================================
@@ -351,7 +287,7 @@ def send_discord_alert(signals: List[Signal]) -> int:
     }
 
     try:
-        resp = requests.post(DISCORD_WEBHOOK_URL, json=payload, timeout=10)
+        resp = http_client.post(DISCORD_WEBHOOK_URL, json=payload, timeout=10)
         resp.raise_for_status()
         logger.info(f"✅ Discord alert sent for {len(signals)} signal(s)")
         return len(signals)
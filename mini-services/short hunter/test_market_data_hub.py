@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for MarketDataHub refresh timing and shared in-flight fetches (no network).
+
+    python -m pytest "mini-services/short hunter/test_market_data_hub.py"
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import candle_cache
+import market_data_hub
+from market_data_hub import MarketDataHub
+from shared.rate_limiter import RateLimiter
+
+BAR_MS = 900_000
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"code": "0", "data": self.rows}
+
+
+class FakeSession:
+    """OKX candles endpoint: the newest `limit` bars up to the forming one, newest first"""
+
+    def __init__(self, now_ms, gate=None):
+        self.now_ms = now_ms
+        self.gate = gate
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params, timeout):
+        with self.lock:
+            self.calls.append(params["instId"])
+        if self.gate:
+            self.gate.wait(5)
+        forming = self.now_ms - self.now_ms % BAR_MS
+        rows = []
+        for i in range(int(params["limit"])):
+            ts = forming - i * BAR_MS
+            rows.append([str(ts), "1", "2", "0.5", "1.5", "10", "0", "0", "0" if i == 0 else "1"])
+        return FakeResponse(rows)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": 1_700_000_100.0}
+    fake_time = SimpleNamespace(time=lambda: now["t"], sleep=time.sleep)
+    monkeypatch.setattr(market_data_hub, "time", fake_time)
+    monkeypatch.setattr(candle_cache, "time", fake_time)
+    return now
+
+
+def make_hub(session):
+    hub = MarketDataHub()
+    hub.session = session
+    hub.rate_limiter = RateLimiter()  # Fresh buckets, not the process-wide limiter
+    return hub
+
+
+def test_refreshes_only_on_bar_rollover(clock):
+    session = FakeSession(int(clock["t"] * 1000))
+    hub = make_hub(session)
+    assert hub.get_candles(["BTC-USDT-SWAP"])["BTC-USDT-SWAP"]
+    assert len(session.calls) == 1
+
+    clock["t"] += 600  # Later in the same bar: served from cache
+    hub.get_candles(["BTC-USDT-SWAP"])
+    assert len(session.calls) == 1
+
+    clock["t"] += 400  # Next bar opened
+    session.now_ms = int(clock["t"] * 1000)
+    hub.get_candles(["BTC-USDT-SWAP"])
+    assert len(session.calls) == 2
+    hub.close()
+
+
+def test_unconfirmed_close_is_retried_after_a_pause(clock):
+    session = FakeSession(int(clock["t"] * 1000))
+    hub = make_hub(session)
+    hub.get_candles(["ETH-USDT-SWAP"])
+
+    clock["t"] += 900  # Rolled over, but OKX still reports the old bar as forming
+    hub.get_candles(["ETH-USDT-SWAP"])
+    hub.get_candles(["ETH-USDT-SWAP"])
+    assert len(session.calls) == 2
+
+    clock["t"] += market_data_hub.HUB_CONFIRM_RETRY_SECONDS
+    session.now_ms = int(clock["t"] * 1000)
+    hub.get_candles(["ETH-USDT-SWAP"])
+    hub.get_candles(["ETH-USDT-SWAP"])
+    assert len(session.calls) == 3
+    hub.close()
+
+
+def test_concurrent_callers_share_one_fetch(clock):
+    gate = threading.Event()
+    session = FakeSession(int(clock["t"] * 1000), gate)
+    hub = make_hub(session)
+    inst_ids = ["BTC-USDT-SWAP", "ETH-USDT-SWAP", "SOL-USDT-SWAP"]
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(hub.get_candles, inst_ids) for _ in range(5)]
+        deadline = time.monotonic() + 5
+        while len(session.calls) < len(inst_ids) and time.monotonic() < deadline:
+            gate.wait(0.01)  # All three instruments fetching at once, not one after another
+        assert sorted(session.calls) == sorted(inst_ids)
+        gate.set()
+        results = [future.result() for future in futures]
+    assert sorted(session.calls) == sorted(inst_ids)
+    assert all(sorted(result) == sorted(inst_ids) for result in results)
+    hub.close()
@@ -11,10 +11,13 @@ import logging
 import os
 import sys
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Optional, Any, Tuple
 import websockets
 import aiohttp
-import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from shared.ring_buffer import RingBuffer
+from shared.ta.streaming import RollingExtrema, RollingVariance, RunningVWAP
 
 # Configure logging
 logging.basicConfig(
@@ -43,9 +46,11 @@ SYMBOLS = [
     "DOGEUSDT",
 ]
 
-# Scan timer settings (from your Pine Script)
-SCAN_INTERVAL_MINUTES = 15  # Scan every 15 minutes like your bots
+# Every ticker message is evaluated; the cooldown keeps signals from repeating
 SIGNAL_COOLDOWN_MINUTES = 15  # Min time between signals per symbol
+GP_WINDOW = 20  # Samples in the Golden Pocket swing range
+VWAP_PERIOD = 100  # Samples in the Tactical Deviation VWAP / std window
+HISTORY_SIZE = 200  # Ticks kept per symbol
 
 
 class GPZone:
@@ -56,16 +61,22 @@ class GPZone:
         self.daily_low = {}
         self.weekly_high = {}
         self.weekly_low = {}
+        self.ranges: Dict[str, RollingExtrema] = {}
+
+    def update(self, symbol: str, price: float):
+        """Feed one price into the symbol's rolling high / low"""
+        if symbol not in self.ranges:
+            self.ranges[symbol] = RollingExtrema(GP_WINDOW)
+        self.ranges[symbol].update(price)
 
-    def calculate_gp_zones(
-        self, symbol: str, prices: List[float]
-    ) -> Dict[str, Tuple[float, float]]:
+    def calculate_gp_zones(self, symbol: str) -> Dict[str, Tuple[float, float]]:
         """Calculate Golden Pocket zones (61.8% - 65% Fibonacci)"""
-        if len(prices) < 20:
+        window = self.ranges.get(symbol)
+        if window is None or len(window) < GP_WINDOW:
             return {}
 
-        high = max(prices[-20:])
-        low = min(prices[-20:])
+        high = window.high
+        low = window.low
         range_size = high - low
 
         # Golden Pocket: 61.8% to 65% retracement
@@ -91,28 +102,31 @@ class TacticalDeviation:
     """Tactical Deviation indicator"""
 
     def __init__(self):
-        self.vwap_period = 100
+        self.vwap_period = VWAP_PERIOD
         self.deviation_multipliers = [1.0, 2.0, 3.0]  # 1σ, 2σ, 3σ
-
-    def calculate(self, prices: List[float], volumes: List[float]) -> Dict[str, Any]:
+        self.vwaps: Dict[str, RunningVWAP] = {}
+        self.variances: Dict[str, RollingVariance] = {}
+
+    def update(self, symbol: str, price: float, volume: float):
+        """Feed one tick into the symbol's running VWAP and variance"""
+        if symbol not in self.vwaps:
+            self.vwaps[symbol] = RunningVWAP(self.vwap_period)
+            self.variances[symbol] = RollingVariance(self.vwap_period)
+        self.vwaps[symbol].update(price, volume)
+        self.variances[symbol].update(price)
+
+    def calculate(self, symbol: str, current_price: float) -> Dict[str, Any]:
         """Calculate VWAP and deviation bands"""
-        if len(prices) < 20 or len(volumes) < 20:
+        running_vwap = self.vwaps.get(symbol)
+        if running_vwap is None or len(running_vwap) < 20:
             return {"vwap": 0, "std_dev": 0, "deviation": 0}
 
-        # Use last 100 candles for VWAP
-        prices_arr = np.array(prices[-self.vwap_period :], dtype=float)
-        volumes_arr = np.array(volumes[-self.vwap_period :], dtype=float)
+        vwap = running_vwap.value
 
-        if volumes_arr.sum() == 0:
-            vwap = float(prices_arr.mean())
-        else:
-            vwap = float(np.average(prices_arr, weights=volumes_arr))
-
-        # Calculate standard deviation
-        std_dev = float(np.std(prices_arr - vwap))
+        # Std of (price - vwap) over the window is the std of the prices themselves
+        std_dev = self.variances[symbol].std
 
         # Current deviation
-        current_price = prices[-1]
         deviation = (current_price - vwap) / std_dev if std_dev > 0 else 0
 
         return {
@@ -134,19 +148,14 @@ class TacticalDeviation:
 class SignalStreamer:
     def __init__(self):
         self.ws = None
-        self.price_history: Dict[str, List[float]] = {}
-        self.volume_history: Dict[str, List[float]] = {}
-        self.last_scan_time: Dict[str, datetime] = {}
+        self.price_history: Dict[str, RingBuffer] = {}
+        self.volume_history: Dict[str, RingBuffer] = {}
         self.last_signal_time: Dict[str, datetime] = {}
-        self.candle_data: Dict[str, List[Dict]] = {}
 
         # Indicators
         self.gp_indicator = GPZone()
         self.deviation_indicator = TacticalDeviation()
 
-        # Scan timer
-        self.next_scan_time = datetime.now()
-
     async def connect_binance(self):
         """Connect to Binance WebSocket"""
         try:
@@ -157,14 +166,12 @@ class SignalStreamer:
             logger.info(f"✅ Connected to Binance WebSocket")
 
             for symbol in SYMBOLS:
-                self.price_history[symbol] = []
-                self.volume_history[symbol] = []
-                self.candle_data[symbol] = []
-                self.last_scan_time[symbol] = datetime.min
+                self.price_history[symbol] = RingBuffer(HISTORY_SIZE)
+                self.volume_history[symbol] = RingBuffer(HISTORY_SIZE)
                 self.last_signal_time[symbol] = datetime.min
 
             logger.info(f"📡 Monitoring {len(SYMBOLS)} symbols")
-            logger.info(f"⏱️  Scan interval: {SCAN_INTERVAL_MINUTES} minutes")
+            logger.info(f"⏱️  Evaluating on every message ({SIGNAL_COOLDOWN_MINUTES}m signal cooldown)")
 
         except Exception as e:
             logger.error(f"❌ Failed to connect: {e}")
@@ -191,17 +198,6 @@ class SignalStreamer:
             logger.error(f"❌ Error: {e}")
             return False
 
-    def check_scan_timer(self, symbol: str) -> bool:
-        """Check if enough time has passed since last scan"""
-        now = datetime.now()
-        last_scan = self.last_scan_time.get(symbol, datetime.min)
-        time_diff = (now - last_scan).total_seconds() / 60  # minutes
-
-        if time_diff >= SCAN_INTERVAL_MINUTES:
-            self.last_scan_time[symbol] = now
-            return True
-        return False
-
     def check_signal_cooldown(self, symbol: str) -> bool:
         """Check cooldown between signals"""
         now = datetime.now()
@@ -357,27 +353,23 @@ class SignalStreamer:
         return signal
 
     async def process_symbol_scan(self, symbol: str):
-        """Run scan for a single symbol"""
-
-        # Check scan timer
-        if not self.check_scan_timer(symbol):
-            return
+        """Evaluate a single symbol against the latest tick"""
 
         # Check signal cooldown
         if not self.check_signal_cooldown(symbol):
             return
 
-        prices = self.price_history.get(symbol, [])
-        volumes = self.volume_history.get(symbol, [])
+        prices = self.price_history.get(symbol)
+        volumes = self.volume_history.get(symbol)
 
-        if len(prices) < 50 or len(volumes) < 50:
+        if prices is None or len(prices) < 50 or len(volumes) < 50:
             return
 
-        # Calculate Tactical Deviation
-        deviation_data = self.deviation_indicator.calculate(prices, volumes)
+        # Tactical Deviation (running VWAP / variance, O(1) per tick)
+        deviation_data = self.deviation_indicator.calculate(symbol, float(prices[-1]))
 
-        # Calculate Golden Pocket zones
-        gp_zones = self.gp_indicator.calculate_gp_zones(symbol, prices)
+        # Golden Pocket zones (rolling high / low)
+        gp_zones = self.gp_indicator.calculate_gp_zones(symbol)
 
         # Generate signal using BOTH indicators
         signal = self.generate_signal(symbol, deviation_data, gp_zones)
@@ -406,16 +398,14 @@ class SignalStreamer:
             if current_price <= 0:
                 return
 
-            # Update price history
+            # Update price history (fixed-size ring buffers, oldest sample overwritten)
             self.price_history[symbol].append(current_price)
             self.volume_history[symbol].append(volume)
 
-            if len(self.price_history[symbol]) > 200:
-                self.price_history[symbol].pop(0)
-            if len(self.volume_history[symbol]) > 200:
-                self.volume_history[symbol].pop(0)
+            # Incremental indicator updates
+            self.deviation_indicator.update(symbol, current_price, volume)
+            self.gp_indicator.update(symbol, current_price)
 
-            # Run scan if timer allows
             await self.process_symbol_scan(symbol)
 
         except Exception as e:
@@ -448,7 +438,7 @@ async def main():
     logger.info("=" * 60)
     logger.info("🚀 SRUS Signal Streamer Starting...")
     logger.info("📊 Indicators: Tactical Deviation + GPS Pro")
-    logger.info(f"⏱️  Scan Timer: Every {SCAN_INTERVAL_MINUTES} minutes")
+    logger.info(f"⏱️  Evaluation: every ticker message ({SIGNAL_COOLDOWN_MINUTES}m cooldown)")
     logger.info(f"🎯 Min Score: 55/100")
     logger.info("=" * 60)
 
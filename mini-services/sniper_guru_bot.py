@@ -2,7 +2,8 @@ import json
 import time
 import os
 import datetime
-import requests
+
+from shared import http_client
 
 # Configuration
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'public', 'data')
@@ -41,7 +42,7 @@ def get_current_prices(symbols):
     prices = {}
     try:
         url = "https://api.binance.com/api/v3/ticker/price"
-        response = requests.get(url, timeout=5)
+        response = http_client.get(url, timeout=5)
         if response.status_code == 200:
             data = response.json()
             market_map = {item['symbol']: float(item['price']) for item in data}
@@ -25,6 +25,7 @@ let state = {
 // ========== WEBHOOK ENDPOINT (Bots send here) ==========
 app.post('/webhook', (req, res) => {
     const { source, data } = req.body;
+    let delta = null; // Set when only part of the state changed
 
     console.log(`📡 Webhook received from: ${source}`);
     console.log('📦 Data structure:', JSON.stringify(data, null, 2).substring(0, 500));
@@ -53,8 +54,15 @@ app.post('/webhook', (req, res) => {
         }
     } else if (source === 'bounty_seeker') {
         // Bounty seeker sends { type: "bounty_seeker_update", payload: {...} }
-        // Extract the actual data from payload
-        if (data.payload) {
+        // Extract the actual data from payload; deltas carry only the sections that changed
+        if (data.payload && data.delta) {
+            state.bountySeeker = {
+                ...state.bountySeeker,
+                ...data.payload,
+                lastUpdated: new Date().toISOString()
+            };
+            delta = { bountySeeker: { ...data.payload, lastUpdated: state.bountySeeker.lastUpdated } };
+        } else if (data.payload) {
             state.bountySeeker = {
                 status: 'ACTIVE',
                 ...data.payload,
@@ -71,8 +79,12 @@ app.post('/webhook', (req, res) => {
 
     state.lastUpdated = new Date().toISOString();
 
-    // Broadcast full state update to all clients
-    io.emit('state-update', state);
+    // Broadcast to all clients: just the changed sections for a delta, else the full state
+    if (delta) {
+        io.emit('state-delta', { ...delta, lastUpdated: state.lastUpdated });
+    } else {
+        io.emit('state-update', state);
+    }
 
     res.status(200).json({ status: 'ok' });
 });
@@ -81,7 +93,7 @@ app.post('/webhook', (req, res) => {
 io.on('connection', (socket) => {
     console.log('📱 Client connected:', socket.id);
 
-    // Send immediate state on connection
+    // Send immediate state on connection (later 'state-delta' events merge into it per source)
     socket.emit('state-update', state);
 
     socket.on('disconnect', () => {